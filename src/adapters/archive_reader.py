@@ -0,0 +1,58 @@
+import gzip
+from pathlib import Path
+
+import numpy as np
+
+from src.adapters.element_formats import read_elements
+
+# Element set format of each archive file suffix.
+ARCHIVE_FORMATS = {
+    ".json": "json",
+    ".csv": "csv",
+    ".tle": "tle",
+    ".3le": "tle",
+    ".txt": "tle",
+}
+ARCHIVE_SUFFIXES = set(ARCHIVE_FORMATS)
+
+
+def find_archive_files(directory: Path) -> list[Path]:
+    """
+    Finds archived OMM/TLE files in a directory tree.
+    Gzip compressed files (e.g. "2024-01.json.gz") are included.
+
+    Args:
+        directory (Path): Root directory of the archive.
+
+    Returns:
+        list[Path]: Sorted list of archive file paths.
+    """
+    return sorted(
+        path
+        for path in Path(directory).rglob("*")
+        if path.is_file() and _archive_suffix(path) in ARCHIVE_SUFFIXES
+    )
+
+
+def read_archive_elements(path: Path) -> np.ndarray:
+    """
+    Reads an archived OMM JSON, OMM CSV or TLE file into an element set array.
+    Gzip compressed files are decompressed.
+
+    Args:
+        path (Path): Path to the archive file.
+
+    Returns:
+        np.ndarray: Structured array with ELEMENT_DTYPES fields.
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        return read_elements(file.read(), ARCHIVE_FORMATS[_archive_suffix(path)])
+
+
+def _archive_suffix(path: Path) -> str:
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
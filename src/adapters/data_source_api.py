@@ -1,14 +1,19 @@
 import logging
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-import pandas as pd
-import requests
+import numpy as np
 from sgp4 import omm
 from sgp4.api import Satrec, jday
 
+from src.adapters.element_formats import read_elements
 from src.tracker.models.satellite import SatelliteCreate
 from src.tracker.models.space_object import SpaceObjectCreate
 from src.tracker.models.vector3d import Vector3DCreate
+from src.tracker.propagation import propagate_to_epoch, satrecs_from_records
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def get_satellite_data() -> list[dict]:
@@ -20,6 +25,8 @@ def get_satellite_data() -> list[dict]:
     Returns:
         list[SpaceObject]: Retrieved list of SpaceObject instances.
     """
+    import requests
+
     logging.info("Retrieving satellite data from Celestrak...")
     response = requests.get(
         "https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=json"
@@ -35,6 +42,51 @@ def get_satellite_data() -> list[dict]:
     return json
 
 
+def get_element_sets(format: str = "csv") -> np.ndarray:
+    """
+    Gets active satellite element sets from Celestrak in the given format and
+    parses them straight into an element set array, without OMM dictionaries.
+
+    Args:
+        format (str): Celestrak format, a key of FORMAT_READERS ("csv", "tle", "json").
+
+    Returns:
+        np.ndarray: Structured array with ELEMENT_DTYPES fields.
+    """
+    import requests
+
+    logging.info("Retrieving %s element sets from Celestrak...", format.upper())
+    response = requests.get(
+        "https://celestrak.org/NORAD/elements/gp.php",
+        params={"GROUP": "active", "FORMAT": format},
+    )
+    if not response.ok:
+        logging.warning(
+            "Celestrak data retrieval error. Status code: %s", response.status_code
+        )
+    response.raise_for_status()
+    logging.info("Celestrak data retrieved successfully.")
+
+    return read_elements(response.text, format)
+
+
+def extract_states(elements: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates positions and velocities of element sets at their epochs using SGP4.
+
+    Args:
+        elements (np.ndarray): Structured array with ELEMENT_DTYPES fields.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Positions in km and velocities in km/s (N, 3).
+    """
+    logging.info("Calculating space object states.")
+    errors, positions, velocities = propagate_to_epoch(satrecs_from_records(elements))
+    if errors.any():
+        raise RuntimeError(f"SGP4 propagation error code: {errors[errors != 0][0]}")
+    return positions, velocities
+
+
 def extract_satellite_data(data: list[dict]) -> list[SatelliteCreate]:
     """
     Extracts satellite data from the provided dictionary and returns a list of Satellite instances.
@@ -83,7 +135,7 @@ def extract_space_object_data(data: list[dict]) -> list[SpaceObjectCreate]:
     return spaceObjects
 
 
-def space_object_to_df(space_objects: list[SpaceObjectCreate]) -> pd.DataFrame:
+def space_object_to_df(space_objects: list[SpaceObjectCreate]) -> "pd.DataFrame":
     """
     Converts space_objects list to DataFrame.
 
@@ -93,6 +145,8 @@ def space_object_to_df(space_objects: list[SpaceObjectCreate]) -> pd.DataFrame:
     Returns:
         DataFrame: Pandas DataFrame.
     """
+    import pandas as pd
+
     logging.info("Extracting DataFrame from space objects data.")
     return pd.DataFrame(
         [
@@ -113,6 +167,35 @@ def space_object_to_df(space_objects: list[SpaceObjectCreate]) -> pd.DataFrame:
     )
 
 
+def states_to_df(
+    elements: np.ndarray, positions: np.ndarray, velocities: np.ndarray
+) -> "pd.DataFrame":
+    """
+    Converts element sets and their states to a DataFrame with the columns of
+    space_object_to_df.
+
+    Args:
+        elements (np.ndarray): Structured array with ELEMENT_DTYPES fields.
+        positions (np.ndarray): Positions in km (N, 3).
+        velocities (np.ndarray): Velocities in km/s (N, 3).
+
+    Returns:
+        DataFrame: Pandas DataFrame.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "id": elements["norad_cat_id"],
+            "name": elements["object_name"],
+            "epoch": elements["epoch"],
+            **{f"pos_{axis}": positions[:, i] for i, axis in enumerate("xyz")},
+            **{f"vel_{axis}": velocities[:, i] for i, axis in enumerate("xyz")},
+            "source": "CELESTRAK",
+        }
+    )
+
+
 def _to_space_object(data: dict) -> SpaceObjectCreate:
     return SpaceObjectCreate(
         id=data["NORAD_CAT_ID"],
@@ -0,0 +1,263 @@
+import gzip
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import ColumnElement, and_, delete, func, select, text
+from sqlalchemy.orm import Session, aliased
+
+from src.adapters.database_storage import (
+    BULK_BATCH_SIZE,
+    is_postgresql,
+    record_ingest_run,
+)
+from src.tracker.schema.base_model import Base
+from src.tracker.schema.partitioning import default_partition_name
+from src.tracker.schema.satellite import Satellite
+from src.tracker.schema.space_object import SpaceObject
+from src.tracker.schema.vector3_d_model import Vector3D
+
+PARTITIONED_TABLES = (Satellite.__tablename__, SpaceObject.__tablename__)
+
+
+def month_start(when: datetime) -> datetime:
+    """
+    Returns the first instant (UTC) of the month containing the given time.
+    """
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    when = when.astimezone(timezone.utc)
+    return when.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(when: datetime, months: int) -> datetime:
+    """
+    Adds months to a month start.
+    """
+    month = when.month - 1 + months
+    return when.replace(year=when.year + month // 12, month=month % 12 + 1)
+
+
+def partition_name(table_name: str, month: datetime) -> str:
+    """
+    Returns the name of the monthly partition of a table, e.g. "satellite_p2024_01".
+    """
+    return f"{table_name}_p{month.year:04d}_{month.month:02d}"
+
+
+def ensure_partitions(db: Session, start: datetime, end: datetime) -> list[str]:
+    """
+    Creates monthly epoch partitions of the history tables covering [start, end).
+    Months with rows in the DEFAULT partition are partitioned too, their rows are
+    moved to the new partition. No-op on databases other than PostgreSQL.
+
+    Args:
+        db: SQLAlchemy session.
+        start: Start of the covered range.
+        end: End of the covered range.
+
+    Returns:
+        list[str]: Names of the created partitions.
+    """
+    if not is_postgresql(db):
+        return []
+
+    created = []
+    for table_name in PARTITIONED_TABLES:
+        default_name = default_partition_name(table_name)
+        oldest = db.scalar(text(f"SELECT min(epoch) FROM {default_name}"))
+        newest = db.scalar(text(f"SELECT max(epoch) FROM {default_name}"))
+        existing = set(_partitions(db, table_name))
+
+        month = month_start(min(start, oldest) if oldest else start)
+        last = max(end, add_months(month_start(newest), 1)) if newest else end
+        while month < last:
+            upper = add_months(month, 1)
+            name = partition_name(table_name, month)
+            if name not in existing:
+                _create_partition(db, table_name, name, month, upper)
+                created.append(name)
+            month = upper
+    db.commit()
+    if created:
+        logging.info("Created partitions: %s", ", ".join(created))
+    return created
+
+
+def downsample_history(db: Session, before: datetime) -> int:
+    """
+    Downsamples history older than the given time to the latest element set
+    per object per day. Vectors of deleted space objects are deleted as well.
+    Records a retention run when rows were deleted, advancing the ingest
+    generation.
+
+    Args:
+        db: SQLAlchemy session.
+        before: Only history with epoch before this time is downsampled.
+
+    Returns:
+        int: Number of deleted satellite and space object rows.
+    """
+    deleted = db.execute(
+        delete(Satellite).where(
+            _superseded_within_day(Satellite, Satellite.norad_cat_id.key, before)
+        )
+    ).rowcount
+
+    superseded = _superseded_within_day(SpaceObject, SpaceObject.id.key, before)
+    vector_ids = [
+        vector_id
+        for ids in db.execute(
+            select(SpaceObject.position_id, SpaceObject.velocity_id).where(superseded)
+        )
+        for vector_id in ids
+    ]
+    deleted += db.execute(delete(SpaceObject).where(superseded)).rowcount
+    for start in range(0, len(vector_ids), BULK_BATCH_SIZE):
+        batch = vector_ids[start : start + BULK_BATCH_SIZE]
+        db.execute(delete(Vector3D).where(Vector3D.id.in_(batch)))
+    if deleted:
+        record_ingest_run(db, "RETENTION", 0)
+    db.commit()
+    logging.info("Downsampled history before %s, %d rows deleted.", before, deleted)
+    return deleted
+
+
+def drop_partitions(
+    db: Session, before: datetime, archive_dir: Optional[Path] = None
+) -> list[str]:
+    """
+    Drops monthly partitions ending before the given time, optionally archiving
+    them first as gzip compressed CSV files. Vectors of dropped space objects are
+    deleted as well. Each drop records a retention run, advancing the ingest
+    generation. No-op on databases other than PostgreSQL.
+
+    Args:
+        db: SQLAlchemy session.
+        before: Partitions with all epochs before this time are dropped.
+        archive_dir: Directory for CSV archives, partitions are not archived if None.
+
+    Returns:
+        list[str]: Names of the dropped partitions.
+    """
+    if not is_postgresql(db):
+        return []
+
+    limit = month_start(before)
+    dropped = []
+    for table_name in PARTITIONED_TABLES:
+        for name in sorted(_partitions(db, table_name)):
+            month = _partition_month(table_name, name)
+            if month is None or add_months(month, 1) > limit:
+                continue
+            if archive_dir is not None:
+                _archive_partition(db, table_name, name, Path(archive_dir))
+            _drop_partition(db, table_name, name)
+            record_ingest_run(db, "RETENTION", 0)
+            db.commit()
+            dropped.append(name)
+    if dropped:
+        logging.info("Dropped partitions: %s", ", ".join(dropped))
+    return dropped
+
+
+def _superseded_within_day(
+    model: type[Base], id_name: str, before: datetime
+) -> ColumnElement[bool]:
+    # A row is superseded when a later row of the same object and day exists.
+    # The correlated EXISTS is an index lookup on the (id, epoch) primary key.
+    later = aliased(model)
+    return and_(
+        model.epoch < before,
+        select(1)
+        .where(
+            getattr(later, id_name) == getattr(model, id_name),
+            later.epoch > model.epoch,
+            later.epoch < before,
+            func.date(later.epoch) == func.date(model.epoch),
+        )
+        .exists(),
+    )
+
+
+def _partitions(db: Session, table_name: str) -> list[str]:
+    return list(
+        db.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE parent.relname = :table_name"
+            ),
+            {"table_name": table_name},
+        )
+    )
+
+
+def _partition_month(table_name: str, name: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(name.removeprefix(f"{table_name}_p"), "%Y_%m").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def _create_partition(
+    db: Session, table_name: str, name: str, lower: datetime, upper: datetime
+):
+    # Rows of the month may already be in the DEFAULT partition, attaching would fail.
+    # They are moved in one statement, so no row committed concurrently is deleted
+    # without being copied, and the lock keeps ingests from adding rows of the
+    # month to the DEFAULT partition until the partition is attached.
+    default_name = default_partition_name(table_name)
+    bounds = f"epoch >= '{lower.isoformat()}' AND epoch < '{upper.isoformat()}'"
+    db.execute(text(f"CREATE TABLE {name} (LIKE {table_name} INCLUDING DEFAULTS)"))
+    db.execute(text(f"LOCK TABLE {default_name} IN EXCLUSIVE MODE"))
+    db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default_name} WHERE {bounds} RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    db.execute(
+        text(
+            f"ALTER TABLE {table_name} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+    )
+
+
+def _archive_partition(db: Session, table_name: str, name: str, archive_dir: Path):
+    query = f"SELECT * FROM {name}"
+    if table_name == SpaceObject.__tablename__:
+        query = (
+            f"SELECT so.*, p.x AS pos_x, p.y AS pos_y, p.z AS pos_z, "
+            f"v.x AS vel_x, v.y AS vel_y, v.z AS vel_z FROM {name} so "
+            f"JOIN vector3d p ON p.id = so.position_id "
+            f"JOIN vector3d v ON v.id = so.velocity_id"
+        )
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    cursor = db.connection().connection.driver_connection.cursor()
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV HEADER", file)
+    logging.info("Archived partition %s to %s.", name, path)
+
+
+def _drop_partition(db: Session, table_name: str, name: str):
+    if table_name == SpaceObject.__tablename__:
+        db.execute(text("CREATE TEMP TABLE dropped_vector (id integer) ON COMMIT DROP"))
+        db.execute(
+            text(
+                f"INSERT INTO dropped_vector SELECT position_id FROM {name} "
+                f"UNION ALL SELECT velocity_id FROM {name}"
+            )
+        )
+    db.execute(text(f"ALTER TABLE {table_name} DETACH PARTITION {name}"))
+    db.execute(text(f"DROP TABLE {name}"))
+    if table_name == SpaceObject.__tablename__:
+        db.execute(
+            text("DELETE FROM vector3d WHERE id IN (SELECT id FROM dropped_vector)")
+        )
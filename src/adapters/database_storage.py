@@ -1,14 +1,53 @@
-from typing import Any, TypeVar
+import csv
+import io
+from datetime import date, datetime, timezone
+from typing import Any, Iterator, Optional, TypeVar
 
-from sqlalchemy import and_
+import numpy as np
+from sqlalchemy import (
+    Integer,
+    and_,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import Mapper, Session, selectinload
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapper,
+    Session,
+    aliased,
+    selectinload,
+)
 
+from src.tracker.models.satellite import SatelliteCreate
+from src.tracker.models.space_object import SpaceObjectCreate
+from src.tracker.models.watchlist import WatchlistCreate
+from src.tracker.schema.conjunction import Conjunction
+from src.tracker.schema.ingest_run import IngestRun
+from src.tracker.schema.orbit_cluster import OrbitClusterCell, OrbitClusterMember
+from src.tracker.schema.population_rollup import PopulationObjectDay, PopulationRollup
 from src.tracker.schema.satellite import Satellite
 from src.tracker.schema.space_object import SpaceObject
+from src.tracker.schema.vector3_d_model import Vector3D
+from src.tracker.schema.watchlist import AlertEvent, Watchlist, WatchlistMember
 
 T = TypeVar("T")
 
+BULK_BATCH_SIZE = 5000
+# Timestamp columns of all tables, set by the client on ORM inserts.
+_TIMESTAMPS = "created_at, updated_at"
+
 
 def save(objects: list[T], db: Session):
     """
@@ -74,6 +113,250 @@ def save_or_skip(objects: list[T], db: Session):
     db.commit()
 
 
+def bulk_save_or_skip_satellites(
+    satellites: list[SatelliteCreate], db: Session, batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """
+    Bulk insert satellites in batches, skipping ones already stored
+    (same norad_cat_id and epoch). Does not commit, the caller owns the transaction.
+
+    Args:
+        satellites: List of satellites to save.
+        db: SQLAlchemy session.
+        batch_size: Number of rows per INSERT statement.
+
+    Returns:
+        int: Number of inserted rows.
+    """
+    inserted = 0
+    for batch in _batched(satellites, batch_size):
+        rows = _unique_by_key(
+            [satellite.model_dump() for satellite in batch],
+            lambda row: _key(row["norad_cat_id"], row["epoch"]),
+        )
+        existing = _existing_keys(
+            db,
+            Satellite.norad_cat_id,
+            Satellite.epoch,
+            [(row["norad_cat_id"], row["epoch"]) for row in rows],
+        )
+        rows = [
+            row
+            for row in rows
+            if _key(row["norad_cat_id"], row["epoch"]) not in existing
+        ]
+        if rows:
+            db.execute(insert(Satellite), rows)
+            inserted += len(rows)
+    return inserted
+
+
+def bulk_save_or_skip_space_objects(
+    space_objects: list[SpaceObjectCreate],
+    db: Session,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """
+    Bulk insert space objects with their position and velocity vectors in batches,
+    skipping ones already stored (same id and epoch).
+    Does not commit, the caller owns the transaction.
+
+    Args:
+        space_objects: List of space objects to save.
+        db: SQLAlchemy session.
+        batch_size: Number of space objects per INSERT statement.
+
+    Returns:
+        int: Number of inserted space objects.
+    """
+    inserted = 0
+    for batch in _batched(space_objects, batch_size):
+        batch = _unique_by_key(batch, lambda obj: _key(obj.id, obj.epoch))
+        existing = _existing_keys(
+            db, SpaceObject.id, SpaceObject.epoch, [(o.id, o.epoch) for o in batch]
+        )
+        batch = [obj for obj in batch if _key(obj.id, obj.epoch) not in existing]
+        if not batch:
+            continue
+
+        vectors = []
+        for obj in batch:
+            vectors.append(obj.position.model_dump(exclude={"id"}))
+            vectors.append(obj.velocity.model_dump(exclude={"id"}))
+        vector_ids = (
+            db.execute(
+                insert(Vector3D).returning(Vector3D.id, sort_by_parameter_order=True),
+                vectors,
+            )
+            .scalars()
+            .all()
+        )
+        db.execute(
+            insert(SpaceObject),
+            [
+                {
+                    "id": obj.id,
+                    "name": obj.name,
+                    "epoch": obj.epoch,
+                    "source": obj.source,
+                    "position_id": vector_ids[2 * i],
+                    "velocity_id": vector_ids[2 * i + 1],
+                }
+                for i, obj in enumerate(batch)
+            ],
+        )
+        inserted += len(batch)
+    return inserted
+
+
+def bulk_save_or_skip_element_sets(
+    elements: np.ndarray, db: Session, batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """
+    Bulk insert parsed element sets as satellites, skipping ones already stored
+    (same norad_cat_id and epoch). On PostgreSQL rows are streamed with COPY into
+    a staging table and merged in one statement, on other databases inserted in
+    batches with executemany. Rows are built from the element columns without
+    Pydantic models. Does not commit.
+
+    Args:
+        elements: Structured array with ELEMENT_DTYPES fields.
+        db: SQLAlchemy session.
+        batch_size: Number of rows per INSERT or COPY statement.
+
+    Returns:
+        int: Number of inserted rows.
+    """
+    if is_postgresql(db):
+        return _copy_element_sets(elements, db, batch_size)
+    inserted = 0
+    for batch in _batched(elements, batch_size):
+        batch = batch[
+            _new_keys(
+                db,
+                batch["norad_cat_id"],
+                batch["epoch"],
+                Satellite.norad_cat_id,
+                Satellite.epoch,
+            )
+        ]
+        if len(batch):
+            db.execute(insert(Satellite), _column_rows(batch))
+            inserted += len(batch)
+    return inserted
+
+
+def bulk_save_or_skip_states(
+    elements: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    source: str,
+    db: Session,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """
+    Bulk insert states propagated from parsed element sets as space objects
+    with their position and velocity vectors, skipping ones already stored
+    (same id and epoch). On PostgreSQL rows are streamed with COPY into a staging
+    table and merged in one statement, on other databases inserted in batches
+    with executemany. Does not commit.
+
+    Args:
+        elements: Structured array with ELEMENT_DTYPES fields.
+        positions: Positions at the element set epochs in km (N, 3).
+        velocities: Velocities at the element set epochs in km/s (N, 3).
+        source: Data source name.
+        db: SQLAlchemy session.
+        batch_size: Number of space objects per INSERT or COPY statement.
+
+    Returns:
+        int: Number of inserted space objects.
+    """
+    if is_postgresql(db):
+        return _copy_states(elements, positions, velocities, source, db, batch_size)
+    inserted = 0
+    rows = np.arange(len(elements))
+    for batch in _batched(rows, batch_size):
+        batch = batch[
+            _new_keys(
+                db,
+                elements["norad_cat_id"][batch],
+                elements["epoch"][batch],
+                SpaceObject.id,
+                SpaceObject.epoch,
+            )
+        ]
+        if not len(batch):
+            continue
+
+        # Position and velocity of each object, interleaved.
+        vectors = np.stack([positions[batch], velocities[batch]], axis=1).reshape(-1, 3)
+        vector_ids = (
+            db.execute(
+                insert(Vector3D).returning(Vector3D.id, sort_by_parameter_order=True),
+                [{"x": x, "y": y, "z": z} for x, y, z in vectors.tolist()],
+            )
+            .scalars()
+            .all()
+        )
+        db.execute(
+            insert(SpaceObject),
+            [
+                {
+                    "id": norad_cat_id,
+                    "name": name,
+                    "epoch": epoch,
+                    "source": source,
+                    "position_id": vector_ids[2 * i],
+                    "velocity_id": vector_ids[2 * i + 1],
+                }
+                for i, (norad_cat_id, name, epoch) in enumerate(
+                    zip(
+                        elements["norad_cat_id"][batch].tolist(),
+                        elements["object_name"][batch].tolist(),
+                        elements["epoch"][batch].tolist(),
+                    )
+                )
+            ],
+        )
+        inserted += len(batch)
+    return inserted
+
+
+def record_ingest_run(db: Session, source: str, inserted: int) -> IngestRun:
+    """
+    Records an ingest run, advancing the ingest generation.
+    Does not commit, should be committed in the same transaction as the ingested data.
+
+    Args:
+        db: SQLAlchemy session.
+        source: Ingest source.
+        inserted: Number of inserted element sets.
+
+    Returns:
+        IngestRun: Recorded ingest run.
+    """
+    ingest_run = IngestRun(source=source, inserted=inserted)
+    db.add(ingest_run)
+    db.flush()
+    return ingest_run
+
+
+def load_ingest_generation(db: Session) -> int:
+    """
+    Load the current ingest generation, the number of committed ingest runs.
+    Unlike the latest id it changes with every commit, also when concurrent
+    runs commit out of id order.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        int: Number of ingest runs, 0 if there was none.
+    """
+    return db.scalar(select(func.count()).select_from(IngestRun)) or 0
+
+
 def load_space_objects(
     db: Session, page: int = 0, limit: int = 100
 ) -> list[SpaceObject]:
@@ -113,3 +396,968 @@ def load_satellites(db: Session, page: int = 0, limit: int = 100) -> list[Satell
     """
     results = db.query(Satellite).offset(page * limit).limit(limit).all()
     return results
+
+
+def load_latest_satellite_rows(db: Session) -> tuple[list[str], list[tuple]]:
+    """
+    Load the latest element set of every satellite as plain rows, without ORM objects.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        tuple[list[str], list[tuple]]: Column names and rows.
+    """
+    latest = _latest_satellite_epochs()
+    columns = [
+        column
+        for column in Satellite.__table__.columns
+        if column.key not in ("created_at", "updated_at")
+    ]
+    result = db.execute(
+        select(*columns)
+        .join(
+            latest,
+            and_(
+                Satellite.norad_cat_id == latest.c.norad_cat_id,
+                Satellite.epoch == latest.c.epoch,
+            ),
+        )
+        .order_by(Satellite.norad_cat_id)
+    )
+    return list(result.keys()), [tuple(row) for row in result]
+
+
+def load_latest_space_object_rows(db: Session) -> tuple[list[str], list[tuple]]:
+    """
+    Load the latest state of every space object with flattened position and
+    velocity as plain rows, without ORM objects.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        tuple[list[str], list[tuple]]: Column names and rows.
+    """
+    latest = (
+        select(SpaceObject.id, func.max(SpaceObject.epoch).label("epoch"))
+        .group_by(SpaceObject.id)
+        .subquery()
+    )
+    position = aliased(Vector3D)
+    velocity = aliased(Vector3D)
+    result = db.execute(
+        select(
+            SpaceObject.id,
+            SpaceObject.name,
+            SpaceObject.epoch,
+            SpaceObject.source,
+            position.x.label("pos_x"),
+            position.y.label("pos_y"),
+            position.z.label("pos_z"),
+            velocity.x.label("vel_x"),
+            velocity.y.label("vel_y"),
+            velocity.z.label("vel_z"),
+        )
+        .join(
+            latest,
+            and_(SpaceObject.id == latest.c.id, SpaceObject.epoch == latest.c.epoch),
+        )
+        .join(position, SpaceObject.position_id == position.id)
+        .join(velocity, SpaceObject.velocity_id == velocity.id)
+        .order_by(SpaceObject.id)
+    )
+    return list(result.keys()), [tuple(row) for row in result]
+
+
+def load_latest_satellites(db: Session, norad_cat_ids: list[int]) -> list[Satellite]:
+    """
+    Load the latest element set of the given satellites.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD catalog IDs.
+
+    Returns:
+        list[Satellite]: Satellites found, in no particular order.
+    """
+    latest = _latest_satellite_epochs(norad_cat_ids)
+    return list(
+        db.scalars(
+            select(Satellite).join(
+                latest,
+                and_(
+                    Satellite.norad_cat_id == latest.c.norad_cat_id,
+                    Satellite.epoch == latest.c.epoch,
+                ),
+            )
+        )
+    )
+
+
+def load_satellites_by_ids(
+    db: Session, norad_cat_ids: list[int], as_of: Optional[datetime] = None
+) -> list[Satellite]:
+    """
+    Load the latest element set of each requested satellite, or the latest one
+    at or before as_of, with one set-based query. The requested IDs are joined
+    as a VALUES list, each element set is found through the primary key index.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD catalog IDs, duplicates are ignored.
+        as_of: Only element sets with epoch at or before this time.
+
+    Returns:
+        list[Satellite]: Satellites found, in request order.
+    """
+    if not norad_cat_ids:
+        return []
+    requested = _requested_ids(norad_cat_ids)
+    return list(
+        db.scalars(
+            select(Satellite)
+            .join(
+                requested,
+                and_(
+                    Satellite.norad_cat_id == requested.c.id,
+                    Satellite.epoch
+                    == _epoch_as_of(
+                        Satellite.norad_cat_id, Satellite.epoch, requested, as_of
+                    ),
+                ),
+            )
+            .order_by(requested.c.position)
+        )
+    )
+
+
+def load_space_objects_by_ids(
+    db: Session, norad_cat_ids: list[int], as_of: Optional[datetime] = None
+) -> list[SpaceObject]:
+    """
+    Load the latest state of each requested space object, or the latest one
+    at or before as_of, with one set-based query, see load_satellites_by_ids.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD IDs, duplicates are ignored.
+        as_of: Only states with epoch at or before this time.
+
+    Returns:
+        list[SpaceObject]: Space objects found with their vectors, in request order.
+    """
+    if not norad_cat_ids:
+        return []
+    requested = _requested_ids(norad_cat_ids)
+    return list(
+        db.scalars(
+            select(SpaceObject)
+            .join(
+                requested,
+                and_(
+                    SpaceObject.id == requested.c.id,
+                    SpaceObject.epoch
+                    == _epoch_as_of(
+                        SpaceObject.id, SpaceObject.epoch, requested, as_of
+                    ),
+                ),
+            )
+            .order_by(requested.c.position)
+            .options(
+                selectinload(SpaceObject.position), selectinload(SpaceObject.velocity)
+            )
+        )
+    )
+
+
+def save_conjunctions(conjunctions: list[Conjunction], db: Session):
+    """
+    Save assessed conjunctions.
+
+    Args:
+        conjunctions: Conjunctions to save.
+        db: SQLAlchemy session.
+    """
+    save(conjunctions, db)
+
+
+def load_conjunctions(
+    db: Session,
+    page: int = 0,
+    limit: int = 100,
+    norad_cat_id: Optional[int] = None,
+    min_probability: Optional[float] = None,
+) -> list[Conjunction]:
+    """
+    Load assessed conjunctions, the most probable first.
+
+    Args:
+        db: SQLAlchemy session.
+        page: Page number for pagination.
+        limit: Number of records per page.
+        norad_cat_id: Only conjunctions involving this object.
+        min_probability: Only conjunctions with at least this 2D probability of collision.
+
+    Returns:
+        list[Conjunction]: List of conjunctions.
+    """
+    query = select(Conjunction)
+    if norad_cat_id is not None:
+        query = query.where(
+            or_(
+                Conjunction.primary_id == norad_cat_id,
+                Conjunction.secondary_id == norad_cat_id,
+            )
+        )
+    if min_probability is not None:
+        query = query.where(Conjunction.probability >= min_probability)
+    query = (
+        query.order_by(Conjunction.probability.desc(), Conjunction.id)
+        .offset(page * limit)
+        .limit(limit)
+    )
+    return list(db.scalars(query))
+
+
+def load_latest_elements(
+    db: Session, norad_cat_ids: Optional[list[int]] = None
+) -> list[tuple]:
+    """
+    Load the orbital elements used for clustering from the latest element set of
+    every (or the given) satellite, as plain rows.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD catalog IDs, all satellites if None.
+
+    Returns:
+        list[tuple]: Rows of (norad_cat_id, epoch, mean_motion, inclination,
+        ra_of_asc_node, eccentricity) ordered by NORAD ID.
+    """
+    latest = _latest_satellite_epochs(norad_cat_ids)
+    result = db.execute(
+        select(
+            Satellite.norad_cat_id,
+            Satellite.epoch,
+            Satellite.mean_motion,
+            Satellite.inclination,
+            Satellite.ra_of_asc_node,
+            Satellite.eccentricity,
+        )
+        .join(
+            latest,
+            and_(
+                Satellite.norad_cat_id == latest.c.norad_cat_id,
+                Satellite.epoch == latest.c.epoch,
+            ),
+        )
+        .order_by(Satellite.norad_cat_id)
+    )
+    return [tuple(row) for row in result]
+
+
+def replace_orbit_clusters(
+    db: Session,
+    cells: list[dict],
+    members: list[dict],
+    batch_size: int = BULK_BATCH_SIZE,
+):
+    """
+    Replaces the stored clustering with a new one. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        cells: OrbitClusterCell rows as dictionaries.
+        members: OrbitClusterMember rows as dictionaries.
+        batch_size: Rows per INSERT statement.
+    """
+    db.execute(delete(OrbitClusterCell))
+    db.execute(delete(OrbitClusterMember))
+    for batch in _batched(cells, batch_size):
+        db.execute(insert(OrbitClusterCell), batch)
+    for batch in _batched(members, batch_size):
+        db.execute(insert(OrbitClusterMember), batch)
+
+
+def load_orbit_cluster_cells(db: Session) -> list[tuple]:
+    """
+    Load the occupied clustering grid cells.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        list[tuple]: Rows of (key, count, cluster) ordered by key.
+    """
+    result = db.execute(
+        select(
+            OrbitClusterCell.key, OrbitClusterCell.count, OrbitClusterCell.cluster
+        ).order_by(OrbitClusterCell.key)
+    )
+    return [tuple(row) for row in result]
+
+
+def load_orbit_cluster_member_keys(
+    db: Session, norad_cat_ids: list[int]
+) -> dict[int, int]:
+    """
+    Load the clustering grid cell of the given objects.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD catalog IDs.
+
+    Returns:
+        dict[int, int]: Cell key by NORAD ID, objects without cluster are missing.
+    """
+    keys = {}
+    for batch in _batched(norad_cat_ids, BULK_BATCH_SIZE):
+        keys.update(
+            db.execute(
+                select(
+                    OrbitClusterMember.norad_cat_id, OrbitClusterMember.cell_key
+                ).where(OrbitClusterMember.norad_cat_id.in_(batch))
+            ).all()
+        )
+    return keys
+
+
+def save_orbit_cluster_updates(
+    db: Session,
+    cells: list[dict],
+    members: list[dict],
+    batch_size: int = BULK_BATCH_SIZE,
+):
+    """
+    Saves incrementally updated clustering cells and members, replacing the
+    stored rows with the same keys. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        cells: OrbitClusterCell rows as dictionaries.
+        members: OrbitClusterMember rows as dictionaries.
+        batch_size: Rows per statement.
+    """
+    for batch in _batched(cells, batch_size):
+        db.execute(
+            delete(OrbitClusterCell).where(
+                OrbitClusterCell.key.in_([cell["key"] for cell in batch])
+            )
+        )
+        db.execute(insert(OrbitClusterCell), batch)
+    for batch in _batched(members, batch_size):
+        db.execute(
+            delete(OrbitClusterMember).where(
+                OrbitClusterMember.norad_cat_id.in_(
+                    [member["norad_cat_id"] for member in batch]
+                )
+            )
+        )
+        db.execute(insert(OrbitClusterMember), batch)
+
+
+def relabel_orbit_cluster_members(db: Session, cells: dict[int, int]):
+    """
+    Sets the cluster of the stored members in the given cells. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        cells: Cluster by cell key.
+    """
+    if not cells:
+        return
+    members = OrbitClusterMember.__table__
+    db.execute(
+        update(members)
+        .where(members.c.cell_key == bindparam("cell"))
+        .values(cluster=bindparam("label")),
+        [{"cell": key, "label": cluster} for key, cluster in cells.items()],
+    )
+
+
+def load_orbit_clusters(db: Session, min_size: int = 1) -> list[tuple]:
+    """
+    Load the orbital-regime clusters with the mean elements of their members.
+
+    Args:
+        db: SQLAlchemy session.
+        min_size: Only clusters with at least this many members.
+
+    Returns:
+        list[tuple]: Rows of (cluster, size, semi_major_axis, inclination,
+        eccentricity), the largest cluster first.
+    """
+    size = func.count().label("size")
+    result = db.execute(
+        select(
+            OrbitClusterMember.cluster,
+            size,
+            func.avg(OrbitClusterMember.semi_major_axis).label("semi_major_axis"),
+            func.avg(OrbitClusterMember.inclination).label("inclination"),
+            func.avg(OrbitClusterMember.eccentricity).label("eccentricity"),
+        )
+        .where(OrbitClusterMember.cluster >= 0)
+        .group_by(OrbitClusterMember.cluster)
+        .having(size >= min_size)
+        .order_by(size.desc(), OrbitClusterMember.cluster)
+    )
+    return list(result)
+
+
+def add_population_object_days(
+    db: Session, keys: list[tuple[int, date]], batch_size: int = BULK_BATCH_SIZE
+) -> list[tuple[int, date]]:
+    """
+    Stores object days as counted, skipping ones already stored
+    (INSERT ... ON CONFLICT DO NOTHING RETURNING). A concurrent ingest storing
+    the same object day waits for this transaction, so each object day is
+    returned to exactly one ingest run. Keys should be sorted, so concurrent
+    runs lock them in the same order. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        keys: (norad_cat_id, day) keys.
+        batch_size: Number of keys per INSERT statement.
+
+    Returns:
+        list[tuple[int, date]]: Keys that were not stored yet.
+    """
+    dialect_insert = postgresql_insert if is_postgresql(db) else sqlite_insert
+    new = []
+    for batch in _batched(keys, batch_size):
+        statement = (
+            dialect_insert(PopulationObjectDay)
+            .values(
+                [
+                    {"norad_cat_id": norad_cat_id, "day": day}
+                    for norad_cat_id, day in batch
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(PopulationObjectDay.norad_cat_id, PopulationObjectDay.day)
+        )
+        new.extend(tuple(row) for row in db.execute(statement))
+    return new
+
+
+def add_population_rollups(db: Session, rows: list[dict]):
+    """
+    Adds counts to the population rollups, rows missing so far are inserted.
+    Each row is updated atomically (INSERT ... ON CONFLICT DO UPDATE), so
+    concurrent ingest runs do not lose counts. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        rows: PopulationRollup rows as dictionaries.
+    """
+    if not rows:
+        return
+    dialect_insert = postgresql_insert if is_postgresql(db) else sqlite_insert
+    statement = dialect_insert(PopulationRollup)
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=["day", "dimension", "bucket", "source"],
+            set_={
+                "count": PopulationRollup.count + statement.excluded.count,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ),
+        rows,
+    )
+
+
+def load_population_rollups(
+    db: Session,
+    dimension: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    source: Optional[str] = None,
+) -> list[tuple]:
+    """
+    Load daily population counts of a dimension, summed over sources.
+
+    Args:
+        db: SQLAlchemy session.
+        dimension: "altitude", "inclination" or "regime".
+        start: First day, inclusive.
+        end: Last day, inclusive.
+        source: Only this ingest source.
+
+    Returns:
+        list[tuple]: Rows of (day, bucket, count), ordered by day.
+    """
+    query = (
+        select(
+            PopulationRollup.day,
+            PopulationRollup.bucket,
+            func.sum(PopulationRollup.count).label("count"),
+        )
+        .where(PopulationRollup.dimension == dimension)
+        .group_by(PopulationRollup.day, PopulationRollup.bucket)
+        .order_by(PopulationRollup.day, PopulationRollup.bucket)
+    )
+    if start is not None:
+        query = query.where(PopulationRollup.day >= start)
+    if end is not None:
+        query = query.where(PopulationRollup.day <= end)
+    if source is not None:
+        query = query.where(PopulationRollup.source == source)
+    return list(db.execute(query))
+
+
+def load_orbit_cluster_members(
+    db: Session, cluster: int, page: int = 0, limit: int = 100
+) -> list[OrbitClusterMember]:
+    """
+    Load the members of an orbital-regime cluster.
+
+    Args:
+        db: SQLAlchemy session.
+        cluster: Cluster, -1 for unclustered objects.
+        page: Page number for pagination.
+        limit: Number of records per page.
+
+    Returns:
+        list[OrbitClusterMember]: Members ordered by NORAD ID.
+    """
+    return list(
+        db.scalars(
+            select(OrbitClusterMember)
+            .where(OrbitClusterMember.cluster == cluster)
+            .order_by(OrbitClusterMember.norad_cat_id)
+            .offset(page * limit)
+            .limit(limit)
+        )
+    )
+
+
+def save_watchlist(watchlist: WatchlistCreate, db: Session) -> Watchlist:
+    """
+    Save a watchlist with its members.
+
+    Args:
+        watchlist: Watchlist to save.
+        db: SQLAlchemy session.
+
+    Returns:
+        Watchlist: Saved watchlist.
+    """
+    db_watchlist = Watchlist(
+        **watchlist.model_dump(mode="json", exclude={"norad_cat_ids"}),
+        members=[
+            WatchlistMember(norad_cat_id=norad_cat_id)
+            for norad_cat_id in dict.fromkeys(watchlist.norad_cat_ids)
+        ],
+    )
+    save([db_watchlist], db)
+    return db_watchlist
+
+
+def delete_watchlist(db: Session, watchlist_id: int) -> bool:
+    """
+    Delete a watchlist with its members and alert events.
+
+    Args:
+        db: SQLAlchemy session.
+        watchlist_id: Watchlist ID.
+
+    Returns:
+        bool: False if the watchlist does not exist.
+    """
+    watchlist = db.get(Watchlist, watchlist_id)
+    if watchlist is None:
+        return False
+    db.execute(delete(AlertEvent).where(AlertEvent.watchlist_id == watchlist_id))
+    db.delete(watchlist)
+    db.commit()
+    return True
+
+
+def load_watchlists(
+    db: Session, watchlist_ids: Optional[list[int]] = None
+) -> list[Watchlist]:
+    """
+    Load watchlists with their members.
+
+    Args:
+        db: SQLAlchemy session.
+        watchlist_ids: Watchlist IDs, all watchlists if None.
+
+    Returns:
+        list[Watchlist]: Watchlists ordered by ID.
+    """
+    query = select(Watchlist).options(selectinload(Watchlist.members))
+    if watchlist_ids is not None:
+        query = query.where(Watchlist.id.in_(watchlist_ids))
+    return list(db.scalars(query.order_by(Watchlist.id)))
+
+
+def load_watchlist_members(
+    db: Session,
+    norad_cat_ids: Optional[list[int]] = None,
+    watchlist_ids: Optional[list[int]] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> list[tuple[int, int]]:
+    """
+    Load the watchlists interested in objects through the NORAD ID index of
+    the members, or the members of watchlists.
+
+    Args:
+        db: SQLAlchemy session.
+        norad_cat_ids: NORAD IDs, members of all objects if None.
+        watchlist_ids: Only members of these watchlists.
+        batch_size: NORAD IDs per query.
+
+    Returns:
+        list[tuple[int, int]]: (watchlist_id, norad_cat_id) rows.
+    """
+    query = select(WatchlistMember.watchlist_id, WatchlistMember.norad_cat_id)
+    if watchlist_ids is not None:
+        query = query.where(WatchlistMember.watchlist_id.in_(watchlist_ids))
+    if norad_cat_ids is None:
+        return [tuple(row) for row in db.execute(query)]
+    rows = []
+    for batch in _batched(norad_cat_ids, batch_size):
+        rows.extend(
+            tuple(row)
+            for row in db.execute(query.where(WatchlistMember.norad_cat_id.in_(batch)))
+        )
+    return rows
+
+
+def save_alert_events(alerts: list[AlertEvent], db: Session) -> list[AlertEvent]:
+    """
+    Save alert events, skipping ones already stored (same watchlist, object,
+    rule and element set epoch). Does not commit.
+
+    Args:
+        alerts: Alert events to save.
+        db: SQLAlchemy session.
+
+    Returns:
+        list[AlertEvent]: Saved alert events.
+    """
+
+    def key(alert: AlertEvent) -> tuple:
+        return (alert.watchlist_id, alert.rule, *_key(alert.norad_cat_id, alert.epoch))
+
+    alerts = _unique_by_key(alerts, key)
+    existing = set()
+    for batch in _batched(alerts, BULK_BATCH_SIZE):
+        existing.update(
+            (watchlist_id, rule, *_key(norad_cat_id, epoch))
+            for watchlist_id, rule, norad_cat_id, epoch in db.execute(
+                select(
+                    AlertEvent.watchlist_id,
+                    AlertEvent.rule,
+                    AlertEvent.norad_cat_id,
+                    AlertEvent.epoch,
+                ).where(
+                    tuple_(
+                        AlertEvent.watchlist_id,
+                        AlertEvent.rule,
+                        AlertEvent.norad_cat_id,
+                        AlertEvent.epoch,
+                    ).in_([key(alert) for alert in batch])
+                )
+            )
+        )
+    alerts = [alert for alert in alerts if key(alert) not in existing]
+    db.add_all(alerts)
+    db.flush()
+    return alerts
+
+
+def load_alert_events(
+    db: Session, watchlist_id: int, page: int = 0, limit: int = 100
+) -> list[AlertEvent]:
+    """
+    Load the alert events of a watchlist, the latest first.
+
+    Args:
+        db: SQLAlchemy session.
+        watchlist_id: Watchlist ID.
+        page: Page number for pagination.
+        limit: Number of records per page.
+
+    Returns:
+        list[AlertEvent]: Alert events.
+    """
+    return list(
+        db.scalars(
+            select(AlertEvent)
+            .where(AlertEvent.watchlist_id == watchlist_id)
+            .order_by(AlertEvent.id.desc())
+            .offset(page * limit)
+            .limit(limit)
+        )
+    )
+
+
+def load_pending_alert_events(
+    db: Session, limit: int = 1000
+) -> list[tuple[str, AlertEvent]]:
+    """
+    Load alert events not dispatched yet of watchlists with a webhook, the oldest
+    ones of each watchlist, so pending events of a failing webhook do not hold
+    back the events of other watchlists.
+
+    Args:
+        db: SQLAlchemy session.
+        limit: Maximum number of alert events per watchlist.
+
+    Returns:
+        list[tuple[str, AlertEvent]]: (webhook_url, alert event) rows, oldest first.
+    """
+    pending = (
+        select(
+            AlertEvent.id,
+            func.row_number()
+            .over(partition_by=AlertEvent.watchlist_id, order_by=AlertEvent.id)
+            .label("position"),
+        )
+        .where(AlertEvent.dispatched_at.is_(None))
+        .subquery()
+    )
+    return [
+        tuple(row)
+        for row in db.execute(
+            select(Watchlist.webhook_url, AlertEvent)
+            .join(pending, pending.c.id == AlertEvent.id)
+            .join(Watchlist, Watchlist.id == AlertEvent.watchlist_id)
+            .where(pending.c.position <= limit, Watchlist.webhook_url.is_not(None))
+            .order_by(AlertEvent.id)
+        )
+    ]
+
+
+def mark_alert_events_dispatched(
+    db: Session, alert_ids: list[int], dispatched_at: datetime
+):
+    """
+    Mark alert events as dispatched. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        alert_ids: Alert event IDs.
+        dispatched_at: Dispatch time.
+    """
+    for batch in _batched(alert_ids, BULK_BATCH_SIZE):
+        db.execute(
+            update(AlertEvent)
+            .where(AlertEvent.id.in_(batch))
+            .values(dispatched_at=dispatched_at)
+        )
+
+
+def is_postgresql(db: Session) -> bool:
+    """
+    Whether the session is bound to a PostgreSQL database.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        bool: True on PostgreSQL.
+    """
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _copy_element_sets(elements: np.ndarray, db: Session, batch_size: int) -> int:
+    table_name = Satellite.__tablename__
+    staging = f"{table_name}_staging"
+    columns = ", ".join(elements.dtype.names)
+    db.execute(
+        text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {table_name} WITH NO DATA"
+        )
+    )
+    db.execute(text(f"TRUNCATE {staging}"))
+    _copy_columns(
+        db, staging, {name: elements[name] for name in elements.dtype.names}, batch_size
+    )
+    # Duplicates within the staging table are skipped as conflicts too.
+    return db.execute(
+        text(
+            f"INSERT INTO {table_name} ({columns}, {_TIMESTAMPS}) "
+            f"SELECT {columns}, now(), now() FROM {staging} ON CONFLICT DO NOTHING"
+        )
+    ).rowcount
+
+
+def _copy_states(
+    elements: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    source: str,
+    db: Session,
+    batch_size: int,
+) -> int:
+    table_name = SpaceObject.__tablename__
+    vector_table = Vector3D.__tablename__
+    staging = f"{table_name}_staging"
+    vectors = ("pos_x", "pos_y", "pos_z", "vel_x", "vel_y", "vel_z")
+    db.execute(
+        text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} (id integer, "
+            f"name varchar(100), epoch timestamptz, source varchar(30), "
+            f"{', '.join(f'{name} double precision' for name in vectors)}) "
+            f"ON COMMIT DROP"
+        )
+    )
+    db.execute(text(f"TRUNCATE {staging}"))
+    _copy_columns(
+        db,
+        staging,
+        {
+            "id": elements["norad_cat_id"],
+            "name": elements["object_name"],
+            "epoch": elements["epoch"],
+            "source": np.full(len(elements), source),
+            **dict(zip(vectors, np.hstack([positions, velocities]).T)),
+        },
+        batch_size,
+    )
+    # New states get their vector ids from the vector3d sequence, the vectors
+    # and the space objects are inserted by one statement. Only the vectors of
+    # the space objects actually inserted are written, a concurrent ingest may
+    # have inserted the same states after the NOT EXISTS check.
+    sequence = f"pg_get_serial_sequence('{vector_table}', 'id')"
+    return db.scalar(
+        text(
+            f"WITH new AS ("
+            f"SELECT DISTINCT ON (s.id, s.epoch) s.*, "
+            f"nextval({sequence}) AS position_id, nextval({sequence}) AS velocity_id "
+            f"FROM {staging} s WHERE NOT EXISTS (SELECT 1 FROM {table_name} o "
+            f"WHERE o.id = s.id AND o.epoch = s.epoch) ORDER BY s.id, s.epoch), "
+            f"inserted AS (INSERT INTO {table_name} "
+            f"(id, name, epoch, source, position_id, velocity_id, {_TIMESTAMPS}) "
+            f"SELECT id, name, epoch, source, position_id, velocity_id, now(), now() "
+            f"FROM new ON CONFLICT DO NOTHING RETURNING id, epoch), "
+            f"states AS (SELECT new.* FROM new JOIN inserted USING (id, epoch)), "
+            f"positions AS (INSERT INTO {vector_table} (id, x, y, z, {_TIMESTAMPS}) "
+            f"SELECT position_id, pos_x, pos_y, pos_z, now(), now() FROM states), "
+            f"velocities AS (INSERT INTO {vector_table} (id, x, y, z, {_TIMESTAMPS}) "
+            f"SELECT velocity_id, vel_x, vel_y, vel_z, now(), now() FROM states) "
+            f"SELECT count(*) FROM inserted"
+        )
+    )
+
+
+def _copy_columns(
+    db: Session, table_name: str, columns: dict[str, np.ndarray], batch_size: int
+):
+    # Streams columns with COPY FROM STDIN as CSV, one COPY per batch. Strings
+    # are quoted so empty strings are not read as NULL, epochs are sent as UTC.
+    cursor = db.connection().connection.driver_connection.cursor()
+    statement = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    size = len(next(iter(columns.values()), []))
+    for start in range(0, size, batch_size):
+        values = [
+            (
+                np.datetime_as_string(
+                    column[start : start + batch_size], timezone="UTC"
+                )
+                if column.dtype.kind == "M"
+                else column[start : start + batch_size]
+            ).tolist()
+            for column in columns.values()
+        ]
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(zip(*values))
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+
+
+def _latest_satellite_epochs(norad_cat_ids: Optional[list[int]] = None):
+    query = select(
+        Satellite.norad_cat_id, func.max(Satellite.epoch).label("epoch")
+    ).group_by(Satellite.norad_cat_id)
+    if norad_cat_ids is not None:
+        query = query.where(Satellite.norad_cat_id.in_(norad_cat_ids))
+    return query.subquery()
+
+
+def _requested_ids(norad_cat_ids: list[int]):
+    # IDs with their request position as a VALUES common table expression.
+    return (
+        values(column("position", Integer), column("id", Integer), name="requested")
+        .data(list(enumerate(dict.fromkeys(norad_cat_ids))))
+        .cte()
+    )
+
+
+def _epoch_as_of(
+    id_attr: InstrumentedAttribute,
+    epoch_attr: InstrumentedAttribute,
+    requested,
+    as_of: Optional[datetime],
+):
+    # Latest epoch of a requested ID, correlated to the VALUES row.
+    entity = aliased(id_attr.class_)
+    inner_id = getattr(entity, id_attr.key)
+    inner_epoch = getattr(entity, epoch_attr.key)
+    query = select(func.max(inner_epoch)).where(inner_id == requested.c.id)
+    if as_of is not None:
+        if as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        query = query.where(inner_epoch <= as_of.astimezone(timezone.utc))
+    return query.scalar_subquery()
+
+
+def _existing_keys(
+    db: Session,
+    id_attr: InstrumentedAttribute,
+    epoch_attr: InstrumentedAttribute,
+    keys: list[tuple[int, datetime]],
+) -> set[tuple[int, datetime]]:
+    if not keys:
+        return set()
+    rows = db.execute(
+        select(id_attr, epoch_attr).where(tuple_(id_attr, epoch_attr).in_(keys))
+    ).all()
+    return {_key(object_id, epoch) for object_id, epoch in rows}
+
+
+def _new_keys(
+    db: Session,
+    norad_cat_ids: np.ndarray,
+    epochs: np.ndarray,
+    id_attr: InstrumentedAttribute,
+    epoch_attr: InstrumentedAttribute,
+) -> np.ndarray:
+    # Indices of the first occurrence of each key that is not stored yet.
+    _, first = np.unique(np.rec.fromarrays([norad_cat_ids, epochs]), return_index=True)
+    first.sort()
+    keys = list(zip(norad_cat_ids[first].tolist(), epochs[first].tolist()))
+    existing = _existing_keys(db, id_attr, epoch_attr, keys)
+    return first[[key not in existing for key in keys]]
+
+
+def _column_rows(records: np.ndarray) -> list[dict]:
+    # INSERT parameters from the columns of a structured array, datetime64
+    # becomes naive UTC datetime.
+    names = records.dtype.names
+    columns = [records[name].tolist() for name in names]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def _key(object_id: int, epoch: datetime) -> tuple[int, datetime]:
+    # Compare epochs as naive UTC, SQLite returns naive datetimes.
+    if epoch.tzinfo is not None:
+        epoch = epoch.astimezone(timezone.utc).replace(tzinfo=None)
+    return object_id, epoch
+
+
+def _unique_by_key(items: list[T], key) -> list[T]:
+    unique = {}
+    for item in items:
+        unique.setdefault(key(item), item)
+    return list(unique.values())
+
+
+def _batched(items: list[T], size: int) -> Iterator[list[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
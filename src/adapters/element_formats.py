@@ -0,0 +1,231 @@
+import io
+import json
+import logging
+from typing import Callable, Iterable
+
+import numpy as np
+
+# Element set columns, named like the Satellite columns. String widths are
+# sized to the data.
+ELEMENT_DTYPES = {
+    "object_name": "U",
+    "object_id": "U",
+    "epoch": "M8[us]",
+    "mean_motion": "f8",
+    "eccentricity": "f8",
+    "inclination": "f8",
+    "ra_of_asc_node": "f8",
+    "arg_of_pericenter": "f8",
+    "mean_anomaly": "f8",
+    "ephemeris_type": "i4",
+    "classification_type": "U",
+    "norad_cat_id": "i4",
+    "element_set_no": "i4",
+    "rev_at_epoch": "i4",
+    "bstar": "f8",
+    "mean_motion_dot": "f8",
+    "mean_motion_ddot": "f8",
+}
+
+_ALPHA5 = "ABCDEFGHJKLMNPQRSTUVWXYZ"
+
+
+def element_array(columns: dict[str, Iterable]) -> np.ndarray:
+    """
+    Builds a structured array of element sets from columns.
+
+    Args:
+        columns (dict[str, Iterable]): Column values by ELEMENT_DTYPES name.
+
+    Returns:
+        np.ndarray: Structured array with ELEMENT_DTYPES fields.
+    """
+    arrays = {}
+    for name, dtype in ELEMENT_DTYPES.items():
+        values = np.asarray(columns[name])
+        arrays[name] = values.astype(str) if dtype == "U" else values.astype(dtype)
+    size = len(arrays["norad_cat_id"])
+    elements = np.empty(
+        size,
+        dtype=[
+            (name, array.dtype if ELEMENT_DTYPES[name] == "U" else ELEMENT_DTYPES[name])
+            for name, array in arrays.items()
+        ],
+    )
+    for name, array in arrays.items():
+        elements[name] = array
+    return elements
+
+
+def read_omm_json(text: str) -> np.ndarray:
+    """
+    Parses Celestrak OMM JSON into an element set array.
+    """
+    data = json.loads(text)
+    return element_array(
+        {name: [fields[name.upper()] for fields in data] for name in ELEMENT_DTYPES}
+    )
+
+
+def read_omm_csv(text: str) -> np.ndarray:
+    """
+    Parses Celestrak OMM CSV into an element set array with the pandas C parser,
+    column by column.
+    """
+    import pandas as pd
+
+    strings = [name.upper() for name, dtype in ELEMENT_DTYPES.items() if dtype == "U"]
+    frame = pd.read_csv(
+        io.StringIO(text),
+        dtype={**{name: str for name in strings}, "EPOCH": str},
+        keep_default_na=False,
+    )
+    return element_array(
+        {name: frame[name.upper()].to_numpy() for name in ELEMENT_DTYPES}
+    )
+
+
+def read_tle(text: str) -> np.ndarray:
+    """
+    Parses 3-line (or 2-line) TLE text into an element set array. Records are
+    split in one pass over the lines, the fixed width fields are parsed
+    vectorized over all records.
+    """
+    names, lines1, lines2 = _split_tle_records(text.splitlines())
+    line1 = _fixed_width(lines1)
+    line2 = _fixed_width(lines2)
+
+    year = _ints(line1, 18, 20)
+    year += np.where(year >= 57, 1900, 2000)
+    day = _floats(line1, 20, 32)
+    epoch = (year - 1970).astype("M8[Y]").astype("M8[us]") + np.round(
+        (day - 1.0) * 86400e6
+    ).astype("timedelta64[us]")
+
+    norad_cat_id = _norad_cat_ids(line1)
+    names = np.array(names, dtype=str)
+    return element_array(
+        {
+            "object_name": np.where(names == "", norad_cat_id.astype(str), names),
+            "object_id": _object_ids(line1),
+            "epoch": epoch,
+            "mean_motion": _floats(line2, 52, 63),
+            "eccentricity": _ints(line2, 26, 33) * 1e-7,
+            "inclination": _floats(line2, 8, 16),
+            "ra_of_asc_node": _floats(line2, 17, 25),
+            "arg_of_pericenter": _floats(line2, 34, 42),
+            "mean_anomaly": _floats(line2, 43, 51),
+            "ephemeris_type": _ints(line1, 62, 63),
+            "classification_type": _strings(line1, 7, 8),
+            "norad_cat_id": norad_cat_id,
+            "element_set_no": _ints(line1, 64, 68),
+            "rev_at_epoch": _ints(line2, 63, 68),
+            "bstar": _exponential(line1, 53),
+            "mean_motion_dot": _floats(line1, 33, 43),
+            "mean_motion_ddot": _exponential(line1, 44),
+        }
+    )
+
+
+# Pluggable readers by format name, as in Celestrak's FORMAT parameter.
+FORMAT_READERS: dict[str, Callable[[str], np.ndarray]] = {
+    "json": read_omm_json,
+    "csv": read_omm_csv,
+    "tle": read_tle,
+}
+
+
+def read_elements(text: str, format: str) -> np.ndarray:
+    """
+    Parses element sets with the reader registered for the format.
+
+    Args:
+        text (str): Element set text.
+        format (str): Format name, a key of FORMAT_READERS.
+
+    Returns:
+        np.ndarray: Structured array with ELEMENT_DTYPES fields.
+    """
+    reader = FORMAT_READERS.get(format.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported element set format: {format}")
+    return reader(text)
+
+
+def _split_tle_records(lines: list[str]) -> tuple[list[str], list[str], list[str]]:
+    names, lines1, lines2 = [], [], []
+    name = ""
+    line1 = None
+    for line in lines:
+        line = line.rstrip()
+        if not line:
+            continue
+        if line.startswith("1 ") and line1 is None:
+            line1 = line
+        elif line.startswith("2 ") and line1 is not None:
+            names.append(name)
+            lines1.append(line1)
+            lines2.append(line)
+            name, line1 = "", None
+        else:
+            if line1 is not None:
+                logging.warning("Skipping incomplete TLE record: %s", line1)
+                line1 = None
+            name = line[2:].strip() if line.startswith("0 ") else line.strip()
+    return names, lines1, lines2
+
+
+def _fixed_width(lines: list[str]) -> np.ndarray:
+    # One row of 69 single byte characters per line.
+    return (
+        np.array([line.ljust(69)[:69] for line in lines], dtype="S69")
+        .view("S1")
+        .reshape(len(lines), 69)
+    )
+
+
+def _strings(lines: np.ndarray, start: int, end: int) -> np.ndarray:
+    field = np.ascontiguousarray(lines[:, start:end]).view(f"S{end - start}")
+    return np.char.strip(np.char.decode(field.ravel(), "ascii"))
+
+
+def _floats(lines: np.ndarray, start: int, end: int) -> np.ndarray:
+    field = np.char.strip(
+        np.ascontiguousarray(lines[:, start:end]).view(f"S{end - start}").ravel()
+    )
+    return np.where(field == b"", b"0", field).astype(np.float64)
+
+
+def _ints(lines: np.ndarray, start: int, end: int) -> np.ndarray:
+    return _floats(lines, start, end).astype(np.int64)
+
+
+def _exponential(lines: np.ndarray, start: int) -> np.ndarray:
+    # Implied decimal point and exponent, e.g. " 12340-3" = 0.12340e-3.
+    mantissa = _floats(lines, start, start + 6) * 1e-5
+    return mantissa * 10.0 ** _floats(lines, start + 6, start + 8)
+
+
+def _norad_cat_ids(line1: np.ndarray) -> np.ndarray:
+    # Alpha-5 catalog numbers encode 100000+ with a leading letter, "A0001" = 100001.
+    first = _strings(line1, 2, 3)
+    alpha = np.char.isalpha(first)
+    if not alpha.any():
+        return _ints(line1, 2, 7)
+    leading = np.where(alpha | (first == ""), "0", first).astype(np.int64)
+    leading[alpha] = [_ALPHA5.index(letter) + 10 for letter in first[alpha]]
+    return leading * 10000 + _ints(line1, 3, 7)
+
+
+def _object_ids(line1: np.ndarray) -> np.ndarray:
+    # TLE international designator "98067A" -> OMM object id "1998-067A".
+    designators = _strings(line1, 9, 17)
+    year = _strings(line1, 9, 11)
+    valid = np.char.isdigit(year) & (np.char.str_len(designators) >= 5)
+    years = np.where(valid, year, "0").astype(np.int64)
+    years += np.where(years >= 57, 1900, 2000)
+    return np.where(
+        valid,
+        np.char.add(np.char.add(years.astype(str), "-"), _strings(line1, 11, 17)),
+        designators,
+    )
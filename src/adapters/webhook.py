@@ -0,0 +1,27 @@
+import logging
+
+
+def post_json(url: str, payload: dict, timeout: float) -> bool:
+    """
+    Posts a JSON payload to a webhook.
+
+    Args:
+        url (str): Webhook URL.
+        payload (dict): JSON serializable payload.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        bool: True if the webhook accepted the payload with a 2xx status.
+    """
+    import requests
+
+    try:
+        response = requests.post(url, json=payload, timeout=timeout)
+    except requests.RequestException as error:
+        logging.warning("Webhook %s unreachable: %s", url, error)
+        return False
+    if not response.ok:
+        logging.warning(
+            "Webhook %s rejected alerts. Status code: %s", url, response.status_code
+        )
+    return response.ok
@@ -1,24 +1,532 @@
-from fastapi import Depends, FastAPI
+import asyncio
+import contextlib
+import json
+import logging
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Literal, Optional
 
-from src.adapters.database_storage import load_satellites, load_space_objects
-from src.application.session import get_db
+import numpy as np
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.websockets import WebSocketState
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.adapters.database_storage import (
+    delete_watchlist,
+    load_alert_events,
+    load_conjunctions,
+    load_orbit_cluster_members,
+    load_orbit_clusters,
+    load_satellites,
+    load_satellites_by_ids,
+    load_space_objects,
+    load_space_objects_by_ids,
+    load_watchlists,
+    save_watchlist,
+)
+from src.application.catalog import CatalogStore
+from src.application.config import settings
+from src.application.population_stats import load_population_stats
+from src.application.position_stream import (
+    PositionStream,
+    StreamClient,
+    stream_interval,
+)
+from src.application.response_cache import LRUCacheBackend, ResponseCache
+from src.application.session import dispose_engine, get_db
+from src.tracker.catalog_snapshot import CatalogSnapshot, records_json
+from src.tracker.models.batch_request import BatchRequest
+from src.tracker.models.conjunction import ConjunctionRead
+from src.tracker.models.orbit_cluster import OrbitClusterMemberRead, OrbitClusterRead
+from src.tracker.models.population_stat import PopulationStatRead
+from src.tracker.models.position_subscription import PositionSubscription
 from src.tracker.models.satellite import SatelliteRead
 from src.tracker.models.space_object import SpaceObjectRead
+from src.tracker.models.watchlist import (
+    AlertEventRead,
+    WatchlistCreate,
+    WatchlistRead,
+)
+from src.tracker.schema.base_model import utc_now
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The engine is created by get_db on startup, not at import.
+    # Preload the catalog snapshot, honoring get_db overrides (e.g. in tests).
+    for db in app.dependency_overrides.get(get_db, get_db)():
+        try:
+            await _catalog_snapshot(db)
+        except SQLAlchemyError:
+            logging.warning(
+                "Catalog snapshot preload failed, loading on first request."
+            )
+    yield
+    await position_stream.close()
+    dispose_engine()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+
+response_cache = ResponseCache(
+    LRUCacheBackend(
+        settings.response_cache_max_entries, settings.response_cache_max_bytes
+    ),
+    settings.response_cache_check_interval,
+)
+catalog = CatalogStore()
+position_stream = PositionStream()
+
+_satellites_adapter = TypeAdapter(list[SatelliteRead])
+_space_objects_adapter = TypeAdapter(list[SpaceObjectRead])
+_clusters_adapter = TypeAdapter(list[OrbitClusterRead])
+_cluster_members_adapter = TypeAdapter(list[OrbitClusterMemberRead])
+_stats_adapter = TypeAdapter(list[PopulationStatRead])
 
 
 @app.get("/satellites", response_model=list[SatelliteRead])
 async def satellites(
-    page: int = 0, limit: int = 100, db=Depends(get_db)
-) -> list[SatelliteRead]:
-    db_sats = load_satellites(db, page, limit)
-    return [SatelliteRead.model_validate(obj) for obj in db_sats]
+    request: Request, page: int = 0, limit: int = 100, db=Depends(get_db)
+) -> Response:
+    return response_cache.respond(
+        request,
+        db,
+        {"page": page, "limit": limit},
+        lambda: _satellites_adapter.dump_json(
+            [
+                SatelliteRead.model_validate(obj)
+                for obj in load_satellites(db, page, limit)
+            ]
+        ),
+    )
 
 
 @app.get("/space-objects", response_model=list[SpaceObjectRead])
 async def space_objects(
-    page: int = 0, limit: int = 100, db=Depends(get_db)
-) -> list[SpaceObjectRead]:
-    db_so = load_space_objects(db, page, limit)
-    return [SpaceObjectRead.model_validate(obj) for obj in db_so]
+    request: Request, page: int = 0, limit: int = 100, db=Depends(get_db)
+) -> Response:
+    return response_cache.respond(
+        request,
+        db,
+        {"page": page, "limit": limit},
+        lambda: _space_objects_adapter.dump_json(
+            [
+                SpaceObjectRead.model_validate(obj)
+                for obj in load_space_objects(db, page, limit)
+            ]
+        ),
+    )
+
+
+@app.post("/satellites/batch", response_model=list[SatelliteRead])
+async def satellites_batch(batch: BatchRequest, db=Depends(get_db)) -> Response:
+    """
+    Latest element sets of the requested satellites (or the latest at or before
+    as_of) in request order, unknown NORAD IDs are skipped.
+    """
+    _check_batch_size(batch)
+    return Response(
+        _satellites_adapter.dump_json(
+            [
+                SatelliteRead.model_validate(obj)
+                for obj in load_satellites_by_ids(db, batch.norad_cat_ids, batch.as_of)
+            ]
+        ),
+        media_type="application/json",
+    )
+
+
+@app.post("/space-objects/batch", response_model=list[SpaceObjectRead])
+async def space_objects_batch(batch: BatchRequest, db=Depends(get_db)) -> Response:
+    """
+    Latest states of the requested space objects (or the latest at or before
+    as_of) in request order, unknown NORAD IDs are skipped.
+    """
+    _check_batch_size(batch)
+    return Response(
+        _space_objects_adapter.dump_json(
+            [
+                SpaceObjectRead.model_validate(obj)
+                for obj in load_space_objects_by_ids(
+                    db, batch.norad_cat_ids, batch.as_of
+                )
+            ]
+        ),
+        media_type="application/json",
+    )
+
+
+@app.get("/catalog/satellites")
+async def catalog_satellites(
+    request: Request,
+    norad_cat_id: Optional[list[int]] = Query(None),
+    min_inclination: Optional[float] = None,
+    max_inclination: Optional[float] = None,
+    min_altitude: Optional[float] = None,
+    max_altitude: Optional[float] = None,
+    db=Depends(get_db),
+) -> Response:
+    """
+    Latest element set of every satellite, served from the in-memory catalog snapshot.
+    Altitude (km) is derived from the mean motion.
+    """
+    snapshot = await _catalog_snapshot(db)
+    filters = {
+        "norad_cat_ids": norad_cat_id,
+        "min_inclination": min_inclination,
+        "max_inclination": max_inclination,
+        "min_altitude": min_altitude,
+        "max_altitude": max_altitude,
+    }
+    return response_cache.respond(
+        request,
+        db,
+        _normalize(filters),
+        lambda: records_json(snapshot.satellites[snapshot.satellite_mask(**filters)]),
+    )
+
+
+@app.get("/catalog/space-objects")
+async def catalog_space_objects(
+    request: Request,
+    id: Optional[list[int]] = Query(None),
+    db=Depends(get_db),
+) -> Response:
+    """
+    Latest state of every space object, served from the in-memory catalog snapshot.
+    """
+    snapshot = await _catalog_snapshot(db)
+    return response_cache.respond(
+        request,
+        db,
+        _normalize({"ids": id}),
+        lambda: records_json(snapshot.space_objects[snapshot.space_object_mask(id)]),
+    )
+
+
+@app.get("/conjunctions", response_model=list[ConjunctionRead])
+async def conjunctions(
+    page: int = 0,
+    limit: int = 100,
+    norad_cat_id: Optional[int] = None,
+    min_probability: Optional[float] = None,
+    db=Depends(get_db),
+) -> list[ConjunctionRead]:
+    db_conjunctions = load_conjunctions(db, page, limit, norad_cat_id, min_probability)
+    return [ConjunctionRead.model_validate(obj) for obj in db_conjunctions]
+
+
+@app.post("/watchlists", response_model=WatchlistRead, status_code=201)
+async def create_watchlist(
+    watchlist: WatchlistCreate, db=Depends(get_db)
+) -> WatchlistRead:
+    """
+    Stores a watchlist, its rules are evaluated after each ingest run.
+    """
+    _check_batch_size(watchlist)
+    return WatchlistRead.model_validate(save_watchlist(watchlist, db))
+
+
+@app.get("/watchlists", response_model=list[WatchlistRead])
+async def watchlists(db=Depends(get_db)) -> list[WatchlistRead]:
+    return [WatchlistRead.model_validate(obj) for obj in load_watchlists(db)]
+
+
+@app.delete("/watchlists/{watchlist_id}", status_code=204)
+async def remove_watchlist(watchlist_id: int, db=Depends(get_db)) -> Response:
+    if not delete_watchlist(db, watchlist_id):
+        raise HTTPException(404, "Watchlist not found.")
+    return Response(status_code=204)
+
+
+@app.get("/watchlists/{watchlist_id}/alerts", response_model=list[AlertEventRead])
+async def watchlist_alerts(
+    watchlist_id: int, page: int = 0, limit: int = 100, db=Depends(get_db)
+) -> list[AlertEventRead]:
+    """
+    Alert events of a watchlist, the latest first.
+    """
+    if not load_watchlists(db, [watchlist_id]):
+        raise HTTPException(404, "Watchlist not found.")
+    return [
+        AlertEventRead.model_validate(obj)
+        for obj in load_alert_events(db, watchlist_id, page, limit)
+    ]
+
+
+@app.get("/clusters", response_model=list[OrbitClusterRead])
+async def clusters(request: Request, min_size: int = 1, db=Depends(get_db)) -> Response:
+    """
+    Orbital-regime clusters with the mean elements of their members, largest first.
+    """
+    return response_cache.respond(
+        request,
+        db,
+        {"min_size": min_size},
+        lambda: _clusters_adapter.dump_json(
+            [
+                OrbitClusterRead.model_validate(row._mapping)
+                for row in load_orbit_clusters(db, min_size)
+            ]
+        ),
+    )
+
+
+@app.get("/clusters/{cluster}", response_model=list[OrbitClusterMemberRead])
+async def cluster_members(
+    request: Request,
+    cluster: int,
+    page: int = 0,
+    limit: int = 100,
+    db=Depends(get_db),
+) -> Response:
+    """
+    Members of an orbital-regime cluster, -1 lists unclustered objects.
+    """
+    return response_cache.respond(
+        request,
+        db,
+        {"page": page, "limit": limit},
+        lambda: _cluster_members_adapter.dump_json(
+            [
+                OrbitClusterMemberRead.model_validate(obj)
+                for obj in load_orbit_cluster_members(db, cluster, page, limit)
+            ]
+        ),
+    )
+
+
+@app.get("/stats", response_model=list[PopulationStatRead])
+async def stats(
+    request: Request,
+    dimension: Literal["altitude", "inclination", "regime"] = "regime",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    source: Optional[str] = None,
+    db=Depends(get_db),
+) -> Response:
+    """
+    Daily number of objects with element sets by altitude shell (km), inclination
+    band (deg) or orbital regime (LEO, MEO, GEO, HEO), from precomputed rollups.
+    Days are UTC, start and end inclusive, counts are summed over ingest sources
+    unless source is given.
+    """
+    return response_cache.respond(
+        request,
+        db,
+        {"dimension": dimension, "start": start, "end": end, "source": source},
+        lambda: _stats_adapter.dump_json(
+            [
+                PopulationStatRead.model_validate(row._mapping)
+                for row in load_population_stats(db, dimension, start, end, source)
+            ]
+        ),
+    )
+
+
+@app.get("/ground-tracks")
+async def ground_tracks(
+    request: Request,
+    norad_cat_id: list[int] = Query(...),
+    start: Optional[datetime] = None,
+    hours: float = Query(1.5, gt=0),
+    step: float = Query(30.0, gt=0),
+    tolerance: float = Query(0.1, ge=0),
+    db=Depends(get_db),
+) -> Response:
+    """
+    Ground tracks of satellites as a GeoJSON FeatureCollection of MultiLineStrings
+    of (longitude, latitude) in degrees, split at the antimeridian and simplified
+    to tolerance degrees. Positions are propagated every step seconds for hours
+    from start (default: current minute, UTC). Tracks are computed in a worker
+    thread.
+    """
+    start = start or utc_now().replace(second=0, microsecond=0)
+    steps = int(hours * 3600.0 / step) + 1
+    if len(set(norad_cat_id)) > settings.ground_track_max_objects:
+        raise HTTPException(
+            400, f"At most {settings.ground_track_max_objects} objects per request."
+        )
+    if steps * len(set(norad_cat_id)) > settings.ground_track_max_points:
+        raise HTTPException(
+            400, f"At most {settings.ground_track_max_points} points per request."
+        )
+    snapshot = await _catalog_snapshot(db)
+
+    def render() -> bytes:
+        # SGP4 is imported on first use to keep API startup fast.
+        from src.tracker.ground_track import geodetic_tracks, ground_track_features
+        from src.tracker.propagation import satrecs_from_records, to_datetime64
+
+        satellites = snapshot.satellites[snapshot.satellite_mask(norad_cat_id)]
+        if not len(satellites):
+            return b'{"type": "FeatureCollection", "features": []}'
+        times = to_datetime64([start])[0] + (np.arange(steps) * step * 1e6).astype(
+            "timedelta64[us]"
+        )
+        latitude, longitude, _ = geodetic_tracks(
+            satrecs_from_records(satellites), times
+        )
+        features = ground_track_features(
+            satellites["norad_cat_id"], latitude, longitude, tolerance
+        )
+        return json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+    return await response_cache.respond_async(
+        request,
+        db,
+        _normalize(
+            {
+                "norad_cat_ids": norad_cat_id,
+                "start": start.isoformat(),
+                "hours": hours,
+                "step": step,
+                "tolerance": tolerance,
+            }
+        ),
+        render,
+    )
+
+
+@app.websocket("/ws/positions")
+async def positions(websocket: WebSocket, db=Depends(get_db)):
+    """
+    Live position stream. The client sends a PositionSubscription JSON message
+    (and may send new ones to change it), the server acknowledges it with the
+    selected NORAD IDs and interval and then sends a binary frame per tick,
+    see position_stream.FRAME_HEADER and FRAME_DTYPE.
+    """
+    await websocket.accept()
+    client = StreamClient(settings.stream_max_pending_frames)
+    # The stream ends when either side stops: the client disconnected or
+    # a frame could not be sent.
+    tasks = [
+        asyncio.create_task(_send_frames(websocket, client)),
+        asyncio.create_task(_receive_subscriptions(websocket, client, db)),
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        position_stream.unsubscribe(client)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(
+                asyncio.CancelledError, WebSocketDisconnect, RuntimeError
+            ):
+                await task
+        if websocket.client_state == WebSocketState.CONNECTED:
+            # Sending failed while the client is still connected.
+            with contextlib.suppress(WebSocketDisconnect, RuntimeError):
+                await websocket.close(1011)
+
+
+async def _receive_subscriptions(websocket: WebSocket, client: StreamClient, db):
+    # Applies subscription messages until the client disconnects.
+    subscription: Optional[PositionSubscription] = None
+    generation = None
+    while True:
+        try:
+            message = await asyncio.wait_for(
+                websocket.receive(), settings.stream_refresh_interval
+            )
+        except asyncio.TimeoutError:
+            # Pick up new element sets after an ingest.
+            if subscription is not None:
+                try:
+                    generation = await _subscribe(client, db, subscription, generation)
+                except ValueError as e:
+                    subscription = None
+                    await websocket.send_json({"error": str(e)})
+            continue
+        if message["type"] == "websocket.disconnect":
+            return
+        try:
+            subscription = PositionSubscription.model_validate_json(
+                message.get("text") or ""
+            )
+        except ValidationError as e:
+            await websocket.send_json({"error": e.errors(include_url=False)})
+            continue
+        try:
+            generation = await _subscribe(client, db, subscription)
+        except ValueError as e:
+            subscription = None
+            await websocket.send_json({"error": str(e)})
+            continue
+        await websocket.send_json(
+            {
+                "norad_cat_ids": client.norad_cat_ids.tolist(),
+                "interval": client.interval,
+            }
+        )
+
+
+async def _subscribe(
+    client: StreamClient,
+    db,
+    subscription: PositionSubscription,
+    generation: Optional[int] = None,
+) -> int:
+    # (Re)subscribes from the current snapshot unless it is the given generation.
+    # Objects are selected and their satellite records built off the event loop.
+    # Too many objects raise ValueError and end the subscription.
+    current, snapshot, ids = await asyncio.to_thread(
+        _select_objects, db, subscription, generation
+    )
+    if snapshot is not None:
+        if len(ids) > settings.stream_max_objects:
+            position_stream.unsubscribe(client)
+            raise ValueError(f"More than {settings.stream_max_objects} objects.")
+        await position_stream.subscribe(
+            client, snapshot, ids, stream_interval(subscription.interval)
+        )
+    return current
+
+
+async def _catalog_snapshot(db) -> CatalogSnapshot:
+    # Building a snapshot reads the whole catalog, keep it off the event loop.
+    return await asyncio.to_thread(catalog.get, db, response_cache.generation(db))
+
+
+def _select_objects(
+    db, subscription: PositionSubscription, generation: Optional[int]
+) -> tuple[int, Optional[CatalogSnapshot], np.ndarray]:
+    current = response_cache.generation(db)
+    snapshot, ids = None, np.empty(0, dtype=np.int64)
+    if current != generation:
+        snapshot = catalog.get(db, current)
+        filters = subscription.model_dump(exclude={"interval"})
+        ids = snapshot.satellites["norad_cat_id"][snapshot.satellite_mask(**filters)]
+    # Do not hold a connection for the lifetime of the stream.
+    db.close()
+    return current, snapshot, ids
+
+
+async def _send_frames(websocket: WebSocket, client: StreamClient):
+    while True:
+        await websocket.send_bytes(await client.frames.get())
+
+
+def _check_batch_size(batch: BatchRequest | WatchlistCreate):
+    if len(set(batch.norad_cat_ids)) > settings.batch_max_ids:
+        raise HTTPException(
+            400, f"At most {settings.batch_max_ids} NORAD IDs per request."
+        )
+
+
+def _normalize(params: dict) -> dict:
+    return {
+        key: tuple(sorted(set(value))) if isinstance(value, list) else value
+        for key, value in params.items()
+    }
@@ -0,0 +1,177 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.adapters.archive_reader import find_archive_files, read_archive_elements
+from src.adapters.database_storage import (
+    BULK_BATCH_SIZE,
+    bulk_save_or_skip_element_sets,
+    bulk_save_or_skip_states,
+    record_ingest_run,
+)
+from src.application.config import settings
+from src.application.population_stats import update_population_rollups
+from src.tracker.propagation import propagate_to_epoch, satrecs_from_records
+from src.tracker.schema.backfill_checkpoint import BackfillCheckpoint
+
+_MAX_ATTEMPTS = 3
+
+_worker_engine: Optional[Engine] = None
+
+
+def run_backfill(
+    directory: str,
+    db_connection_string: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """
+    Backfills a directory of archived OMM/TLE files into the database.
+    Files are sharded across a process pool, every file is loaded in a single
+    transaction together with its checkpoint, so an interrupted run resumes
+    with the files that were not completed yet.
+
+    Args:
+        directory (str): Directory with archived OMM JSON / CSV / TLE files.
+        db_connection_string (Optional[str]): Database URL, defaults to settings.
+        workers (Optional[int]): Number of worker processes, defaults to CPU count.
+        batch_size (int): Number of rows per INSERT statement.
+
+    Returns:
+        int: Number of inserted element sets.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+        ],
+    )
+    db_connection_string = db_connection_string or settings.db_connection_string
+    root = Path(directory)
+
+    engine = _create_engine(db_connection_string)
+    with Session(engine) as session:
+        completed = set(session.scalars(select(BackfillCheckpoint.path)))
+    engine.dispose()
+
+    files = [path.relative_to(root).as_posix() for path in find_archive_files(root)]
+    pending = [path for path in files if path not in completed]
+    # Largest files first, so the pool does not end waiting on a single big file.
+    pending.sort(key=lambda path: (root / path).stat().st_size, reverse=True)
+    logging.info(
+        "Backfill of %s: %d files, %d already completed, %d pending.",
+        root,
+        len(files),
+        len(files) - len(pending),
+        len(pending),
+    )
+    if not pending:
+        return 0
+
+    started = time.perf_counter()
+    element_sets = inserted = failed = 0
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(db_connection_string,),
+    ) as pool:
+        futures = {
+            pool.submit(_backfill_file, str(root), path, batch_size): path
+            for path in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                file_element_sets, file_inserted = future.result()
+            except Exception:
+                failed += 1
+                logging.exception("Backfill of %s failed.", futures[future])
+                continue
+            element_sets += file_element_sets
+            inserted += file_inserted
+            elapsed = time.perf_counter() - started
+            logging.info(
+                "[%d/%d] %s: %d element sets, %d inserted. Total %d (%.0f element sets/s).",
+                done,
+                len(pending),
+                futures[future],
+                file_element_sets,
+                file_inserted,
+                element_sets,
+                element_sets / elapsed if elapsed else 0,
+            )
+
+    logging.info(
+        "Backfill finished in %.1fs: %d element sets, %d inserted, %d files failed.",
+        time.perf_counter() - started,
+        element_sets,
+        inserted,
+        failed,
+    )
+    return inserted
+
+
+def _init_worker(db_connection_string: str):
+    global _worker_engine
+    _worker_engine = _create_engine(db_connection_string)
+
+
+def _backfill_file(directory: str, path: str, batch_size: int) -> tuple[int, int]:
+    elements = read_archive_elements(Path(directory) / path)
+    read = len(elements)
+    elements, positions, velocities = _propagate(path, elements)
+    attempt = 1
+    while True:
+        try:
+            with Session(_worker_engine) as session, session.begin():
+                update_population_rollups(session, elements, "BACKFILL")
+                inserted = bulk_save_or_skip_element_sets(elements, session, batch_size)
+                bulk_save_or_skip_states(
+                    elements, positions, velocities, "CELESTRAK", session, batch_size
+                )
+                record_ingest_run(session, "BACKFILL", inserted)
+                session.add(
+                    BackfillCheckpoint(path=path, element_sets=read, inserted=inserted)
+                )
+            return read, inserted
+        except IntegrityError:
+            # Another worker committed an overlapping element set in the meantime,
+            # the retry skips it as already stored.
+            if attempt == _MAX_ATTEMPTS:
+                raise
+            attempt += 1
+            logging.warning("Backfill of %s conflicted, retrying.", path)
+
+
+def _propagate(
+    path: str, elements: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Archives contain decayed and invalid element sets, the ones SGP4 fails on
+    # are skipped instead of failing the whole file on every resume.
+    errors, positions, velocities = propagate_to_epoch(satrecs_from_records(elements))
+    valid = errors == 0
+    if not valid.all():
+        logging.warning(
+            "Skipping %d of %d element sets of %s, SGP4 failed on them.",
+            len(elements) - valid.sum(),
+            len(elements),
+            path,
+        )
+    return elements[valid], positions[valid], velocities[valid]
+
+
+def _create_engine(db_connection_string: str) -> Engine:
+    if db_connection_string.startswith("sqlite"):
+        # Workers write concurrently, wait for the SQLite write lock instead of failing.
+        return create_engine(db_connection_string, connect_args={"timeout": 300})
+    return create_engine(db_connection_string)
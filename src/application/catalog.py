@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    load_latest_satellite_rows,
+    load_latest_space_object_rows,
+)
+from src.tracker.catalog_snapshot import CatalogSnapshot
+
+
+class CatalogStore:
+    """
+    Holds the current catalog snapshot of the API process.
+    A new snapshot is built when the ingest generation changes and swapped in
+    atomically, requests keep reading the snapshot they started with.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, generation: int) -> CatalogSnapshot:
+        """
+        Returns the snapshot of the given ingest generation, building it if needed.
+
+        Args:
+            db: SQLAlchemy session.
+            generation: Current ingest generation.
+
+        Returns:
+            CatalogSnapshot: Current snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.generation == generation:
+            return snapshot
+        # Only one request rebuilds, the others wait and reuse its snapshot.
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.generation != generation:
+                snapshot = self.refresh(db, generation)
+        return snapshot
+
+    def refresh(self, db: Session, generation: int) -> CatalogSnapshot:
+        """
+        Builds a snapshot from the database and swaps it in.
+
+        Args:
+            db: SQLAlchemy session.
+            generation: Ingest generation of the stored data.
+
+        Returns:
+            CatalogSnapshot: New snapshot.
+        """
+        started = time.perf_counter()
+        snapshot = CatalogSnapshot.from_rows(
+            generation,
+            *load_latest_satellite_rows(db),
+            *load_latest_space_object_rows(db),
+        )
+        self._snapshot = snapshot
+        logging.info(
+            "Catalog snapshot of generation %d built in %.3fs: %d satellites, %d space objects, %d bytes.",
+            generation,
+            time.perf_counter() - started,
+            len(snapshot.satellites),
+            len(snapshot.space_objects),
+            snapshot.satellites.nbytes + snapshot.space_objects.nbytes,
+        )
+        return snapshot
+
+    def clear(self):
+        """
+        Drops the current snapshot.
+        """
+        self._snapshot = None
@@ -0,0 +1,197 @@
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    load_latest_elements,
+    load_orbit_cluster_cells,
+    load_orbit_cluster_member_keys,
+    load_orbit_clusters,
+    record_ingest_run,
+    relabel_orbit_cluster_members,
+    replace_orbit_clusters,
+    save_orbit_cluster_updates,
+)
+from src.application.config import settings
+from src.application.session import SessionLocal, init_engine
+from src.tracker.clustering import FEATURES, NO_CELL, ClusterModel, feature_matrix
+
+
+def cluster_catalog(db: Session) -> ClusterModel:
+    """
+    Clusters the latest element sets of all satellites into orbital regimes and
+    replaces the stored clustering. Grid cell size and density threshold come
+    from settings, incremental assignment uses the same ones. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+
+    Returns:
+        ClusterModel: Fitted model.
+    """
+    rows = load_latest_elements(db)
+    norad_cat_ids, epochs, features = _features(rows)
+    model, labels = ClusterModel.fit(
+        features,
+        tuple(settings.cluster_cell_size),
+        settings.cluster_min_points,
+    )
+    replace_orbit_clusters(
+        db,
+        _cell_rows(model, model.keys),
+        _member_rows(norad_cat_ids, epochs, features, labels, model),
+    )
+    return model
+
+
+def load_cluster_model(db: Session) -> Optional[ClusterModel]:
+    """
+    Loads the stored clustering model, None if the catalog was never clustered.
+    """
+    rows = load_orbit_cluster_cells(db)
+    if not rows:
+        return None
+    keys, counts, labels = (np.array(column, dtype=np.int64) for column in zip(*rows))
+    return ClusterModel(
+        tuple(settings.cluster_cell_size),
+        settings.cluster_min_points,
+        keys,
+        counts,
+        labels,
+    )
+
+
+def assign_to_clusters(db: Session, elements: np.ndarray) -> int:
+    """
+    Incrementally assigns newly ingested element sets to the stored clusters,
+    without re-clustering the catalog. Stored members of cells that changed
+    cluster, because a cell became dense, are relabeled. Objects with elements
+    outside the clustering grid are unclustered. No-op if the catalog was never
+    clustered. Does not commit, should run in the ingest transaction.
+
+    Args:
+        db: SQLAlchemy session.
+        elements: Ingested element sets, structured array with ELEMENT_DTYPES fields.
+
+    Returns:
+        int: Number of assigned objects.
+    """
+    model = load_cluster_model(db)
+    if model is None or not len(elements):
+        return 0
+    # Latest element set of each object.
+    order = np.lexsort((elements["epoch"], elements["norad_cat_id"]))
+    latest = elements[order]
+    last = np.append(latest["norad_cat_id"][1:] != latest["norad_cat_id"][:-1], True)
+    latest = latest[last]
+    rows = list(
+        zip(
+            latest["norad_cat_id"].tolist(),
+            latest["epoch"].tolist(),
+            latest["mean_motion"].tolist(),
+            latest["inclination"].tolist(),
+            latest["ra_of_asc_node"].tolist(),
+            latest["eccentricity"].tolist(),
+        )
+    )
+    norad_cat_ids, epochs, features = _features(rows)
+
+    member_keys = load_orbit_cluster_member_keys(db, norad_cat_ids)
+    previous_keys = np.array(
+        [member_keys.get(i, NO_CELL) for i in norad_cat_ids], dtype=np.int64
+    )
+    labels, relabeled = model.assign(features, previous_keys)
+    touched = np.union1d(previous_keys, model.cell_keys(features))
+    touched = touched[touched != NO_CELL]
+    relabel_orbit_cluster_members(
+        db, dict(zip(relabeled.tolist(), model.cell_labels(relabeled).tolist()))
+    )
+    save_orbit_cluster_updates(
+        db,
+        _cell_rows(model, touched),
+        _member_rows(norad_cat_ids, epochs, features, labels, model),
+    )
+    return len(norad_cat_ids)
+
+
+def run_clustering(db_connection_string: Optional[str] = None):
+    """
+    Re-clusters the whole catalog into orbital regimes and logs the largest clusters.
+    Ingest runs keep the clustering up to date incrementally, a periodic full run
+    merges and splits clusters that drifted.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+        ],
+    )
+    init_engine(db_connection_string)
+    started = time.perf_counter()
+    with SessionLocal() as session, session.begin():
+        cluster_catalog(session)
+        # Clustering is served by read endpoints, invalidate their caches.
+        record_ingest_run(session, "CLUSTERING", 0)
+        clusters = load_orbit_clusters(session)
+    logging.info(
+        "Clustered catalog into %d clusters in %.3fs.",
+        len(clusters),
+        time.perf_counter() - started,
+    )
+    for cluster, size, semi_major_axis, inclination, eccentricity in clusters[:10]:
+        logging.info(
+            "Cluster %d: %d objects, a %.0f km, i %.1f deg, e %.4f",
+            cluster,
+            size,
+            semi_major_axis,
+            inclination,
+            eccentricity,
+        )
+
+
+def _features(rows: list[tuple]) -> tuple[list[int], list, np.ndarray]:
+    # Rows of (norad_cat_id, epoch, mean_motion, inclination, raan, eccentricity).
+    if not rows:
+        return [], [], np.empty((0, len(FEATURES)))
+    norad_cat_ids, epochs, *elements = zip(*rows)
+    return (
+        list(norad_cat_ids),
+        list(epochs),
+        feature_matrix(*(np.array(column, dtype=float) for column in elements)),
+    )
+
+
+def _cell_rows(model: ClusterModel, keys: np.ndarray) -> list[dict]:
+    rows = np.searchsorted(model.keys, keys)
+    return [
+        {"key": int(key), "count": int(count), "cluster": int(cluster)}
+        for key, count, cluster in zip(keys, model.counts[rows], model.labels[rows])
+    ]
+
+
+def _member_rows(
+    norad_cat_ids: list[int],
+    epochs: list,
+    features: np.ndarray,
+    labels: np.ndarray,
+    model: ClusterModel,
+) -> list[dict]:
+    keys = model.cell_keys(features)
+    return [
+        {
+            "norad_cat_id": norad_cat_id,
+            "epoch": epoch,
+            "cluster": int(label),
+            "cell_key": int(key),
+            **dict(zip(FEATURES, map(float, feature))),
+        }
+        for norad_cat_id, epoch, feature, label, key in zip(
+            norad_cat_ids, epochs, features, labels, keys
+        )
+    ]
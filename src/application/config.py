@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +10,27 @@ class Settings(BaseSettings):
         extra="ignore",
     )
     db_connection_string: str = "sqlite:///space_objects.db"
+    # Celestrak element set format of ingest runs: "csv", "tle" or "json".
+    celestrak_format: str = "csv"
+    history_full_resolution_days: int = 90
+    history_retention_days: Optional[int] = None
+    history_archive_dir: Optional[str] = None
+    response_cache_max_entries: int = 1024
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+    response_cache_check_interval: float = 1.0
+    # Orbital-regime clustering grid: km, deg, deg, eccentricity.
+    cluster_cell_size: tuple[float, float, float, float] = (25.0, 0.5, 5.0, 0.005)
+    cluster_min_points: int = 5
+    stream_max_pending_frames: int = 4
+    stream_max_objects: int = 50000
+    stream_refresh_interval: float = 10.0
+    batch_max_ids: int = 10000
+    ground_track_max_objects: int = 100
+    ground_track_max_points: int = 100000
+    # Watchlist proximity screening window after each ingest run: hours, seconds.
+    watchlist_proximity_hours: float = 6.0
+    watchlist_proximity_step: float = 60.0
+    watchlist_webhook_timeout: float = 10.0
 
 
 settings = Settings()
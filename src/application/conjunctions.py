@@ -0,0 +1,225 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import load_latest_satellites, save_conjunctions
+from src.application.session import SessionLocal, init_engine
+from src.tracker.collision import (
+    DEFAULT_HARD_BODY_RADIUS_KM,
+    closest_approach,
+    collision_probability_2d,
+    collision_probability_monte_carlo,
+    encounter_plane,
+    position_covariance,
+)
+from src.tracker.propagation import (
+    julian_dates,
+    propagate,
+    satellite_to_omm,
+    satrec_from_omm,
+    to_datetime64,
+)
+from src.tracker.schema.base_model import utc_now
+from src.tracker.schema.conjunction import Conjunction
+
+
+def assess_conjunctions(
+    db: Session,
+    pairs: list[tuple[int, int]],
+    start: datetime,
+    hours: float = 24.0,
+    step_seconds: float = 60.0,
+    hard_body_radius: float = DEFAULT_HARD_BODY_RADIUS_KM,
+    monte_carlo_samples: int = 0,
+    rng: Optional[np.random.Generator] = None,
+) -> list[Conjunction]:
+    """
+    Finds the closest approach of each object pair within a time window from
+    their latest element sets and computes the probability of collision,
+    vectorized over all pairs. Results are saved.
+
+    Args:
+        db: SQLAlchemy session.
+        pairs: Pairs of primary and secondary NORAD IDs.
+        start: Start of the screening window (UTC).
+        hours: Length of the screening window in hours.
+        step_seconds: Propagation step of the screening grid in seconds.
+        hard_body_radius: Combined hard body radius in kilometers.
+        monte_carlo_samples: Monte Carlo samples per conjunction, 0 skips Monte Carlo.
+        rng: Random generator for Monte Carlo sampling.
+
+    Returns:
+        list[Conjunction]: Saved conjunctions. Pairs of an object with itself,
+        with unknown objects or with element sets SGP4 fails on are skipped.
+    """
+    if any(a == b for a, b in pairs):
+        logging.warning(
+            "Skipping pairs of an object with itself: %s.",
+            sorted({a for a, b in pairs if a == b}),
+        )
+        pairs = [(a, b) for a, b in pairs if a != b]
+    satellites = {
+        sat.norad_cat_id: sat
+        for sat in load_latest_satellites(
+            db, sorted({i for pair in pairs for i in pair})
+        )
+    }
+    missing = {i for pair in pairs for i in pair} - satellites.keys()
+    if missing:
+        logging.warning("No element sets for NORAD IDs %s.", sorted(missing))
+    pairs = [pair for pair in pairs if not set(pair) & missing]
+    if not pairs:
+        return []
+
+    ids = list(satellites)
+    row = {norad_cat_id: i for i, norad_cat_id in enumerate(ids)}
+    satrecs = [satrec_from_omm(satellite_to_omm(satellites[i])) for i in ids]
+    primary = np.array([row[a] for a, _ in pairs])
+    secondary = np.array([row[b] for _, b in pairs])
+
+    start64 = to_datetime64([start])[0]
+    steps = np.arange(0.0, hours * 3600.0 + step_seconds, step_seconds)
+    times = start64 + (steps * 1e6).astype("timedelta64[us]")
+    errors, positions, velocities = propagate(satrecs, times)
+    # Decayed or invalid element sets propagate to NaN, their pairs are skipped.
+    valid = _skip_failed(
+        pairs, ~errors.any(axis=1)[primary] & ~errors.any(axis=1)[secondary]
+    )
+    pairs, primary, secondary = _select(valid, pairs, primary, secondary)
+    if not pairs:
+        return []
+    index, offset = closest_approach(
+        times,
+        positions[secondary] - positions[primary],
+        velocities[secondary] - velocities[primary],
+    )
+    tca = times[index] + (offset * 1e6).astype("timedelta64[us]")
+
+    errors1, r1, v1 = _propagate_each(satrecs, primary, tca)
+    errors2, r2, v2 = _propagate_each(satrecs, secondary, tca)
+    valid = _skip_failed(pairs, (errors1 == 0) & (errors2 == 0))
+    pairs, primary, secondary, tca, r1, v1, r2, v2 = _select(
+        valid, pairs, primary, secondary, tca, r1, v1, r2, v2
+    )
+    if not pairs:
+        return []
+    epochs = to_datetime64([satellites[i].epoch for i in ids])
+    bstar = np.array([satellites[i].bstar for i in ids])
+    covariances = position_covariance(
+        r1, v1, _days(tca - epochs[primary]), bstar[primary]
+    ) + position_covariance(r2, v2, _days(tca - epochs[secondary]), bstar[secondary])
+
+    miss, plane_covariances = encounter_plane(r2 - r1, v2 - v1, covariances)
+    probability = collision_probability_2d(miss, plane_covariances, hard_body_radius)
+    probability_monte_carlo = (
+        collision_probability_monte_carlo(
+            r2 - r1, v2 - v1, covariances, hard_body_radius, monte_carlo_samples, rng
+        )
+        if monte_carlo_samples
+        else None
+    )
+
+    conjunctions = [
+        Conjunction(
+            primary_id=a,
+            primary_epoch=satellites[a].epoch,
+            secondary_id=b,
+            secondary_epoch=satellites[b].epoch,
+            tca=tca[k].astype(datetime),
+            miss_distance=float(np.linalg.norm(r2[k] - r1[k])),
+            relative_speed=float(np.linalg.norm(v2[k] - v1[k])),
+            hard_body_radius=hard_body_radius,
+            probability=float(probability[k]),
+            probability_monte_carlo=(
+                float(probability_monte_carlo[k])
+                if probability_monte_carlo is not None
+                else None
+            ),
+            monte_carlo_samples=monte_carlo_samples or None,
+        )
+        for k, (a, b) in enumerate(pairs)
+    ]
+    save_conjunctions(conjunctions, db)
+    return conjunctions
+
+
+def run_conjunction_assessment(
+    pairs: list[tuple[int, int]],
+    hours: float = 24.0,
+    step_seconds: float = 60.0,
+    hard_body_radius: float = DEFAULT_HARD_BODY_RADIUS_KM,
+    monte_carlo_samples: int = 0,
+):
+    """
+    Assesses conjunctions of the given object pairs over the next hours and logs them.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+        ],
+    )
+    init_engine()
+    with SessionLocal() as session:
+        conjunctions = assess_conjunctions(
+            session,
+            pairs,
+            utc_now(),
+            hours,
+            step_seconds,
+            hard_body_radius,
+            monte_carlo_samples,
+        )
+        for conjunction in conjunctions:
+            logging.info(
+                "%d - %d: TCA %s, miss distance %.3f km, Pc %.3e, Pc (Monte Carlo) %s",
+                conjunction.primary_id,
+                conjunction.secondary_id,
+                conjunction.tca.isoformat(),
+                conjunction.miss_distance,
+                conjunction.probability,
+                conjunction.probability_monte_carlo,
+            )
+
+
+def _propagate_each(
+    satrecs: list, rows: np.ndarray, times: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Each conjunction has its own TCA, propagate per satellite over its TCAs.
+    errors = np.empty(len(rows), dtype=np.uint8)
+    positions = np.empty((len(rows), 3))
+    velocities = np.empty((len(rows), 3))
+    jd, fr = julian_dates(times)
+    for satellite in np.unique(rows):
+        mask = rows == satellite
+        e, r, v = satrecs[satellite].sgp4_array(jd[mask], fr[mask])
+        errors[mask] = e
+        positions[mask] = r
+        velocities[mask] = v
+    return errors, positions, velocities
+
+
+def _skip_failed(pairs: list[tuple[int, int]], valid: np.ndarray) -> np.ndarray:
+    if not valid.all():
+        logging.warning(
+            "SGP4 propagation failed, skipping pairs %s.",
+            [pair for pair, ok in zip(pairs, valid.tolist()) if not ok],
+        )
+    return valid
+
+
+def _select(valid: np.ndarray, pairs: list, *arrays: np.ndarray) -> tuple:
+    return (
+        [pair for pair, ok in zip(pairs, valid.tolist()) if ok],
+        *(array[valid] for array in arrays),
+    )
+
+
+def _days(delta: np.ndarray) -> np.ndarray:
+    return delta / np.timedelta64(1, "D")
@@ -0,0 +1,170 @@
+import csv
+import io
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+from sgp4.exporter import export_tle
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.adapters.data_source_api import (
+    extract_satellite_data,
+    extract_space_object_data,
+    extract_states,
+)
+from src.adapters.database_storage import (
+    bulk_save_or_skip_element_sets,
+    bulk_save_or_skip_satellites,
+    bulk_save_or_skip_space_objects,
+    bulk_save_or_skip_states,
+)
+from src.adapters.element_formats import ELEMENT_DTYPES, element_array, read_elements
+from src.application.session import init_schema
+from src.tracker.propagation import satrecs_from_records
+
+
+def benchmark_formats(count: int = 10000, seed: int = 0) -> dict[str, dict]:
+    """
+    Compares ingest of a synthetic catalog in the Celestrak JSON, CSV and TLE
+    formats: the legacy path (OMM dictionaries and Pydantic models) against
+    the element set array path. Parsing includes the SGP4 states at epoch,
+    saving goes to an in-memory SQLite database. Prints a table of the results.
+
+    Args:
+        count (int): Number of element sets.
+        seed (int): Random seed of the synthetic catalog.
+
+    Returns:
+        dict[str, dict]: Parse and save time in seconds and peak parse memory in
+        bytes, by path name.
+    """
+    texts = synthetic_catalog(count, seed)
+    paths: dict[str, tuple[Callable, Callable]] = {
+        "json (dicts)": (
+            lambda: _parse_legacy(texts["json"]),
+            _save_legacy,
+        ),
+        **{
+            f"{format} (arrays)": (
+                lambda format=format: _parse_elements(texts[format], format),
+                _save_elements,
+            )
+            for format in ("json", "csv", "tle")
+        },
+    }
+
+    results = {}
+    print(f"{'path':<16}{'parse s':>10}{'save s':>10}{'peak MiB':>10}")
+    for name, (parse, save) in paths.items():
+        # The traced run also warms up lazy imports before the timed one.
+        tracemalloc.start()
+        parse()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        parsed = parse()
+        parse_time = time.perf_counter() - started
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        init_schema(engine)
+        with Session(engine) as session, session.begin():
+            started = time.perf_counter()
+            save(parsed, session)
+            save_time = time.perf_counter() - started
+        engine.dispose()
+
+        results[name] = {"parse": parse_time, "save": save_time, "peak": peak}
+        print(f"{name:<16}{parse_time:>10.3f}{save_time:>10.3f}{peak / 2**20:>10.1f}")
+    return results
+
+
+def synthetic_catalog(count: int, seed: int = 0) -> dict[str, str]:
+    """
+    Generates a random LEO to GEO catalog rendered in the Celestrak formats.
+
+    Args:
+        count (int): Number of element sets.
+        seed (int): Random seed.
+
+    Returns:
+        dict[str, str]: Catalog text by format name ("json", "csv", "tle").
+    """
+    rng = np.random.default_rng(seed)
+    norad_cat_ids = np.arange(1, count + 1)
+    epochs = np.datetime64("2024-01-01", "us") + rng.integers(
+        0, 86400_000000, count
+    ).astype("timedelta64[us]")
+    elements = element_array(
+        {
+            "object_name": np.char.add("OBJECT ", norad_cat_ids.astype(str)),
+            "object_id": [f"2024-{i % 1000:03d}A" for i in norad_cat_ids.tolist()],
+            "epoch": epochs,
+            "mean_motion": rng.uniform(1.0, 16.0, count).round(8),
+            "eccentricity": rng.uniform(0.0, 0.02, count).round(7),
+            "inclination": rng.uniform(0.0, 110.0, count).round(4),
+            "ra_of_asc_node": rng.uniform(0.0, 360.0, count).round(4),
+            "arg_of_pericenter": rng.uniform(0.0, 360.0, count).round(4),
+            "mean_anomaly": rng.uniform(0.0, 360.0, count).round(4),
+            "ephemeris_type": np.zeros(count),
+            "classification_type": np.full(count, "U"),
+            "norad_cat_id": norad_cat_ids,
+            "element_set_no": np.full(count, 999),
+            "rev_at_epoch": rng.integers(0, 99999, count),
+            "bstar": rng.uniform(0.0, 1e-3, count).round(8),
+            "mean_motion_dot": np.zeros(count),
+            "mean_motion_ddot": np.zeros(count),
+        }
+    )
+    # JSON and CSV carry the values of the TLE, so all formats hold one catalog.
+    tle = "".join(
+        f"{name}\n{line1}\n{line2}\n"
+        for name, (line1, line2) in zip(
+            elements["object_name"].tolist(),
+            map(export_tle, satrecs_from_records(elements)),
+        )
+    )
+    parsed = read_elements(tle, "tle")
+    data = [
+        {
+            **{name.upper(): value for name, value in zip(ELEMENT_DTYPES, row)},
+            "EPOCH": epoch,
+        }
+        for row, epoch in zip(
+            parsed[list(ELEMENT_DTYPES)].tolist(),
+            np.datetime_as_string(parsed["epoch"], unit="us").tolist(),
+        )
+    ]
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(data[0]))
+    writer.writeheader()
+    writer.writerows(data)
+    return {"json": json.dumps(data), "csv": buffer.getvalue(), "tle": tle}
+
+
+def _parse_legacy(text: str) -> tuple[list, list]:
+    data = json.loads(text)
+    return extract_satellite_data(data), extract_space_object_data(data)
+
+
+def _save_legacy(parsed: tuple[list, list], db: Session):
+    satellites, space_objects = parsed
+    bulk_save_or_skip_satellites(satellites, db)
+    bulk_save_or_skip_space_objects(space_objects, db)
+
+
+def _parse_elements(
+    text: str, format: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    elements = read_elements(text, format)
+    return (elements, *extract_states(elements))
+
+
+def _save_elements(parsed: tuple[np.ndarray, np.ndarray, np.ndarray], db: Session):
+    elements, positions, velocities = parsed
+    bulk_save_or_skip_element_sets(elements, db)
+    bulk_save_or_skip_states(elements, positions, velocities, "CELESTRAK", db)
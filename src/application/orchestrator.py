@@ -1,20 +1,24 @@
 import logging
-import os
 
 from dotenv import load_dotenv
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.adapters.data_source_api import (
-    extract_satellite_data,
-    extract_space_object_data,
-    get_satellite_data,
-    space_object_to_df,
+from src.adapters.data_source_api import extract_states, get_element_sets, states_to_df
+from src.adapters.database_storage import (
+    bulk_save_or_skip_element_sets,
+    bulk_save_or_skip_states,
+    load_space_objects,
+    record_ingest_run,
 )
-from src.adapters.database_storage import load_space_objects, save_or_skip
-from src.tracker.schema.base_model import Base
-from src.tracker.schema.satellite import Satellite
-from src.tracker.schema.space_object import SpaceObject
+from src.application.clustering import assign_to_clusters
+from src.application.config import settings
+from src.application.population_stats import update_population_rollups
+from src.application.session import SessionLocal, init_engine
+from src.application.watchlists import (
+    dispatch_alerts,
+    evaluate_watchlists,
+    find_watchlist_changes,
+)
+from src.tracker.schema.base_model import utc_now
 
 
 def run_tracker():
@@ -31,37 +35,27 @@ def run_tracker():
         ],
     )
 
-    engine = _init_db()
-
-    satellites_json = get_satellite_data()
-    satellites = extract_satellite_data(satellites_json)
-    space_objects = extract_space_object_data(satellites_json)
-    session_local = sessionmaker(
-        autocommit=False, autoflush=False, bind=engine, future=True
-    )
-    session = session_local()
-
-    save_or_skip(
-        [SpaceObject(**space_object.model_dump()) for space_object in space_objects],
-        session,
-    )
-    save_or_skip(
-        [Satellite(**satellite.model_dump()) for satellite in satellites], session
-    )
+    init_engine()
+
+    elements = get_element_sets(settings.celestrak_format)
+    positions, velocities = extract_states(elements)
+    session = SessionLocal()
+
+    with session.begin():
+        update_population_rollups(session, elements, "CELESTRAK")
+        changes = find_watchlist_changes(session, elements)
+        inserted = bulk_save_or_skip_element_sets(elements, session)
+        bulk_save_or_skip_states(elements, positions, velocities, "CELESTRAK", session)
+        assign_to_clusters(session, elements)
+        record_ingest_run(session, "CELESTRAK", inserted)
+    with session.begin():
+        evaluate_watchlists(session, changes, utc_now())
+    dispatch_alerts(session)
     saved = load_space_objects(session)
     print(len(saved))
-    df = space_object_to_df(space_objects)
+    df = states_to_df(elements, positions, velocities)
     print(df.head())
 
 
-def _init_db() -> Engine:
-    DB_CONNECTION_STRING = os.getenv(
-        "DB_CONNECTION_STRING", "sqlite:///space_objects.db"
-    )
-    engine = create_engine(DB_CONNECTION_STRING, echo=True)
-    Base.metadata.create_all(engine)
-    return engine
-
-
 if __name__ == "__main__":
     run_tracker()
@@ -0,0 +1,85 @@
+from datetime import date
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    add_population_object_days,
+    add_population_rollups,
+    load_population_rollups,
+)
+from src.tracker.population import BUCKETS, population_buckets, rollup_counts
+
+
+def update_population_rollups(db: Session, elements: np.ndarray, source: str) -> int:
+    """
+    Adds the element sets of an ingest run to the daily population rollups.
+    An object is counted once per day, in the buckets of its first ingested
+    element set of that day. Only the ingested element sets are classified.
+    Counted object days are stored, the database skips the ones already
+    counted, also by a concurrent ingest run. Should run in the ingest
+    transaction, so the counts commit with the element sets.
+
+    Args:
+        db: SQLAlchemy session.
+        elements: Ingested element sets, structured array with ELEMENT_DTYPES fields.
+        source: Ingest source.
+
+    Returns:
+        int: Number of newly counted object days.
+    """
+    if not len(elements):
+        return 0
+    # Earliest element set of each object and day in the run.
+    elements = elements[np.lexsort((elements["epoch"], elements["norad_cat_id"]))]
+    days = elements["epoch"].astype("M8[D]")
+    first = np.ones(len(elements), dtype=bool)
+    first[1:] = (elements["norad_cat_id"][1:] != elements["norad_cat_id"][:-1]) | (
+        days[1:] != days[:-1]
+    )
+    elements, days = elements[first], days[first]
+
+    keys = list(zip(elements["norad_cat_id"].tolist(), days.tolist()))
+    counted = set(add_population_object_days(db, keys))
+    new = np.array([key in counted for key in keys], dtype=bool)
+    elements, days = elements[new], days[new]
+
+    buckets = population_buckets(
+        elements["mean_motion"], elements["inclination"], elements["eccentricity"]
+    )
+    add_population_rollups(
+        db,
+        [
+            {
+                "day": day,
+                "source": source,
+                "dimension": dimension,
+                "bucket": bucket,
+                "count": count,
+            }
+            for day, dimension, bucket, count in rollup_counts(days, buckets)
+        ],
+    )
+    return len(elements)
+
+
+def load_population_stats(
+    db: Session,
+    dimension: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    source: Optional[str] = None,
+) -> list[tuple]:
+    """
+    Loads daily population counts of a dimension, ordered by day and bucket
+    in BUCKETS order.
+
+    Returns:
+        list[tuple]: Rows of (day, bucket, count).
+    """
+    order = {bucket: i for i, bucket in enumerate(BUCKETS[dimension])}
+    return sorted(
+        load_population_rollups(db, dimension, start, end, source),
+        key=lambda row: (row.day, order.get(row.bucket, len(order))),
+    )
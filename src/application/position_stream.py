@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import struct
+import time
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from src.tracker.catalog_snapshot import CatalogSnapshot
+
+if TYPE_CHECKING:
+    from sgp4.api import Satrec
+
+# Supported update intervals in seconds, each has one shared propagation tick.
+STREAM_INTERVALS = (0.5, 1.0, 5.0, 10.0, 60.0)
+
+# Binary frame: little-endian header (unix time in seconds, object count)
+# followed by one FRAME_DTYPE record per object, TEME km and km/s.
+FRAME_HEADER = struct.Struct("<dI")
+FRAME_DTYPE = np.dtype(
+    [
+        ("norad_cat_id", "<i4"),
+        ("x", "<f4"),
+        ("y", "<f4"),
+        ("z", "<f4"),
+        ("vx", "<f4"),
+        ("vy", "<f4"),
+        ("vz", "<f4"),
+    ]
+)
+
+
+def stream_interval(requested: float) -> float:
+    """
+    Returns the fastest supported update interval not faster than the requested one.
+    """
+    for interval in STREAM_INTERVALS:
+        if interval >= requested:
+            return interval
+    return STREAM_INTERVALS[-1]
+
+
+def pack_frame(
+    timestamp: float,
+    norad_cat_ids: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+) -> bytes:
+    """
+    Packs propagated positions into a binary frame.
+
+    Args:
+        timestamp (float): Unix time of the positions in seconds.
+        norad_cat_ids (np.ndarray): NORAD IDs (N,).
+        positions (np.ndarray): TEME positions in km (N, 3).
+        velocities (np.ndarray): TEME velocities in km/s (N, 3).
+
+    Returns:
+        bytes: Header followed by FRAME_DTYPE records.
+    """
+    records = np.empty(len(norad_cat_ids), dtype=FRAME_DTYPE)
+    records["norad_cat_id"] = norad_cat_ids
+    for axis, name in enumerate("xyz"):
+        records[name] = positions[:, axis]
+        records[f"v{name}"] = velocities[:, axis]
+    return FRAME_HEADER.pack(timestamp, len(records)) + records.tobytes()
+
+
+def unpack_frame(frame: bytes) -> tuple[float, np.ndarray]:
+    """
+    Unpacks a binary frame into its unix time and FRAME_DTYPE records.
+    """
+    timestamp, count = FRAME_HEADER.unpack_from(frame)
+    return timestamp, np.frombuffer(
+        frame, dtype=FRAME_DTYPE, count=count, offset=FRAME_HEADER.size
+    )
+
+
+class StreamClient:
+    """
+    Subscriber of the live position stream.
+    Frames wait in a bounded queue, if the client falls behind the oldest pending
+    frame is dropped so it always receives the latest positions.
+    """
+
+    def __init__(self, max_pending: int = 4):
+        self.frames: asyncio.Queue[bytes] = asyncio.Queue(max_pending)
+        self.norad_cat_ids = np.empty(0, dtype=np.int64)
+        self.satrecs: list["Satrec"] = []
+        self.interval: Optional[float] = None
+        self.dropped = 0
+
+    def offer(self, frame: bytes):
+        """
+        Queues a frame, dropping the oldest pending frame if the queue is full.
+        """
+        if self.frames.full():
+            self.frames.get_nowait()
+            self.dropped += 1
+        self.frames.put_nowait(frame)
+
+
+class PositionStream:
+    """
+    Propagates subscribed objects and fans frames out to subscribers.
+    Clients with the same update interval share one tick: the union of their
+    objects is propagated once per tick and each client gets its own rows.
+    """
+
+    def __init__(self):
+        self._clients: dict[float, set[StreamClient]] = {}
+        self._tickers: dict[float, asyncio.Task] = {}
+        self._satrecs: dict[int, "Satrec"] = {}
+        self._generation: Optional[int] = None
+
+    async def subscribe(
+        self,
+        client: StreamClient,
+        snapshot: CatalogSnapshot,
+        norad_cat_ids: np.ndarray,
+        interval: float,
+    ):
+        """
+        Replaces the subscription of a client, starting the tick of its interval
+        if needed. Satellite records are built from the catalog snapshot in a
+        worker thread, off the event loop.
+
+        Args:
+            client: Subscriber.
+            snapshot: Current catalog snapshot.
+            norad_cat_ids: NORAD IDs to stream, unknown ones are ignored.
+            interval: Supported update interval in seconds.
+        """
+        ids = np.unique(np.asarray(norad_cat_ids, dtype=np.int64))
+        ids = ids[np.isin(ids, snapshot.satellites["norad_cat_id"])]
+        satrecs = await asyncio.to_thread(self._satrecs_for, snapshot, ids)
+        self.unsubscribe(client)
+        client.norad_cat_ids = ids
+        client.satrecs = satrecs
+        client.interval = interval
+        self._clients.setdefault(interval, set()).add(client)
+        if interval not in self._tickers:
+            self._tickers[interval] = asyncio.create_task(self._run(interval))
+
+    def unsubscribe(self, client: StreamClient):
+        """
+        Removes a client, stopping the tick of its interval if it was the last one.
+        """
+        clients = self._clients.get(client.interval)
+        if clients is None:
+            return
+        clients.discard(client)
+        if not clients:
+            del self._clients[client.interval]
+            ticker = self._tickers.pop(client.interval, None)
+            if ticker is not None:
+                ticker.cancel()
+
+    async def tick(self, interval: float, timestamp: float):
+        """
+        Propagates the objects of all clients of an interval once and queues
+        a frame for each client.
+
+        Args:
+            interval: Update interval in seconds.
+            timestamp: Unix time to propagate to.
+        """
+        clients = list(self._clients.get(interval, ()))
+        # SGP4 is imported on first use to keep API startup fast.
+        from src.tracker.propagation import propagate
+
+        satrecs: dict[int, "Satrec"] = {}
+        for client in clients:
+            satrecs.update(zip(client.norad_cat_ids.tolist(), client.satrecs))
+        if not satrecs:
+            return
+        ids = np.fromiter(satrecs, dtype=np.int64, count=len(satrecs))
+        order = np.argsort(ids)
+        records = [satrecs[i] for i in ids[order].tolist()]
+        ids = ids[order]
+        time64 = np.datetime64(int(timestamp * 1e6), "us")
+        _, positions, velocities = await asyncio.to_thread(
+            propagate, records, np.array([time64])
+        )
+        for client in clients:
+            rows = np.searchsorted(ids, client.norad_cat_ids)
+            client.offer(
+                pack_frame(
+                    timestamp,
+                    client.norad_cat_ids,
+                    positions[rows, 0],
+                    velocities[rows, 0],
+                )
+            )
+
+    async def close(self):
+        """
+        Stops all ticks.
+        """
+        tickers = list(self._tickers.values())
+        for ticker in tickers:
+            ticker.cancel()
+        await asyncio.gather(*tickers, return_exceptions=True)
+        self._tickers.clear()
+        self._clients.clear()
+
+    async def _run(self, interval: float):
+        while True:
+            # Ticks are aligned to wall clock multiples of the interval.
+            await asyncio.sleep(interval - time.time() % interval)
+            try:
+                await self.tick(interval, round(time.time() / interval) * interval)
+            except Exception:
+                logging.exception("Position stream tick of %ss failed.", interval)
+
+    def _satrecs_for(
+        self, snapshot: CatalogSnapshot, ids: np.ndarray
+    ) -> list["Satrec"]:
+        from src.tracker.propagation import satrecs_from_records
+
+        # Satellite records are cached per ingest generation, shared by all clients.
+        # Runs in worker threads, a concurrent generation change swaps the cache
+        # but this call keeps using the one it started with.
+        if snapshot.generation != self._generation:
+            self._satrecs = {}
+            self._generation = snapshot.generation
+        cache = self._satrecs
+        missing = [i for i in ids.tolist() if i not in cache]
+        if missing:
+            rows = [snapshot.satellite_index[i] for i in missing]
+            cache.update(zip(missing, satrecs_from_records(snapshot.satellites[rows])))
+        return [cache[i] for i in ids.tolist()]
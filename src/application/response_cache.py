@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Protocol
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import load_ingest_generation
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Pre-serialized response body.
+
+    Attributes:
+        body (bytes): Serialized JSON body.
+        etag (str): Entity tag of the body.
+    """
+
+    body: bytes
+    etag: str
+
+
+class CacheBackend(Protocol):
+    """
+    Storage of cached responses, the in-process LRU by default.
+    """
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Returns the cached response or None."""
+
+    def set(self, key: Hashable, value: CachedResponse):
+        """Stores a response."""
+
+    def clear(self):
+        """Removes all cached responses."""
+
+
+class LRUCacheBackend:
+    """
+    Thread safe in-process LRU cache bounded by number of entries and total body size.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: CachedResponse):
+        if len(value.body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = value
+            self._size += len(value.body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Caches serialized responses of read endpoints keyed by endpoint and normalized
+    query parameters. Cached data is valid for one ingest generation, the generation
+    is read from the database at most once per check_interval seconds.
+    """
+
+    def __init__(self, backend: CacheBackend, check_interval: float = 1.0):
+        self.backend = backend
+        self.check_interval = check_interval
+        self._generation = 0
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def generation(self, db: Session) -> int:
+        """
+        Returns the current ingest generation, clearing the cache if it changed.
+        """
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        ):
+            return self._generation
+        generation = load_ingest_generation(db)
+        with self._lock:
+            if generation != self._generation:
+                self.backend.clear()
+                self._generation = generation
+            self._checked_at = now
+        return generation
+
+    def respond(
+        self,
+        request: Request,
+        db: Session,
+        params: dict,
+        render: Callable[[], bytes],
+    ) -> Response:
+        """
+        Returns the cached response for the request, rendering and caching it on a miss.
+        Answers 304 Not Modified if If-None-Match matches the cached entity tag.
+
+        Args:
+            request: Incoming request.
+            db: SQLAlchemy session.
+            params: Parsed query parameters the response depends on.
+            render: Produces the serialized JSON body.
+
+        Returns:
+            Response: JSON or 304 response with ETag header.
+        """
+        key = self._key(request, db, params)
+        cached = self.backend.get(key)
+        if cached is None:
+            cached = self._store(key, render())
+        return _response(request, cached)
+
+    async def respond_async(
+        self,
+        request: Request,
+        db: Session,
+        params: dict,
+        render: Callable[[], bytes],
+    ) -> Response:
+        """
+        Like respond, but renders a cache miss in a worker thread, for responses
+        too expensive to compute on the event loop.
+
+        Args:
+            request: Incoming request.
+            db: SQLAlchemy session.
+            params: Parsed query parameters the response depends on.
+            render: Produces the serialized JSON body, called in a worker thread.
+
+        Returns:
+            Response: JSON or 304 response with ETag header.
+        """
+        key = self._key(request, db, params)
+        cached = self.backend.get(key)
+        if cached is None:
+            cached = self._store(key, await asyncio.to_thread(render))
+        return _response(request, cached)
+
+    def clear(self):
+        """
+        Clears cached responses and forces a generation check on the next request.
+        """
+        with self._lock:
+            self.backend.clear()
+            self._checked_at = None
+
+    def _key(self, request: Request, db: Session, params: dict) -> tuple:
+        # The generation comes first, it is part of the entity tag.
+        return (
+            self.generation(db),
+            request.url.path,
+            tuple(sorted(params.items())),
+        )
+
+    def _store(self, key: tuple, body: bytes) -> CachedResponse:
+        generation, *_ = key
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        cached = CachedResponse(body=body, etag=f'"{generation}-{digest}"')
+        self.backend.set(key, cached)
+        return cached
+
+
+def _response(request: Request, cached: CachedResponse) -> Response:
+    headers = {"ETag": cached.etag}
+    if _none_match(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _none_match(value: Optional[str], etag: str) -> bool:
+    # If-None-Match with weak comparison (RFC 9110 13.1.2): "*" or a comma
+    # separated list of entity tags, W/ prefixes are ignored.
+    if not value:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in value.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
@@ -0,0 +1,69 @@
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.adapters.database_maintenance import (
+    add_months,
+    downsample_history,
+    drop_partitions,
+    ensure_partitions,
+    month_start,
+)
+from src.application.config import settings
+from src.tracker.schema.base_model import utc_now
+
+
+def run_retention(
+    db_connection_string: Optional[str] = None,
+    full_resolution_days: Optional[int] = None,
+    retention_days: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+    months_ahead: int = 2,
+):
+    """
+    Runs the history retention policy:
+    creates monthly epoch partitions ahead of time (PostgreSQL),
+    downsamples history older than full_resolution_days to one element set
+    per object per day, and drops (optionally archives) monthly partitions
+    older than retention_days (PostgreSQL).
+
+    Args:
+        db_connection_string (Optional[str]): Database URL, defaults to settings.
+        full_resolution_days (Optional[int]): Days of history kept in full resolution.
+        retention_days (Optional[int]): Days of history kept at all, None keeps everything.
+        archive_dir (Optional[str]): Directory for archives of dropped partitions.
+        months_ahead (int): Number of future monthly partitions to create.
+    """
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+        ],
+    )
+    if full_resolution_days is None:
+        full_resolution_days = settings.history_full_resolution_days
+    if retention_days is None:
+        retention_days = settings.history_retention_days
+    archive_dir = archive_dir or settings.history_archive_dir
+
+    engine = create_engine(db_connection_string or settings.db_connection_string)
+    now = utc_now()
+    with Session(engine) as session:
+        ensure_partitions(
+            session, month_start(now), add_months(month_start(now), months_ahead + 1)
+        )
+        downsample_history(session, now - timedelta(days=full_resolution_days))
+        if retention_days is not None:
+            drop_partitions(
+                session,
+                now - timedelta(days=retention_days),
+                Path(archive_dir) if archive_dir else None,
+            )
+    engine.dispose()
@@ -1,13 +1,77 @@
-from sqlalchemy import create_engine
+from typing import Optional
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.application.config import settings
+from src.tracker.schema.backfill_checkpoint import BackfillCheckpoint  # noqa: F401
+from src.tracker.schema.base_model import Base
+from src.tracker.schema.conjunction import Conjunction  # noqa: F401
+from src.tracker.schema.ingest_run import IngestRun  # noqa: F401
+from src.tracker.schema.orbit_cluster import (  # noqa: F401
+    OrbitClusterCell,
+    OrbitClusterMember,
+)
+from src.tracker.schema.population_rollup import (  # noqa: F401
+    PopulationObjectDay,
+    PopulationRollup,
+)
+from src.tracker.schema.satellite import Satellite  # noqa: F401
+from src.tracker.schema.space_object import SpaceObject  # noqa: F401
+from src.tracker.schema.watchlist import (  # noqa: F401
+    AlertEvent,
+    Watchlist,
+    WatchlistMember,
+)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, future=True)
+
+_engine: Optional[Engine] = None
+
+
+def init_engine(db_connection_string: Optional[str] = None) -> Engine:
+    """
+    Creates the process wide engine on first call and binds SessionLocal to it.
+    Called from lifecycle hooks (API startup, CLI commands) instead of at import.
+
+    Args:
+        db_connection_string: Database URL, defaults to settings.
+
+    Returns:
+        Engine: Process wide engine.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            db_connection_string or settings.db_connection_string, future=True
+        )
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def dispose_engine():
+    """
+    Disposes the process wide engine, a later init_engine creates a new one.
+    """
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+def init_schema(engine: Engine):
+    """
+    Creates missing tables. Run once per deployment ("python src/main.py init-db"),
+    not on every ingest.
 
-engine = create_engine(settings.db_connection_string, future=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+    Args:
+        engine: SQLAlchemy engine.
+    """
+    Base.metadata.create_all(engine)
 
 
 def get_db():
+    init_engine()
     db = SessionLocal()
     try:
         yield db
@@ -0,0 +1,123 @@
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Import and lifespan startup of the API app, what "fastapi run" does before serving.
+_API_STARTUP = """
+import asyncio
+from src.application.api import app
+
+async def start():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(start())
+"""
+
+# The track command with the Celestrak fetch stubbed, what a scheduled ingest
+# container does: import of the ingest modules, SGP4 states, storage.
+_TRACK = """
+import sys
+sys.path.insert(0, "src")
+import application.orchestrator as orchestrator
+from src.adapters.element_formats import read_elements
+
+TLE = (
+    "ISS (ZARYA)\\n"
+    "1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990\\n"
+    "2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452\\n"
+)
+orchestrator.get_element_sets = lambda format: read_elements(TLE, "tle")
+orchestrator.run_tracker()
+"""
+
+STARTUP_TARGETS = {
+    "api": ["-c", _API_STARTUP],
+    "track-import": ["-c", "import src.application.orchestrator"],
+    "track": ["-c", _TRACK],
+}
+
+
+def profile_startup(repeat: int = 5, top: int = 10) -> dict[str, float]:
+    """
+    Measures cold start of the API app and the track command in fresh
+    interpreter processes and prints the median times and the slowest imported
+    packages of each target. Each run uses a fresh copy of an initialized
+    SQLite database in a temporary directory.
+
+    Args:
+        repeat (int): Number of measured runs per target.
+        top (int): Number of slowest packages to print.
+
+    Returns:
+        dict[str, float]: Median cold start time in seconds per target.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        template = Path(directory) / "template.db"
+        database = Path(directory) / "profile.db"
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(ROOT),
+            "DB_CONNECTION_STRING": f"sqlite:///{database}",
+        }
+        subprocess.run(
+            [sys.executable, "src/main.py", "init-db", "--db", f"sqlite:///{template}"],
+            cwd=ROOT,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        medians = {}
+        for target, args in STARTUP_TARGETS.items():
+            times = []
+            for _ in range(repeat):
+                shutil.copyfile(template, database)
+                started = time.perf_counter()
+                _run(args, env, subprocess.DEVNULL)
+                times.append(time.perf_counter() - started)
+            medians[target] = statistics.median(times)
+            print(f"{target}: median {medians[target]:.3f}s over {repeat} runs")
+
+            shutil.copyfile(template, database)
+            imports = _run(["-X", "importtime", *args], env, subprocess.PIPE).stderr
+            for cumulative, package in _slowest_packages(imports, top):
+                print(f"  {cumulative / 1e6:.3f}s {package}")
+    return medians
+
+
+def _run(args: list[str], env: dict, stderr: int) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=stderr,
+        text=True,
+    )
+
+
+def _slowest_packages(output: str, top: int) -> list[tuple[int, str]]:
+    # Cumulative time of a package is the one of its slowest imported module.
+    packages: dict[str, int] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        package = module.strip().split(".")[0]
+        packages[package] = max(packages.get(package, 0), int(cumulative))
+    return sorted(
+        ((cumulative, package) for package, cumulative in packages.items()),
+        reverse=True,
+    )[:top]
@@ -0,0 +1,337 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    load_latest_elements,
+    load_latest_satellite_rows,
+    load_pending_alert_events,
+    load_watchlist_members,
+    load_watchlists,
+    mark_alert_events_dispatched,
+    save_alert_events,
+)
+from src.adapters.element_formats import element_array
+from src.adapters.webhook import post_json
+from src.application.config import settings
+from src.tracker.models.watchlist import AlertEventRead
+from src.tracker.propagation import propagate, satrecs_from_records, to_datetime64
+from src.tracker.schema.base_model import utc_now
+from src.tracker.schema.watchlist import AlertEvent, Watchlist
+from src.tracker.watchlist import (
+    altitude_drops,
+    element_set_ages,
+    nearest_approaches,
+    orbit_shells,
+)
+
+# Catalog objects propagated at once by the proximity screening.
+_CANDIDATE_CHUNK = 1000
+
+
+@dataclass(frozen=True)
+class WatchlistChanges:
+    """
+    Watched objects with a newer element set in an ingest run than stored.
+
+    Attributes:
+        elements (np.ndarray): Latest element set of each object in the run,
+            structured array with ELEMENT_DTYPES fields.
+        previous_mean_motion (np.ndarray): Mean motion of the previously latest
+            stored element set of each object, NaN for new objects.
+    """
+
+    elements: np.ndarray
+    previous_mean_motion: np.ndarray
+
+
+def find_watchlist_changes(db: Session, elements: np.ndarray) -> WatchlistChanges:
+    """
+    Selects the element sets of an ingest run the watchlist rules are evaluated
+    on: objects on any watchlist, found through the NORAD ID index of the
+    members, whose element set in the run is newer than their latest stored
+    one. Must run in the ingest transaction before the element sets are saved.
+
+    Args:
+        db: SQLAlchemy session.
+        elements: Ingested element sets, structured array with ELEMENT_DTYPES fields.
+
+    Returns:
+        WatchlistChanges: Changed watched objects.
+    """
+    watched = [
+        norad_cat_id
+        for _, norad_cat_id in load_watchlist_members(
+            db, np.unique(elements["norad_cat_id"]).tolist()
+        )
+    ]
+    elements = elements[np.isin(elements["norad_cat_id"], watched)]
+    elements = elements[np.lexsort((elements["epoch"], elements["norad_cat_id"]))]
+    last = np.ones(len(elements), dtype=bool)
+    last[:-1] = elements["norad_cat_id"][:-1] != elements["norad_cat_id"][1:]
+    elements = elements[last]
+
+    stored = {
+        norad_cat_id: (epoch, mean_motion)
+        for norad_cat_id, epoch, mean_motion, *_ in load_latest_elements(
+            db, elements["norad_cat_id"].tolist()
+        )
+    }
+    previous = [stored.get(i) for i in elements["norad_cat_id"].tolist()]
+    changed = elements["epoch"] > to_datetime64(
+        [row[0] if row else datetime.min for row in previous]
+    )
+    return WatchlistChanges(
+        elements=elements[changed],
+        previous_mean_motion=np.array(
+            [row[1] if row else np.nan for row in previous], dtype=float
+        )[changed],
+    )
+
+
+def evaluate_watchlists(
+    db: Session,
+    changes: WatchlistChanges,
+    now: datetime,
+    hours: Optional[float] = None,
+    step_seconds: Optional[float] = None,
+) -> list[AlertEvent]:
+    """
+    Evaluates the watchlist rules after an ingest run and saves the alert events.
+    Proximity and altitude drop are evaluated on the changed objects only, for
+    the watchlists interested in each of them. Staleness is evaluated on all
+    members of watchlists with a staleness rule, as objects without a new
+    element set are the ones going stale. A rule fires at most once per element
+    set and watchlist. Does not commit.
+
+    Args:
+        db: SQLAlchemy session.
+        changes: Changed watched objects, see find_watchlist_changes.
+        now: Evaluation time, start of the proximity screening window (UTC).
+        hours: Length of the proximity screening window in hours, defaults to settings.
+        step_seconds: Propagation step of the proximity screening in seconds,
+            defaults to settings.
+
+    Returns:
+        list[AlertEvent]: New alert events.
+    """
+    elements = changes.elements
+    row = {
+        norad_cat_id: i
+        for i, norad_cat_id in enumerate(elements["norad_cat_id"].tolist())
+    }
+    interested = defaultdict(list)
+    for watchlist_id, norad_cat_id in load_watchlist_members(db, list(row)):
+        interested[watchlist_id].append(row[norad_cat_id])
+    watchlists = load_watchlists(db)
+
+    drops = altitude_drops(changes.previous_mean_motion, elements["mean_motion"])
+    margins = np.zeros(len(elements))
+    for watchlist in watchlists:
+        if watchlist.proximity_km is not None:
+            rows = interested[watchlist.id]
+            margins[rows] = np.maximum(margins[rows], watchlist.proximity_km)
+    nearest, distances, tca = _screen_proximity(
+        db,
+        elements,
+        np.flatnonzero(margins),
+        margins,
+        now,
+        settings.watchlist_proximity_hours if hours is None else hours,
+        settings.watchlist_proximity_step if step_seconds is None else step_seconds,
+    )
+
+    alerts = []
+    for watchlist in watchlists:
+        for i in interested[watchlist.id]:
+            epoch = elements["epoch"][i].tolist()
+            if (
+                watchlist.altitude_drop_km is not None
+                and drops[i] >= watchlist.altitude_drop_km
+            ):
+                alerts.append(
+                    _alert(
+                        watchlist,
+                        "altitude_drop",
+                        int(elements["norad_cat_id"][i]),
+                        epoch,
+                        drops[i],
+                    )
+                )
+            if watchlist.proximity_km is not None and distances[i] < (
+                watchlist.proximity_km
+            ):
+                alerts.append(
+                    _alert(
+                        watchlist,
+                        "proximity",
+                        int(elements["norad_cat_id"][i]),
+                        epoch,
+                        distances[i],
+                        other_norad_cat_id=int(nearest[i]),
+                        event_time=tca[i].tolist(),
+                    )
+                )
+
+    staleness = [w for w in watchlists if w.staleness_hours is not None]
+    latest = {
+        norad_cat_id: epoch
+        for norad_cat_id, epoch, *_ in load_latest_elements(
+            db, sorted({i for w in staleness for i in w.norad_cat_ids})
+        )
+    }
+    now64 = to_datetime64([now])[0]
+    for watchlist in staleness:
+        ids = [i for i in watchlist.norad_cat_ids if i in latest]
+        ages = element_set_ages(to_datetime64([latest[i] for i in ids]), now64)
+        alerts.extend(
+            _alert(watchlist, "staleness", norad_cat_id, latest[norad_cat_id], age)
+            for norad_cat_id, age in zip(ids, ages)
+            if age >= watchlist.staleness_hours
+        )
+
+    alerts = save_alert_events(alerts, db)
+    for alert in alerts:
+        logging.info(
+            "Watchlist %d: %s alert for %d, value %.3f (threshold %.3f).",
+            alert.watchlist_id,
+            alert.rule,
+            alert.norad_cat_id,
+            alert.value,
+            alert.threshold,
+        )
+    return alerts
+
+
+def dispatch_alerts(
+    db: Session, timeout: Optional[float] = None, limit: int = 1000
+) -> int:
+    """
+    Posts pending alert events to the webhooks of their watchlists, one JSON
+    request per watchlist with its oldest events in creation order. Events are
+    marked dispatched when their webhook accepted them, failed ones stay pending
+    and are retried by the next dispatch. Each watchlist gets its own limit, a
+    failing webhook does not hold back the others. Commits after each webhook.
+
+    Args:
+        db: SQLAlchemy session.
+        timeout: Request timeout in seconds, defaults to settings.
+        limit: Maximum number of alert events per watchlist and dispatch.
+
+    Returns:
+        int: Number of dispatched alert events.
+    """
+    pending = defaultdict(list)
+    for webhook_url, alert in load_pending_alert_events(db, limit):
+        pending[alert.watchlist_id, webhook_url].append(alert)
+
+    dispatched = 0
+    for (_, webhook_url), alerts in pending.items():
+        payload = {
+            "alerts": [
+                AlertEventRead.model_validate(alert).model_dump(mode="json")
+                for alert in alerts
+            ]
+        }
+        if not post_json(
+            webhook_url,
+            payload,
+            settings.watchlist_webhook_timeout if timeout is None else timeout,
+        ):
+            continue
+        mark_alert_events_dispatched(db, [alert.id for alert in alerts], utc_now())
+        db.commit()
+        dispatched += len(alerts)
+    return dispatched
+
+
+def _screen_proximity(
+    db: Session,
+    elements: np.ndarray,
+    rows: np.ndarray,
+    margins: np.ndarray,
+    now: datetime,
+    hours: float,
+    step_seconds: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Closest approach of the given element set rows to any other catalog object
+    # within the window. Only objects whose perigee to apogee shells overlap
+    # within the largest proximity threshold are propagated, in chunks.
+    nearest = np.full(len(elements), -1)
+    distances = np.full(len(elements), np.inf)
+    tca = np.full(len(elements), np.datetime64("NaT"), dtype="M8[us]")
+    if not len(rows):
+        return nearest, distances, tca
+
+    columns, catalog_rows = load_latest_satellite_rows(db)
+    catalog = dict(zip(columns, map(list, zip(*catalog_rows))))
+    catalog["epoch"] = to_datetime64(catalog["epoch"])
+    catalog = element_array(catalog)
+
+    targets = elements[rows]
+    start = to_datetime64([now])[0]
+    steps = np.arange(0.0, hours * 3600.0 + step_seconds, step_seconds)
+    times = start + (steps * 1e6).astype("timedelta64[us]")
+    errors, positions, velocities = propagate(satrecs_from_records(targets), times)
+    valid = ~errors.any(axis=1)
+
+    margin = margins[rows]
+    perigee, apogee = orbit_shells(targets["mean_motion"], targets["eccentricity"])
+    other_perigee, other_apogee = orbit_shells(
+        catalog["mean_motion"], catalog["eccentricity"]
+    )
+    overlap = (
+        (other_perigee[None, :] <= (apogee + margin)[:, None])
+        & (other_apogee[None, :] >= (perigee - margin)[:, None])
+        & (catalog["norad_cat_id"][None, :] != targets["norad_cat_id"][:, None])
+        & valid[:, None]
+    )
+    (screened,) = np.nonzero(overlap.any(axis=0))
+    for first in range(0, len(screened), _CANDIDATE_CHUNK):
+        chunk = screened[first : first + _CANDIDATE_CHUNK]
+        other_errors, other_positions, other_velocities = propagate(
+            satrecs_from_records(catalog[chunk]), times
+        )
+        candidates = overlap[:, chunk] & ~other_errors.any(axis=1)[None, :]
+        chunk_nearest, chunk_distances, chunk_tca = nearest_approaches(
+            times,
+            positions,
+            velocities,
+            other_positions,
+            other_velocities,
+            candidates,
+        )
+        closer = chunk_distances < distances[rows]
+        nearest[rows[closer]] = catalog["norad_cat_id"][chunk[chunk_nearest[closer]]]
+        distances[rows[closer]] = chunk_distances[closer]
+        tca[rows[closer]] = chunk_tca[closer]
+    return nearest, distances, tca
+
+
+def _alert(
+    watchlist: Watchlist,
+    rule: str,
+    norad_cat_id: int,
+    epoch: datetime,
+    value: float,
+    **fields,
+) -> AlertEvent:
+    threshold = {
+        "proximity": watchlist.proximity_km,
+        "altitude_drop": watchlist.altitude_drop_km,
+        "staleness": watchlist.staleness_hours,
+    }[rule]
+    return AlertEvent(
+        watchlist_id=watchlist.id,
+        norad_cat_id=norad_cat_id,
+        epoch=epoch,
+        rule=rule,
+        value=float(value),
+        threshold=threshold,
+        **fields,
+    )
@@ -1,4 +1,166 @@
-from application.orchestrator import run_tracker
+import argparse
+
+
+def main(argv: list[str] | None = None):
+    """
+    Command line entry point.
+    Without a command runs the tracker, "backfill" loads archived OMM/TLE files,
+    "retention" applies the history retention policy, "init-db" creates tables.
+    Commands import their modules lazily to keep startup fast.
+    """
+    parser = argparse.ArgumentParser(description="Space Object Tracker")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("track", help="Fetch current data from Celestrak and store it.")
+
+    init_db = commands.add_parser("init-db", help="Create database tables.")
+    init_db.add_argument(
+        "--db", default=None, help="Database URL (default: DB_CONNECTION_STRING)."
+    )
+
+    backfill = commands.add_parser(
+        "backfill", help="Load a directory of archived OMM JSON / CSV / TLE files."
+    )
+    backfill.add_argument("directory", help="Directory with archive files.")
+    backfill.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)."
+    )
+    backfill.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows per INSERT statement."
+    )
+    backfill.add_argument(
+        "--db", default=None, help="Database URL (default: DB_CONNECTION_STRING)."
+    )
+
+    retention = commands.add_parser(
+        "retention",
+        help="Create partitions, downsample and drop old history.",
+    )
+    retention.add_argument(
+        "--full-resolution-days",
+        type=int,
+        default=None,
+        help="Days of history kept in full resolution (default: 90).",
+    )
+    retention.add_argument(
+        "--retention-days",
+        type=int,
+        default=None,
+        help="Days of history kept at all, PostgreSQL only (default: keep all).",
+    )
+    retention.add_argument(
+        "--archive-dir", default=None, help="Archive dropped partitions as CSV."
+    )
+    retention.add_argument(
+        "--db", default=None, help="Database URL (default: DB_CONNECTION_STRING)."
+    )
+
+    conjunctions = commands.add_parser(
+        "conjunctions",
+        help="Find closest approaches of object pairs and their collision probability.",
+    )
+    conjunctions.add_argument(
+        "pairs",
+        nargs="+",
+        type=_pair,
+        help="Object pairs as PRIMARY:SECONDARY NORAD IDs.",
+    )
+    conjunctions.add_argument(
+        "--hours", type=float, default=24.0, help="Screening window (default: 24)."
+    )
+    conjunctions.add_argument(
+        "--step", type=float, default=60.0, help="Screening step in seconds."
+    )
+    conjunctions.add_argument(
+        "--hard-body-radius",
+        type=float,
+        default=0.02,
+        help="Combined hard body radius in km (default: 0.02).",
+    )
+    conjunctions.add_argument(
+        "--samples",
+        type=int,
+        default=0,
+        help="Monte Carlo samples per conjunction (default: 0, skipped).",
+    )
+
+    cluster = commands.add_parser(
+        "cluster", help="Re-cluster the catalog into orbital regimes."
+    )
+    cluster.add_argument(
+        "--db", default=None, help="Database URL (default: DB_CONNECTION_STRING)."
+    )
+
+    benchmark = commands.add_parser(
+        "benchmark-formats",
+        help="Compare ingest time and memory of the JSON, CSV and TLE formats.",
+    )
+    benchmark.add_argument(
+        "--count", type=int, default=10000, help="Synthetic element sets."
+    )
+
+    profile = commands.add_parser(
+        "profile-startup",
+        help="Measure cold start time of the API and the track command.",
+    )
+    profile.add_argument("--repeat", type=int, default=5, help="Runs per target.")
+
+    args = parser.parse_args(argv)
+    if args.command == "init-db":
+        from application.session import init_engine, init_schema
+
+        init_schema(init_engine(args.db))
+    elif args.command == "backfill":
+        from application.backfill import run_backfill
+
+        run_backfill(args.directory, args.db, args.workers, args.batch_size)
+    elif args.command == "retention":
+        from application.retention import run_retention
+
+        run_retention(
+            args.db, args.full_resolution_days, args.retention_days, args.archive_dir
+        )
+    elif args.command == "conjunctions":
+        from application.conjunctions import run_conjunction_assessment
+
+        run_conjunction_assessment(
+            args.pairs,
+            args.hours,
+            args.step,
+            args.hard_body_radius,
+            args.samples,
+        )
+    elif args.command == "cluster":
+        from application.clustering import run_clustering
+
+        run_clustering(args.db)
+    elif args.command == "benchmark-formats":
+        from application.ingest_benchmark import benchmark_formats
+
+        benchmark_formats(args.count)
+    elif args.command == "profile-startup":
+        from application.startup_profile import profile_startup
+
+        profile_startup(args.repeat)
+    else:
+        from application.orchestrator import run_tracker
+
+        run_tracker()
+
+
+def _pair(value: str) -> tuple[int, int]:
+    primary, separator, secondary = value.partition(":")
+    try:
+        pair = int(primary), int(secondary)
+    except ValueError:
+        pair = None
+    if not separator or pair is None:
+        raise argparse.ArgumentTypeError(
+            f"invalid pair {value!r}, expected PRIMARY:SECONDARY NORAD IDs"
+        )
+    if pair[0] == pair[1]:
+        raise argparse.ArgumentTypeError(f"pair {value!r} has the same object twice")
+    return pair
+
 
 if __name__ == "__main__":
-    run_tracker()
+    main()
@@ -0,0 +1,216 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.tracker.constants import EARTH_MU_KM3_S2, EARTH_RADIUS_KM, SECONDS_PER_DAY
+
+SATELLITE_DTYPES = {
+    "object_name": "U",
+    "object_id": "U",
+    "epoch": "M8[us]",
+    "mean_motion": "f8",
+    "eccentricity": "f8",
+    "inclination": "f8",
+    "ra_of_asc_node": "f8",
+    "arg_of_pericenter": "f8",
+    "mean_anomaly": "f8",
+    "ephemeris_type": "i4",
+    "classification_type": "U",
+    "norad_cat_id": "i4",
+    "element_set_no": "i4",
+    "rev_at_epoch": "i4",
+    "bstar": "f8",
+    "mean_motion_dot": "f8",
+    "mean_motion_ddot": "f8",
+    "semi_major_axis": "f8",
+    "altitude": "f8",
+}
+
+SPACE_OBJECT_DTYPES = {
+    "id": "i4",
+    "name": "U",
+    "epoch": "M8[us]",
+    "source": "U",
+    "pos_x": "f8",
+    "pos_y": "f8",
+    "pos_z": "f8",
+    "vel_x": "f8",
+    "vel_y": "f8",
+    "vel_z": "f8",
+}
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Columnar in-memory snapshot of the latest element set of every satellite and
+    the latest state of every space object, in NumPy structured arrays.
+
+    Attributes:
+        generation (int): Ingest generation the snapshot was built from.
+        satellites (np.ndarray): Satellites with SATELLITE_DTYPES fields, sorted by NORAD ID.
+        space_objects (np.ndarray): Space objects with SPACE_OBJECT_DTYPES fields, sorted by NORAD ID.
+        satellite_index (dict[int, int]): NORAD ID to satellites row index.
+        space_object_index (dict[int, int]): NORAD ID to space_objects row index.
+    """
+
+    generation: int
+    satellites: np.ndarray
+    space_objects: np.ndarray
+    satellite_index: dict[int, int]
+    space_object_index: dict[int, int]
+
+    @classmethod
+    def from_rows(
+        cls,
+        generation: int,
+        satellite_columns: list[str],
+        satellite_rows: list[tuple],
+        space_object_columns: list[str],
+        space_object_rows: list[tuple],
+    ) -> "CatalogSnapshot":
+        """
+        Builds a snapshot from plain database rows.
+        Semi-major axis (km) and altitude above the equatorial radius (km) are
+        derived from the mean motion.
+        """
+        satellites = _to_array(satellite_columns, satellite_rows, SATELLITE_DTYPES)
+        mean_motion = satellites["mean_motion"] * 2.0 * np.pi / SECONDS_PER_DAY
+        with np.errstate(divide="ignore"):
+            satellites["semi_major_axis"] = np.cbrt(EARTH_MU_KM3_S2 / mean_motion**2)
+        satellites["altitude"] = satellites["semi_major_axis"] - EARTH_RADIUS_KM
+
+        space_objects = _to_array(
+            space_object_columns, space_object_rows, SPACE_OBJECT_DTYPES
+        )
+        return cls(
+            generation=generation,
+            satellites=satellites,
+            space_objects=space_objects,
+            satellite_index=_index(satellites["norad_cat_id"]),
+            space_object_index=_index(space_objects["id"]),
+        )
+
+    def satellite_mask(
+        self,
+        norad_cat_ids: Optional[Iterable[int]] = None,
+        min_inclination: Optional[float] = None,
+        max_inclination: Optional[float] = None,
+        min_altitude: Optional[float] = None,
+        max_altitude: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Evaluates satellite filters as a boolean mask over the satellites array.
+
+        Args:
+            norad_cat_ids: Only these NORAD IDs.
+            min_inclination: Minimum inclination in degrees.
+            max_inclination: Maximum inclination in degrees.
+            min_altitude: Minimum altitude in kilometers.
+            max_altitude: Maximum altitude in kilometers.
+
+        Returns:
+            np.ndarray: Boolean mask.
+        """
+        satellites = self.satellites
+        mask = _ids_mask(satellites["norad_cat_id"], norad_cat_ids)
+        if min_inclination is not None:
+            mask &= satellites["inclination"] >= min_inclination
+        if max_inclination is not None:
+            mask &= satellites["inclination"] <= max_inclination
+        if min_altitude is not None:
+            mask &= satellites["altitude"] >= min_altitude
+        if max_altitude is not None:
+            mask &= satellites["altitude"] <= max_altitude
+        return mask
+
+    def space_object_mask(self, ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Evaluates space object filters as a boolean mask over the space_objects array.
+
+        Args:
+            ids: Only these NORAD IDs.
+
+        Returns:
+            np.ndarray: Boolean mask.
+        """
+        return _ids_mask(self.space_objects["id"], ids)
+
+
+def records_json(array: np.ndarray) -> bytes:
+    """
+    Serializes a structured array to a JSON list of records, column by column.
+    NaN and infinite values, e.g. the altitude of an object with mean motion 0,
+    are serialized as null.
+
+    Args:
+        array (np.ndarray): Structured array.
+
+    Returns:
+        bytes: Serialized JSON.
+    """
+    columns = []
+    for name in array.dtype.names:
+        column = array[name]
+        if column.dtype.kind == "M":
+            columns.append(np.datetime_as_string(column, unit="us").tolist())
+        elif column.dtype.kind == "f" and not np.isfinite(column).all():
+            values = column.astype(object)
+            values[~np.isfinite(column)] = None
+            columns.append(values.tolist())
+        else:
+            columns.append(column.tolist())
+    names = array.dtype.names
+    return json.dumps(
+        [dict(zip(names, values)) for values in zip(*columns)], allow_nan=False
+    ).encode()
+
+
+def _to_array(columns: list[str], rows: list[tuple], dtypes: dict) -> np.ndarray:
+    epoch = columns.index("epoch")
+    strings = [i for i, name in enumerate(columns) if dtypes[name] == "U"]
+    rows = [
+        tuple(
+            (
+                _naive_utc(value)
+                if i == epoch
+                else ("" if value is None and i in strings else value)
+            )
+            for i, value in enumerate(row)
+        )
+        for row in rows
+    ]
+    widths = {
+        columns[i]: max((len(row[i]) for row in rows), default=1) or 1 for i in strings
+    }
+    array = np.zeros(
+        len(rows),
+        dtype=[
+            (name, f"U{widths[name]}" if dtype == "U" else dtype)
+            for name, dtype in dtypes.items()
+        ],
+    )
+    if rows:
+        loaded = np.array(rows, dtype=[(name, array.dtype[name]) for name in columns])
+        for name in columns:
+            array[name] = loaded[name]
+    return array
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _index(ids: np.ndarray) -> dict[int, int]:
+    return {object_id: row for row, object_id in enumerate(ids.tolist())}
+
+
+def _ids_mask(ids: np.ndarray, selected: Optional[Iterable[int]]) -> np.ndarray:
+    if selected is None:
+        return np.ones(len(ids), dtype=bool)
+    return np.isin(ids, np.fromiter(selected, dtype=ids.dtype))
@@ -0,0 +1,307 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.tracker.constants import EARTH_MU_KM3_S2, SECONDS_PER_DAY
+
+FEATURES = ("semi_major_axis", "inclination", "ra_of_asc_node", "eccentricity")
+
+# Cell size per feature: km, degrees, degrees, dimensionless.
+DEFAULT_CELL_SIZE = (25.0, 0.5, 5.0, 0.005)
+DEFAULT_MIN_POINTS = 5
+
+NOISE = -1
+# Cell key of objects outside the grid: non-finite elements or not an orbit.
+NO_CELL = -1
+
+_UNLABELED = np.iinfo(np.int64).max
+_RAAN = FEATURES.index("ra_of_asc_node")
+_OFFSETS = np.array(
+    [
+        offset
+        for offset in np.ndindex(3, 3, 3, 3)
+        if offset != (1, 1, 1, 1)  # the cell itself
+    ]
+) - np.array([1, 1, 1, 1])
+
+
+def semi_major_axis(mean_motion: np.ndarray) -> np.ndarray:
+    """
+    Semi-major axis in km from mean motion in revolutions per day.
+    """
+    radians_per_second = np.asarray(mean_motion) * 2.0 * np.pi / SECONDS_PER_DAY
+    with np.errstate(divide="ignore"):
+        return np.cbrt(EARTH_MU_KM3_S2 / radians_per_second**2)
+
+
+def feature_matrix(
+    mean_motion: np.ndarray,
+    inclination: np.ndarray,
+    ra_of_asc_node: np.ndarray,
+    eccentricity: np.ndarray,
+) -> np.ndarray:
+    """
+    Builds the clustering feature matrix (N, 4) of FEATURES from element columns.
+    """
+    return np.column_stack(
+        [
+            semi_major_axis(mean_motion),
+            np.asarray(inclination, dtype=float),
+            np.mod(np.asarray(ra_of_asc_node, dtype=float), 360.0),
+            np.asarray(eccentricity, dtype=float),
+        ]
+    )
+
+
+@dataclass
+class ClusterModel:
+    """
+    Grid density clustering of orbital elements. The feature space is divided into
+    cells, cells with at least min_points objects are dense, neighboring dense cells
+    (RAAN wraps around) form a cluster, other cells next to a cluster belong to it.
+
+    Attributes:
+        cell_size (tuple[float, ...]): Cell size per feature.
+        min_points (int): Objects needed for a dense cell.
+        keys (np.ndarray): Sorted int64 keys of occupied cells.
+        counts (np.ndarray): Number of objects per cell.
+        labels (np.ndarray): Cluster label per cell, NOISE for unclustered cells.
+    """
+
+    cell_size: tuple[float, ...]
+    min_points: int
+    keys: np.ndarray
+    counts: np.ndarray
+    labels: np.ndarray
+
+    @classmethod
+    def fit(
+        cls,
+        features: np.ndarray,
+        cell_size: tuple[float, ...] = DEFAULT_CELL_SIZE,
+        min_points: int = DEFAULT_MIN_POINTS,
+    ) -> tuple["ClusterModel", np.ndarray]:
+        """
+        Clusters the whole catalog.
+
+        Args:
+            features (np.ndarray): Feature matrix (N, 4).
+            cell_size: Cell size per feature.
+            min_points: Objects needed for a dense cell.
+
+        Returns:
+            tuple[ClusterModel, np.ndarray]: Model and label per object (N,),
+            clusters are numbered by size, largest first.
+        """
+        model = cls(
+            cell_size,
+            min_points,
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+        )
+        cell_keys = model.cell_keys(features)
+        gridded = cell_keys != NO_CELL
+        keys, inverse, counts = np.unique(
+            cell_keys[gridded], return_inverse=True, return_counts=True
+        )
+        model.keys, model.counts = keys, counts
+        model.labels = np.full(len(keys), NOISE, dtype=np.int64)
+
+        dense = np.flatnonzero(counts >= min_points)
+        source, target = model._neighbor_pairs(dense)
+        dense_target = counts[target] >= min_points
+        components = _connected_components(
+            len(keys), source[dense_target], target[dense_target]
+        )
+        model.labels[dense] = components[dense]
+        # Border cells join the neighboring cluster with the lowest label.
+        border = ~dense_target
+        labels = np.where(model.labels == NOISE, _UNLABELED, model.labels)
+        np.minimum.at(labels, target[border], model.labels[source[border]])
+        model.labels = np.where(labels == _UNLABELED, NOISE, labels)
+
+        model._renumber_by_size()
+        labels = np.full(len(features), NOISE, dtype=np.int64)
+        labels[gridded] = model.labels[inverse.ravel()]
+        return model, labels
+
+    def cell_keys(self, features: np.ndarray) -> np.ndarray:
+        """
+        Returns the int64 cell key of each feature vector, NO_CELL for vectors
+        outside the grid: non-finite features (e.g. the semi-major axis at mean
+        motion 0), eccentricity outside [0, 1), inclination outside [0, 180]
+        degrees or a semi-major axis too large for the key range.
+        """
+        cells = np.floor(features / np.asarray(self.cell_size))
+        inclination_cells, raan_cells, eccentricity_cells = self._grid_shape()
+        max_semi_major_axis_cells = np.iinfo(np.int64).max // (
+            inclination_cells * raan_cells * eccentricity_cells
+        )
+        with np.errstate(invalid="ignore"):
+            gridded = (
+                np.isfinite(features).all(axis=1)
+                & (cells[:, 0] >= 0)
+                & (cells[:, 0] < max_semi_major_axis_cells)
+                & (features[:, 1] >= 0.0)
+                & (features[:, 1] <= 180.0)
+                & (features[:, 3] >= 0.0)
+                & (features[:, 3] < 1.0)
+            )
+        keys = np.full(len(features), NO_CELL, dtype=np.int64)
+        keys[gridded] = self._encode(cells[gridded])
+        return keys
+
+    def cell_labels(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Returns the cluster objects in the given occupied cells belong to: the
+        cell label, or the lowest label of a neighboring dense cell for
+        unclustered cells.
+        """
+        return self._border_labels(np.searchsorted(self.keys, keys))
+
+    def assign(
+        self, features: np.ndarray, previous_keys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Incrementally assigns new or changed objects to clusters without
+        re-clustering: updates cell counts, cells becoming dense join a neighboring
+        cluster or start a new one. Clusters are not merged or split, a full fit
+        is needed for that.
+
+        Args:
+            features (np.ndarray): Feature matrix (N, 4) of the objects.
+            previous_keys (np.ndarray): Previous cell key of each object, NO_CELL
+                if new or outside the grid.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Cluster label per object (N,), NOISE
+            outside the grid, and keys of occupied cells whose objects changed
+            cluster because a cell became dense, see cell_labels.
+        """
+        new_keys = self.cell_keys(features)
+        moved = previous_keys != new_keys
+        self._add_counts(previous_keys[moved & (previous_keys != NO_CELL)], -1)
+        self._add_counts(new_keys[moved & (new_keys != NO_CELL)], 1)
+
+        gridded = new_keys != NO_CELL
+        rows = np.searchsorted(self.keys, new_keys[gridded])
+        unique_rows = np.unique(rows)
+        dense = unique_rows[
+            (self.labels[unique_rows] == NOISE)
+            & (self.counts[unique_rows] >= self.min_points)
+        ]
+        # The new dense cells and their neighbors may change cluster.
+        affected = np.union1d(dense, self._neighbor_pairs(dense)[1])
+        before = self._border_labels(affected)
+        for row in dense:
+            label = self._border_labels(np.array([row]))[0]
+            self.labels[row] = label if label != NOISE else self.labels.max() + 1
+        changed = affected[self._border_labels(affected) != before]
+
+        labels = np.full(len(features), NOISE, dtype=np.int64)
+        labels[gridded] = self._border_labels(rows)
+        return labels, self.keys[changed]
+
+    def _encode(self, cells: np.ndarray) -> np.ndarray:
+        cells = cells.astype(np.int64)
+        inclination_cells, raan_cells, eccentricity_cells = self._grid_shape()
+        cells[:, _RAAN] = np.mod(cells[:, _RAAN], raan_cells)
+        return (
+            (cells[:, 0] * inclination_cells + cells[:, 1]) * raan_cells + cells[:, 2]
+        ) * eccentricity_cells + cells[:, 3]
+
+    def _decode(self, keys: np.ndarray) -> np.ndarray:
+        inclination_cells, raan_cells, eccentricity_cells = self._grid_shape()
+        keys, eccentricity = np.divmod(keys, eccentricity_cells)
+        keys, raan = np.divmod(keys, raan_cells)
+        semi_major_axis, inclination = np.divmod(keys, inclination_cells)
+        return np.column_stack([semi_major_axis, inclination, raan, eccentricity])
+
+    def _grid_shape(self) -> tuple[int, int, int]:
+        return (
+            int(np.ceil(180.0 / self.cell_size[1])) + 1,
+            int(np.ceil(360.0 / self.cell_size[2])),
+            int(np.ceil(1.0 / self.cell_size[3])) + 1,
+        )
+
+    def _neighbor_pairs(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Occupied neighbor cells of the given cells, as (row, neighbor row) pairs.
+        inclination_cells, _, eccentricity_cells = self._grid_shape()
+        cells = self._decode(self.keys[rows])
+        sources, targets = [], []
+        for offset in _OFFSETS:
+            neighbors = cells + offset
+            valid = (
+                (neighbors[:, 1] >= 0)
+                & (neighbors[:, 1] < inclination_cells)
+                & (neighbors[:, 3] >= 0)
+                & (neighbors[:, 3] < eccentricity_cells)
+            )
+            keys = self._encode(neighbors[valid])
+            found = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+            hit = self.keys[found] == keys
+            sources.append(rows[valid][hit])
+            targets.append(found[hit])
+        return np.concatenate(sources), np.concatenate(targets)
+
+    def _border_labels(self, rows: np.ndarray) -> np.ndarray:
+        # Cell label, or the lowest label of a neighboring dense cell for noise cells.
+        labels = self.labels[rows].copy()
+        noise = np.unique(rows[labels == NOISE])
+        if not len(noise):
+            return labels
+        source, target = self._neighbor_pairs(noise)
+        clustered = (self.counts[target] >= self.min_points) & (
+            self.labels[target] != NOISE
+        )
+        neighbor_labels = np.full(len(self.keys), _UNLABELED)
+        np.minimum.at(
+            neighbor_labels, source[clustered], self.labels[target[clustered]]
+        )
+        neighbor_labels = np.where(
+            neighbor_labels == _UNLABELED, NOISE, neighbor_labels
+        )
+        return np.where(labels == NOISE, neighbor_labels[rows], labels)
+
+    def _add_counts(self, keys: np.ndarray, delta: int):
+        if not len(keys):
+            return
+        keys, counts = np.unique(keys, return_counts=True)
+        missing = ~np.isin(keys, self.keys)
+        if missing.any():
+            merged = np.concatenate([self.keys, keys[missing]])
+            order = np.argsort(merged, kind="stable")
+            self.keys = merged[order]
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(missing.sum(), dtype=np.int64)]
+            )[order]
+            self.labels = np.concatenate(
+                [self.labels, np.full(missing.sum(), NOISE, dtype=np.int64)]
+            )[order]
+        self.counts[np.searchsorted(self.keys, keys)] += delta * counts
+
+    def _renumber_by_size(self):
+        clustered = self.labels != NOISE
+        if not clustered.any():
+            return
+        labels, inverse = np.unique(self.labels[clustered], return_inverse=True)
+        sizes = np.bincount(inverse, weights=self.counts[clustered])
+        rank = np.empty(len(labels), dtype=np.int64)
+        rank[np.argsort(-sizes, kind="stable")] = np.arange(len(labels))
+        self.labels[clustered] = rank[inverse]
+
+
+def _connected_components(
+    size: int, source: np.ndarray, target: np.ndarray
+) -> np.ndarray:
+    # Label propagation: every node takes the lowest label among its neighbors.
+    labels = np.arange(size, dtype=np.int64)
+    while True:
+        updated = labels.copy()
+        np.minimum.at(updated, source, labels[target])
+        np.minimum.at(updated, target, labels[source])
+        updated = updated[updated]  # pointer jumping
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
@@ -0,0 +1,10 @@
+EARTH_RADIUS_KM = 6378.137
+"""WGS-84 equatorial radius of the Earth, in kilometers."""
+
+EARTH_MU_KM3_S2 = 398600.8
+"""WGS-72 gravitational parameter of the Earth used by SGP4, in km^3/s^2."""
+
+SECONDS_PER_DAY = 86400.0
+
+WGS84_FLATTENING = 1.0 / 298.257223563
+"""WGS-84 flattening of the Earth."""
@@ -0,0 +1,80 @@
+import numpy as np
+
+from src.tracker.constants import (
+    EARTH_RADIUS_KM,
+    SECONDS_PER_DAY,
+    WGS84_FLATTENING,
+)
+
+_J2000_JD = 2451545.0
+_JULIAN_CENTURY_DAYS = 36525.0
+_WGS84_E2 = WGS84_FLATTENING * (2.0 - WGS84_FLATTENING)
+
+
+def gmst(jd: np.ndarray, fr: np.ndarray) -> np.ndarray:
+    """
+    Greenwich mean sidereal time (IAU 1982 model, as used with SGP4 and TEME),
+    taking UTC as UT1.
+
+    Args:
+        jd (np.ndarray): Whole Julian dates (T,).
+        fr (np.ndarray): Fractional Julian dates (T,).
+
+    Returns:
+        np.ndarray: GMST in radians, in [0, 2*pi) (T,).
+    """
+    t = ((jd - _J2000_JD) + fr) / _JULIAN_CENTURY_DAYS
+    seconds = (
+        67310.54841
+        + (876600.0 * 3600.0 + 8640184.812866) * t
+        + 0.093104 * t**2
+        - 6.2e-6 * t**3
+    )
+    return np.mod(seconds, SECONDS_PER_DAY) * (2.0 * np.pi / SECONDS_PER_DAY)
+
+
+def teme_to_ecef(positions: np.ndarray, gmst_angles: np.ndarray) -> np.ndarray:
+    """
+    Rotates TEME positions to the Earth-fixed frame (pseudo Earth fixed, polar
+    motion neglected). The rotation is computed once per time step and applied
+    to all objects.
+
+    Args:
+        positions (np.ndarray): TEME positions (N, T, 3).
+        gmst_angles (np.ndarray): GMST of each time step in radians (T,).
+
+    Returns:
+        np.ndarray: Earth-fixed positions (N, T, 3).
+    """
+    cos, sin = np.cos(gmst_angles), np.sin(gmst_angles)
+    x, y = positions[..., 0], positions[..., 1]
+    return np.stack([cos * x + sin * y, cos * y - sin * x, positions[..., 2]], axis=-1)
+
+
+def ecef_to_geodetic(
+    positions: np.ndarray, iterations: int = 4
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts Earth-fixed positions to WGS-84 geodetic coordinates by fixed point
+    iteration on the latitude, vectorized over all positions.
+
+    Args:
+        positions (np.ndarray): Earth-fixed positions in km (..., 3).
+        iterations (int): Latitude iterations, 4 converge to well below a meter
+            for orbital altitudes.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Latitude and longitude in
+        degrees, altitude above the ellipsoid in km (...).
+    """
+    x, y, z = positions[..., 0], positions[..., 1], positions[..., 2]
+    p = np.hypot(x, y)
+    latitude = np.arctan2(z, p * (1.0 - _WGS84_E2))
+    for _ in range(iterations):
+        sin = np.sin(latitude)
+        n = EARTH_RADIUS_KM / np.sqrt(1.0 - _WGS84_E2 * sin**2)
+        latitude = np.arctan2(z + _WGS84_E2 * n * sin, p)
+    sin, cos = np.sin(latitude), np.cos(latitude)
+    n = EARTH_RADIUS_KM / np.sqrt(1.0 - _WGS84_E2 * sin**2)
+    altitude = p * cos + z * sin - n * (1.0 - _WGS84_E2 * sin**2)
+    return np.degrees(latitude), np.degrees(np.arctan2(y, x)), altitude
@@ -0,0 +1,145 @@
+import numpy as np
+from sgp4.api import Satrec
+
+from src.tracker.coordinates import ecef_to_geodetic, gmst, teme_to_ecef
+from src.tracker.propagation import julian_dates, propagate
+
+
+def geodetic_tracks(
+    satrecs: list[Satrec], times: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Propagates satellites over a time grid and converts the positions to
+    geodetic coordinates, vectorized over satellites and times. GMST is computed
+    once per time step.
+
+    Args:
+        satrecs (list[Satrec]): Satellite records.
+        times (np.ndarray): datetime64 time grid (T,).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Latitude and longitude in degrees,
+        altitude in km (N, T), NaN where propagation failed.
+    """
+    _, positions, _ = propagate(satrecs, times)
+    jd, fr = julian_dates(times)
+    return ecef_to_geodetic(teme_to_ecef(positions, gmst(jd, fr)))
+
+
+def simplify_polyline(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Douglas-Peucker simplification, keeping points farther than tolerance from
+    the chord of their span.
+
+    Args:
+        points (np.ndarray): Polyline vertices (M, 2).
+        tolerance (float): Maximum distance of dropped points, in point units.
+
+    Returns:
+        np.ndarray: Boolean mask of kept vertices (M,).
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=bool)
+    return _simplify(points, tolerance, np.array([0]), np.array([len(points) - 1]))
+
+
+def track_segments(
+    latitude: np.ndarray, longitude: np.ndarray, tolerance: float
+) -> list[np.ndarray]:
+    """
+    Splits a ground track at the antimeridian and at propagation gaps and
+    simplifies each segment.
+
+    Args:
+        latitude (np.ndarray): Latitudes in degrees (T,).
+        longitude (np.ndarray): Longitudes in degrees (T,).
+        tolerance (float): Simplification tolerance in degrees.
+
+    Returns:
+        list[np.ndarray]: Segments of (longitude, latitude) vertices (M, 2).
+    """
+    points = np.column_stack([longitude, latitude])
+    valid = ~np.isnan(points).any(axis=1)
+    breaks = np.flatnonzero(
+        (np.abs(np.diff(longitude)) > 180.0) | (valid[1:] != valid[:-1])
+    )
+    first = np.concatenate([[0], breaks + 1])
+    last = np.concatenate([breaks, [len(points) - 1]])
+    segments = (last > first) & valid[first]
+    first, last = first[segments], last[segments]
+    # All segments are simplified together.
+    keep = _simplify(points, tolerance, first, last)
+    return [points[a : b + 1][keep[a : b + 1]] for a, b in zip(first, last)]
+
+
+def ground_track_features(
+    norad_cat_ids: np.ndarray,
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    tolerance: float,
+) -> list[dict]:
+    """
+    Builds GeoJSON MultiLineString features of ground tracks.
+
+    Args:
+        norad_cat_ids (np.ndarray): NORAD IDs (N,).
+        latitude (np.ndarray): Latitudes in degrees (N, T).
+        longitude (np.ndarray): Longitudes in degrees (N, T).
+        tolerance (float): Simplification tolerance in degrees.
+
+    Returns:
+        list[dict]: GeoJSON features with norad_cat_id property.
+    """
+    return [
+        {
+            "type": "Feature",
+            "properties": {"norad_cat_id": int(norad_cat_id)},
+            "geometry": {
+                "type": "MultiLineString",
+                "coordinates": [
+                    segment.round(4).tolist()
+                    for segment in track_segments(lat, lon, tolerance)
+                ],
+            },
+        }
+        for norad_cat_id, lat, lon in zip(norad_cat_ids, latitude, longitude)
+    ]
+
+
+def _simplify(
+    points: np.ndarray, tolerance: float, first: np.ndarray, last: np.ndarray
+) -> np.ndarray:
+    # Douglas-Peucker over the spans [first, last], splitting all spans of one
+    # recursion level at once.
+    keep = np.zeros(len(points), dtype=bool)
+    keep[first] = keep[last] = True
+    while True:
+        open_spans = last - first >= 2
+        first, last = first[open_spans], last[open_spans]
+        if not len(first):
+            return keep
+        counts = last - first - 1
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        span = np.repeat(np.arange(len(first)), counts)
+        index = np.arange(counts.sum()) - offsets[span] + first[span] + 1
+
+        chord = points[last] - points[first]
+        length = np.hypot(chord[:, 0], chord[:, 1])[span]
+        offset = points[index] - points[first][span]
+        cross = np.abs(chord[span, 0] * offset[:, 1] - chord[span, 1] * offset[:, 0])
+        distances = np.where(
+            length > 0,
+            cross / np.where(length > 0, length, 1.0),
+            np.hypot(offset[:, 0], offset[:, 1]),
+        )
+
+        # Farthest point of each span.
+        order = np.lexsort((-distances, span))
+        farthest = order[offsets]
+        split = distances[farthest] > tolerance
+        middle = index[farthest[split]]
+        keep[middle] = True
+        first, last = (
+            np.concatenate([first[split], middle]),
+            np.concatenate([middle, last[split]]),
+        )
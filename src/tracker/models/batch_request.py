@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchRequest(BaseModel):
+    """
+    Lookup of several objects by NORAD ID in one request.
+
+    Attributes:
+        norad_cat_ids (list[int]): NORAD IDs, results are returned in this order.
+        as_of (Optional[datetime]): Latest element set at or before this time
+            instead of the latest one, naive times are UTC.
+    """
+
+    norad_cat_ids: list[int] = Field(min_length=1)
+    as_of: Optional[datetime] = None
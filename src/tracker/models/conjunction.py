@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ConjunctionRead(BaseModel):
+    id: int
+    primary_id: int
+    primary_epoch: datetime
+    secondary_id: int
+    secondary_epoch: datetime
+    tca: datetime
+    miss_distance: float
+    relative_speed: float
+    hard_body_radius: float
+    probability: float
+    probability_monte_carlo: Optional[float]
+    monte_carlo_samples: Optional[int]
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class OrbitClusterRead(BaseModel):
+    """
+    Orbital-regime cluster with the mean elements of its members.
+    """
+
+    cluster: int
+    size: int
+    semi_major_axis: float
+    inclination: float
+    eccentricity: float
+
+    model_config = {"from_attributes": True}
+
+
+class OrbitClusterMemberRead(BaseModel):
+    norad_cat_id: int
+    epoch: datetime
+    cluster: int
+    semi_major_axis: float
+    inclination: float
+    ra_of_asc_node: float
+    eccentricity: float
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,15 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class PopulationStatRead(BaseModel):
+    """
+    Number of objects with element sets on a day in one bucket of a dimension.
+    """
+
+    day: date
+    bucket: str
+    count: int
+
+    model_config = {"from_attributes": True}
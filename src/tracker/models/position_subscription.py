@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PositionSubscription(BaseModel):
+    """
+    Live position stream subscription, sent by the client as a JSON message.
+    Objects are selected by NORAD IDs and/or catalog filters, all objects if none given.
+
+    Attributes:
+        norad_cat_ids (Optional[list[int]]): Only these NORAD IDs.
+        min_inclination (Optional[float]): Minimum inclination in degrees.
+        max_inclination (Optional[float]): Maximum inclination in degrees.
+        min_altitude (Optional[float]): Minimum altitude in kilometers.
+        max_altitude (Optional[float]): Maximum altitude in kilometers.
+        interval (float): Requested update interval in seconds.
+    """
+
+    norad_cat_ids: Optional[list[int]] = None
+    min_inclination: Optional[float] = None
+    max_inclination: Optional[float] = None
+    min_altitude: Optional[float] = None
+    max_altitude: Optional[float] = None
+    interval: float = Field(1.0, gt=0)
@@ -22,9 +22,9 @@ class SpaceObjectCreate(BaseModel):
     epoch: datetime
     id: int
     name: str
-    position_id: int
+    position_id: Optional[int] = None
     position: Vector3DCreate
-    velocity_id: int
+    velocity_id: Optional[int] = None
     velocity: Vector3DCreate
     source: Optional[Literal["CELESTRAK"]]
 
@@ -1,8 +1,10 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class Vector3DCreate(BaseModel):
-    id: int
+    id: Optional[int] = None
     x: float
     y: float
     z: float
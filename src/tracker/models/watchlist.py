@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field, HttpUrl, UrlConstraints, model_validator
+
+
+class WatchlistCreate(BaseModel):
+    """
+    Watchlist of objects with alert rule thresholds, at least one rule is required.
+
+    Attributes:
+        name (str): Name.
+        norad_cat_ids (list[int]): Watched NORAD IDs, duplicates are ignored.
+        webhook_url (Optional[HttpUrl]): HTTP(S) URL alert events are posted to.
+        proximity_km (Optional[float]): Miss distance threshold in kilometers.
+        altitude_drop_km (Optional[float]): Mean altitude drop threshold in kilometers.
+        staleness_hours (Optional[float]): Element set age threshold in hours.
+    """
+
+    name: str = Field(min_length=1, max_length=100)
+    norad_cat_ids: list[int] = Field(min_length=1)
+    webhook_url: Optional[Annotated[HttpUrl, UrlConstraints(max_length=500)]] = None
+    proximity_km: Optional[float] = Field(None, gt=0)
+    altitude_drop_km: Optional[float] = Field(None, gt=0)
+    staleness_hours: Optional[float] = Field(None, gt=0)
+
+    @model_validator(mode="after")
+    def check_rules(self) -> "WatchlistCreate":
+        if (
+            self.proximity_km is None
+            and self.altitude_drop_km is None
+            and self.staleness_hours is None
+        ):
+            raise ValueError("At least one rule threshold is required.")
+        return self
+
+
+class WatchlistRead(BaseModel):
+    id: int
+    name: str
+    norad_cat_ids: list[int]
+    webhook_url: Optional[str]
+    proximity_km: Optional[float]
+    altitude_drop_km: Optional[float]
+    staleness_hours: Optional[float]
+
+    model_config = {"from_attributes": True}
+
+
+class AlertEventRead(BaseModel):
+    id: int
+    watchlist_id: int
+    norad_cat_id: int
+    epoch: datetime
+    rule: str
+    value: float
+    threshold: float
+    other_norad_cat_id: Optional[int]
+    event_time: Optional[datetime]
+    created_at: datetime
+    dispatched_at: Optional[datetime]
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,120 @@
+import numpy as np
+
+from src.tracker.clustering import semi_major_axis
+from src.tracker.constants import EARTH_RADIUS_KM
+
+# Lower edges of the altitude shells in km, the last shell is open ended.
+ALTITUDE_SHELLS = (
+    0,
+    200,
+    300,
+    400,
+    500,
+    600,
+    700,
+    800,
+    900,
+    1000,
+    1200,
+    1400,
+    1600,
+    2000,
+    5000,
+    10000,
+    20000,
+    30000,
+    35286,
+    36286,
+)
+INCLINATION_BAND = 5
+
+# Orbital regimes: LEO below 2000 km, GEO within 500 km of the geostationary
+# altitude, HEO eccentric (e >= 0.25) or beyond GEO, MEO in between.
+REGIMES = ("LEO", "MEO", "GEO", "HEO")
+_LEO_MAX_ALTITUDE = 2000.0
+_GEO_ALTITUDE = (35286.0, 36286.0)
+_HEO_MIN_ECCENTRICITY = 0.25
+
+DIMENSIONS = ("altitude", "inclination", "regime")
+
+
+def _range_labels(edges: tuple[int, ...]) -> tuple[str, ...]:
+    return tuple(f"{lower}-{upper}" for lower, upper in zip(edges, edges[1:])) + (
+        f"{edges[-1]}+",
+    )
+
+
+# Bucket labels of each dimension, in display order.
+BUCKETS = {
+    "altitude": _range_labels(ALTITUDE_SHELLS),
+    "inclination": tuple(
+        f"{lower}-{lower + INCLINATION_BAND}"
+        for lower in range(0, 180, INCLINATION_BAND)
+    ),
+    "regime": REGIMES,
+}
+
+
+def orbital_regimes(altitude: np.ndarray, eccentricity: np.ndarray) -> np.ndarray:
+    """
+    Orbital regime index (into REGIMES) from mean altitude in km and eccentricity.
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    regimes = np.where(altitude < _LEO_MAX_ALTITUDE, 0, 1)
+    regimes[(altitude >= _GEO_ALTITUDE[0]) & (altitude <= _GEO_ALTITUDE[1])] = 2
+    regimes[
+        (altitude > _GEO_ALTITUDE[1])
+        | (np.asarray(eccentricity) >= _HEO_MIN_ECCENTRICITY)
+    ] = 3
+    return regimes
+
+
+def population_buckets(
+    mean_motion: np.ndarray, inclination: np.ndarray, eccentricity: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Classifies element sets into the buckets of each dimension.
+
+    Args:
+        mean_motion (np.ndarray): Mean motion in revolutions per day (N,).
+        inclination (np.ndarray): Inclination in degrees (N,).
+        eccentricity (np.ndarray): Eccentricity (N,).
+
+    Returns:
+        dict[str, np.ndarray]: Bucket index into BUCKETS[dimension] by dimension (N,).
+    """
+    altitude = semi_major_axis(mean_motion) - EARTH_RADIUS_KM
+    shells = np.searchsorted(ALTITUDE_SHELLS, altitude, side="right") - 1
+    bands = np.floor_divide(np.asarray(inclination, dtype=float), INCLINATION_BAND)
+    return {
+        "altitude": np.clip(shells, 0, len(BUCKETS["altitude"]) - 1),
+        "inclination": np.clip(bands, 0, len(BUCKETS["inclination"]) - 1).astype(
+            np.int64
+        ),
+        "regime": orbital_regimes(altitude, eccentricity),
+    }
+
+
+def rollup_counts(
+    days: np.ndarray, buckets: dict[str, np.ndarray]
+) -> list[tuple[np.datetime64, str, str, int]]:
+    """
+    Counts element sets per day and bucket of each dimension.
+
+    Args:
+        days (np.ndarray): datetime64[D] day of each element set (N,).
+        buckets (dict[str, np.ndarray]): Bucket indices by dimension, see
+            population_buckets.
+
+    Returns:
+        list[tuple]: (day, dimension, bucket label, count) rows.
+    """
+    rows = []
+    for dimension, indices in buckets.items():
+        keys, counts = np.unique(np.rec.fromarrays([days, indices]), return_counts=True)
+        labels = BUCKETS[dimension]
+        rows.extend(
+            (day, dimension, labels[index], count)
+            for (day, index), count in zip(keys.tolist(), counts.tolist())
+        )
+    return rows
@@ -0,0 +1,175 @@
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import numpy as np
+from sgp4 import omm
+from sgp4.api import WGS72, Satrec, SatrecArray
+
+_UNIX_EPOCH_JD = 2440587.5
+# Epoch origin of sgp4init and mean motion derivative units, as in sgp4.omm.
+_SGP4_EPOCH0 = np.datetime64("1949-12-31T00:00:00", "us")
+_NDOT_UNITS = 1036800.0 / np.pi
+_NDDOT_UNITS = 2985984000.0 / 2.0 / np.pi
+
+
+def satellite_to_omm(satellite: Any) -> dict:
+    """
+    Converts a satellite (ORM or Pydantic model) to an OMM dictionary.
+
+    Args:
+        satellite: Object with Satellite attributes.
+
+    Returns:
+        dict: Dictionary containing satellite data in Celestrak OMM format.
+    """
+    epoch = satellite.epoch
+    if epoch.tzinfo is not None:
+        epoch = epoch.astimezone(timezone.utc).replace(tzinfo=None)
+    return {
+        "OBJECT_NAME": satellite.object_name,
+        "OBJECT_ID": satellite.object_id,
+        "EPOCH": epoch.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+        "MEAN_MOTION": satellite.mean_motion,
+        "ECCENTRICITY": satellite.eccentricity,
+        "INCLINATION": satellite.inclination,
+        "RA_OF_ASC_NODE": satellite.ra_of_asc_node,
+        "ARG_OF_PERICENTER": satellite.arg_of_pericenter,
+        "MEAN_ANOMALY": satellite.mean_anomaly,
+        "EPHEMERIS_TYPE": satellite.ephemeris_type,
+        "CLASSIFICATION_TYPE": satellite.classification_type,
+        "NORAD_CAT_ID": satellite.norad_cat_id,
+        "ELEMENT_SET_NO": satellite.element_set_no,
+        "REV_AT_EPOCH": satellite.rev_at_epoch,
+        "BSTAR": satellite.bstar,
+        "MEAN_MOTION_DOT": satellite.mean_motion_dot,
+        "MEAN_MOTION_DDOT": satellite.mean_motion_ddot,
+    }
+
+
+def satrec_from_omm(fields: dict) -> Satrec:
+    """
+    Initializes an SGP4 satellite record from an OMM dictionary.
+    """
+    sat = Satrec()
+    omm.initialize(sat, fields)
+    return sat
+
+
+def satrecs_from_records(records: np.ndarray) -> list[Satrec]:
+    """
+    Initializes SGP4 satellite records from a structured array with Satellite
+    fields, e.g. rows of the catalog snapshot or parsed element sets. Unit
+    conversions are vectorized, each record is initialized directly without
+    an OMM dictionary, with the same results as omm.initialize.
+
+    Args:
+        records (np.ndarray): Structured array with Satellite fields.
+
+    Returns:
+        list[Satrec]: Satellite records in row order.
+    """
+    epochs = (records["epoch"] - _SGP4_EPOCH0) / np.timedelta64(86400, "s")
+    to_radians = np.pi / 180.0
+    elements = zip(
+        records["norad_cat_id"].tolist(),
+        epochs.tolist(),
+        records["bstar"].tolist(),
+        (records["mean_motion_dot"] / _NDOT_UNITS).tolist(),
+        (records["mean_motion_ddot"] / _NDDOT_UNITS).tolist(),
+        records["eccentricity"].tolist(),
+        (records["arg_of_pericenter"] * to_radians).tolist(),
+        (records["inclination"] * to_radians).tolist(),
+        (records["mean_anomaly"] * to_radians).tolist(),
+        (records["mean_motion"] / 720.0 * np.pi).tolist(),
+        (records["ra_of_asc_node"] * to_radians).tolist(),
+        records["classification_type"].tolist(),
+        records["object_id"].tolist(),
+        records["ephemeris_type"].tolist(),
+        records["element_set_no"].tolist(),
+        records["rev_at_epoch"].tolist(),
+    )
+    satrecs = []
+    for *orbit, classification, object_id, ephtype, elnum, revnum in elements:
+        sat = Satrec()
+        sat.classification = classification
+        sat.intldesg = object_id[2:].replace("-", "")
+        sat.ephtype = ephtype
+        sat.elnum = elnum
+        sat.revnum = revnum
+        sat.sgp4init(WGS72, "i", *orbit)
+        satrecs.append(sat)
+    return satrecs
+
+
+def to_datetime64(times: Iterable[datetime]) -> np.ndarray:
+    """
+    Converts datetimes (naive UTC or aware) to a datetime64[us] array.
+    """
+    return np.array(
+        [
+            (
+                t.astimezone(timezone.utc).replace(tzinfo=None)
+                if t.tzinfo is not None
+                else t
+            )
+            for t in times
+        ],
+        dtype="datetime64[us]",
+    )
+
+
+def julian_dates(times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits datetime64 times into whole and fractional Julian dates, as expected by SGP4.
+
+    Args:
+        times (np.ndarray): datetime64 array.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Whole and fractional parts of the Julian dates.
+    """
+    days = (times - np.datetime64("1970-01-01")) / np.timedelta64(1, "D")
+    whole = np.floor(days)
+    return whole + _UNIX_EPOCH_JD, days - whole
+
+
+def propagate(
+    satrecs: list[Satrec], times: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Propagates satellites to the given times with SGP4, vectorized over
+    satellites and times.
+
+    Args:
+        satrecs (list[Satrec]): Satellite records.
+        times (np.ndarray): datetime64 array of shape (T,) shared by all satellites.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Error codes (N, T), TEME positions
+        in km (N, T, 3) and velocities in km/s (N, T, 3).
+    """
+    jd, fr = julian_dates(np.atleast_1d(times))
+    return SatrecArray(satrecs).sgp4(jd, fr)
+
+
+def propagate_to_epoch(
+    satrecs: list[Satrec],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Propagates each satellite to its own element set epoch.
+
+    Args:
+        satrecs (list[Satrec]): Satellite records.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Error codes (N,), TEME positions
+        in km (N, 3) and velocities in km/s (N, 3).
+    """
+    errors = np.zeros(len(satrecs), dtype=np.int64)
+    positions = np.empty((len(satrecs), 3))
+    velocities = np.empty((len(satrecs), 3))
+    for i, sat in enumerate(satrecs):
+        errors[i], positions[i], velocities[i] = sat.sgp4(
+            sat.jdsatepoch, sat.jdsatepochF
+        )
+    return errors, positions, velocities
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class BackfillCheckpoint(Base):
+    __tablename__ = "backfill_checkpoint"
+    """
+    Represents an archive file that was fully loaded by a backfill run.
+
+    Attributes:
+        path (str): File path relative to the backfilled directory.
+        element_sets (int): Number of element sets read from the file.
+        inserted (int): Number of rows inserted (existing ones skipped).
+    """
+
+    path: Mapped[str] = mapped_column(String(500), primary_key=True)
+    element_sets: Mapped[int] = mapped_column(Integer)
+    inserted: Mapped[int] = mapped_column(Integer)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class Conjunction(Base):
+    __tablename__ = "conjunction"
+    """
+    Represents an assessed close approach between two objects.
+    Primary and secondary states are the SpaceObject (id, epoch) rows of the
+    element sets the assessment was propagated from.
+
+    Attributes:
+        id (int): Conjunction ID.
+        primary_id (int): NORAD ID of the primary object.
+        primary_epoch (datetime): Element set epoch of the primary object.
+        secondary_id (int): NORAD ID of the secondary object.
+        secondary_epoch (datetime): Element set epoch of the secondary object.
+        tca (datetime): Time of closest approach.
+        miss_distance (float): Distance at closest approach in kilometers.
+        relative_speed (float): Relative speed at closest approach in km/s.
+        hard_body_radius (float): Combined hard body radius in kilometers.
+        probability (float): Probability of collision, 2D encounter plane method.
+        probability_monte_carlo (Optional[float]): Probability of collision, Monte Carlo.
+        monte_carlo_samples (Optional[int]): Number of Monte Carlo samples.
+    """
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    primary_id: Mapped[int] = mapped_column(Integer)
+    primary_epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    secondary_id: Mapped[int] = mapped_column(Integer)
+    secondary_epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    tca: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    miss_distance: Mapped[float] = mapped_column(Float)
+    relative_speed: Mapped[float] = mapped_column(Float)
+    hard_body_radius: Mapped[float] = mapped_column(Float)
+    probability: Mapped[float] = mapped_column(Float)
+    probability_monte_carlo: Mapped[Optional[float]] = mapped_column(Float)
+    monte_carlo_samples: Mapped[Optional[int]] = mapped_column(Integer)
+
+    __table_args__ = (
+        Index("ix_conjunction_primary", "primary_id", "primary_epoch"),
+        Index("ix_conjunction_secondary", "secondary_id", "secondary_epoch"),
+    )
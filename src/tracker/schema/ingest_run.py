@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class IngestRun(Base):
+    __tablename__ = "ingest_run"
+    """
+    Represents a committed ingest run.
+    The number of runs is the ingest generation, it changes whenever stored data
+    changes.
+
+    Attributes:
+        id (int): Ingest run ID.
+        source (str): Ingest source, e.g. "CELESTRAK", "BACKFILL" or "RETENTION".
+        inserted (int): Number of inserted element sets.
+    """
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[str] = mapped_column(String(30))
+    inserted: Mapped[int] = mapped_column(Integer)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Float, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class OrbitClusterCell(Base):
+    __tablename__ = "orbit_cluster_cell"
+    """
+    Represents an occupied cell of the orbital-regime clustering grid.
+
+    Attributes:
+        key (int): Cell key, see ClusterModel.cell_keys.
+        count (int): Number of objects in the cell.
+        cluster (int): Cluster of the cell, -1 if unclustered.
+    """
+
+    key: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    count: Mapped[int] = mapped_column(Integer)
+    cluster: Mapped[int] = mapped_column(Integer)
+
+
+@dataclass
+class OrbitClusterMember(Base):
+    __tablename__ = "orbit_cluster_member"
+    """
+    Represents the orbital-regime cluster of an object, assigned from its latest
+    element set.
+
+    Attributes:
+        norad_cat_id (int): NORAD catalog ID.
+        epoch (datetime): Epoch of the element set the object was assigned from.
+        cluster (int): Cluster, -1 if unclustered.
+        cell_key (int): Clustering grid cell of the object, -1 outside the grid.
+        semi_major_axis (float): Semi-major axis in km.
+        inclination (float): Inclination in degrees.
+        ra_of_asc_node (float): Right ascension of ascending node in degrees.
+        eccentricity (float): Eccentricity.
+    """
+
+    norad_cat_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False
+    )
+    epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    cluster: Mapped[int] = mapped_column(Integer)
+    cell_key: Mapped[int] = mapped_column(BigInteger)
+    semi_major_axis: Mapped[float] = mapped_column(Float)
+    inclination: Mapped[float] = mapped_column(Float)
+    ra_of_asc_node: Mapped[float] = mapped_column(Float)
+    eccentricity: Mapped[float] = mapped_column(Float)
+
+    __table_args__ = (
+        Index("ix_orbit_cluster_member_cluster", "cluster"),
+        Index("ix_orbit_cluster_member_cell_key", "cell_key"),
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import DDL, Table, event
+
+PARTITION_BY_EPOCH = {"postgresql_partition_by": "RANGE (epoch)"}
+
+
+def default_partition_name(table_name: str) -> str:
+    return f"{table_name}_default"
+
+
+def add_default_partition(table: Table):
+    """
+    Creates a DEFAULT partition together with an epoch partitioned table on PostgreSQL,
+    so inserts never fail for months without a partition yet.
+    Rows are moved to monthly partitions by the retention job.
+
+    Args:
+        table: Table partitioned by PARTITION_BY_EPOCH.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS {default_partition_name(table.name)} "
+            f"PARTITION OF {table.name} DEFAULT"
+        ).execute_if(dialect="postgresql"),
+    )
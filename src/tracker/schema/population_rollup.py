@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Date, Integer, PrimaryKeyConstraint, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class PopulationRollup(Base):
+    __tablename__ = "population_rollup"
+    """
+    Represents the number of objects with element sets on a day in one bucket
+    of a population statistics dimension, per ingest source.
+
+    Attributes:
+        day (date): UTC day of the element set epochs.
+        source (str): Ingest source, e.g. "CELESTRAK" or "BACKFILL".
+        dimension (str): "altitude", "inclination" or "regime".
+        bucket (str): Bucket label, e.g. "500-600" (km), "50-55" (deg) or "LEO".
+        count (int): Number of objects.
+    """
+
+    day: Mapped[date] = mapped_column(Date)
+    source: Mapped[str] = mapped_column(String(30))
+    dimension: Mapped[str] = mapped_column(String(20))
+    bucket: Mapped[str] = mapped_column(String(20))
+    count: Mapped[int] = mapped_column(Integer)
+
+    __table_args__ = (PrimaryKeyConstraint("day", "dimension", "bucket", "source"),)
+
+
+@dataclass
+class PopulationObjectDay(Base):
+    __tablename__ = "population_object_day"
+    """
+    Represents an object day counted in the population rollups. The primary key
+    lets the database decide which of concurrent ingest runs counts a day.
+
+    Attributes:
+        norad_cat_id (int): NORAD catalog ID.
+        day (date): UTC day of the element set epoch.
+    """
+
+    norad_cat_id: Mapped[int] = mapped_column(Integer)
+    day: Mapped[date] = mapped_column(Date)
+
+    __table_args__ = (PrimaryKeyConstraint("norad_cat_id", "day"),)
@@ -7,6 +7,7 @@ from sqlalchemy import DateTime, Float, Integer, PrimaryKeyConstraint, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.tracker.schema.base_model import Base, utc_now
+from src.tracker.schema.partitioning import PARTITION_BY_EPOCH, add_default_partition
 
 
 @dataclass
@@ -55,4 +56,10 @@ class Satellite(Base):
     mean_motion_dot: Mapped[float] = mapped_column(Float)
     mean_motion_ddot: Mapped[float] = mapped_column(Float)
 
-    __table_args__ = (PrimaryKeyConstraint("norad_cat_id", "epoch"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("norad_cat_id", "epoch"),
+        PARTITION_BY_EPOCH,
+    )
+
+
+add_default_partition(Satellite.__table__)
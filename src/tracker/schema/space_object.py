@@ -8,6 +8,7 @@ from sqlalchemy import DateTime, ForeignKey, PrimaryKeyConstraint, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.tracker.schema.base_model import Base, utc_now
+from src.tracker.schema.partitioning import PARTITION_BY_EPOCH, add_default_partition
 from src.tracker.schema.vector3_d_model import Vector3D
 
 
@@ -39,4 +40,10 @@ class SpaceObject(Base):
 
     source: Mapped[Optional[Literal["CELESTRAK"]]] = mapped_column(String(30))
 
-    __table_args__ = (PrimaryKeyConstraint("id", "epoch"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "epoch"),
+        PARTITION_BY_EPOCH,
+    )
+
+
+add_default_partition(SpaceObject.__table__)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.tracker.schema.base_model import Base
+
+
+@dataclass
+class Watchlist(Base):
+    __tablename__ = "watchlist"
+    """
+    Represents a stored watchlist of objects with the alert rules evaluated
+    after each ingest run. A rule is disabled when its threshold is None.
+
+    Attributes:
+        id (int): Watchlist ID.
+        name (str): Name.
+        webhook_url (Optional[str]): URL alert events are posted to.
+        proximity_km (Optional[float]): Alert when a member comes closer than
+            this to another object, in kilometers.
+        altitude_drop_km (Optional[float]): Alert when the mean altitude of a
+            member drops by at least this between element sets, in kilometers.
+        staleness_hours (Optional[float]): Alert when the latest element set of a
+            member is at least this old, in hours.
+        members (list[WatchlistMember]): Watched objects.
+    """
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    webhook_url: Mapped[Optional[str]] = mapped_column(String(500))
+    proximity_km: Mapped[Optional[float]] = mapped_column(Float)
+    altitude_drop_km: Mapped[Optional[float]] = mapped_column(Float)
+    staleness_hours: Mapped[Optional[float]] = mapped_column(Float)
+
+    members: Mapped[list[WatchlistMember]] = relationship(
+        "WatchlistMember", cascade="all, delete-orphan"
+    )
+
+    @property
+    def norad_cat_ids(self) -> list[int]:
+        return sorted(member.norad_cat_id for member in self.members)
+
+
+@dataclass
+class WatchlistMember(Base):
+    __tablename__ = "watchlist_member"
+    """
+    Represents an object on a watchlist. The NORAD ID index maps the objects of
+    an ingest run to the watchlists interested in them.
+
+    Attributes:
+        watchlist_id (int): Watchlist ID.
+        norad_cat_id (int): NORAD catalog ID.
+    """
+
+    watchlist_id: Mapped[int] = mapped_column(
+        ForeignKey("watchlist.id", ondelete="CASCADE")
+    )
+    norad_cat_id: Mapped[int] = mapped_column(Integer)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("watchlist_id", "norad_cat_id"),
+        Index("ix_watchlist_member_norad_cat_id", "norad_cat_id"),
+    )
+
+
+@dataclass
+class AlertEvent(Base):
+    __tablename__ = "alert_event"
+    """
+    Represents a watchlist rule that fired for an element set of a member.
+    An element set fires each rule of a watchlist at most once.
+
+    Attributes:
+        id (int): Alert event ID.
+        watchlist_id (int): Watchlist ID.
+        norad_cat_id (int): NORAD ID of the member.
+        epoch (datetime): Epoch of the element set the rule was evaluated on.
+        rule (str): "proximity", "altitude_drop" or "staleness".
+        value (float): Evaluated value: miss distance in km, altitude drop in km
+            or element set age in hours.
+        threshold (float): Rule threshold at evaluation time.
+        other_norad_cat_id (Optional[int]): NORAD ID of the closest object of a
+            proximity alert.
+        event_time (Optional[datetime]): Time of closest approach of a proximity
+            alert.
+        dispatched_at (Optional[datetime]): Time the event was posted to the
+            webhook, None while pending.
+    """
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    watchlist_id: Mapped[int] = mapped_column(
+        ForeignKey("watchlist.id", ondelete="CASCADE")
+    )
+    norad_cat_id: Mapped[int] = mapped_column(Integer)
+    epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    rule: Mapped[str] = mapped_column(String(30))
+    value: Mapped[float] = mapped_column(Float)
+    threshold: Mapped[float] = mapped_column(Float)
+    other_norad_cat_id: Mapped[Optional[int]] = mapped_column(Integer)
+    event_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        UniqueConstraint("watchlist_id", "norad_cat_id", "rule", "epoch"),
+    )
@@ -0,0 +1,103 @@
+import numpy as np
+
+from src.tracker.clustering import semi_major_axis
+from src.tracker.collision import closest_approach
+
+RULES = ("proximity", "altitude_drop", "staleness")
+
+
+def altitude_drops(
+    previous_mean_motion: np.ndarray, mean_motion: np.ndarray
+) -> np.ndarray:
+    """
+    Drop of the mean altitude between two element sets in km, negative when
+    the orbit was raised.
+
+    Args:
+        previous_mean_motion (np.ndarray): Mean motion of the earlier element sets
+            in revolutions per day (N,).
+        mean_motion (np.ndarray): Mean motion of the later element sets (N,).
+
+    Returns:
+        np.ndarray: Altitude drop in km (N,).
+    """
+    return semi_major_axis(previous_mean_motion) - semi_major_axis(mean_motion)
+
+
+def element_set_ages(epochs: np.ndarray, now: np.datetime64) -> np.ndarray:
+    """
+    Age of element sets in hours.
+
+    Args:
+        epochs (np.ndarray): datetime64 element set epochs (N,).
+        now (np.datetime64): Evaluation time.
+
+    Returns:
+        np.ndarray: Age in hours (N,).
+    """
+    return (now - epochs) / np.timedelta64(1, "h")
+
+
+def orbit_shells(
+    mean_motion: np.ndarray, eccentricity: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Perigee and apogee radius in km, two orbits can only come closer than d
+    when their shells widened by d overlap.
+
+    Args:
+        mean_motion (np.ndarray): Mean motion in revolutions per day (N,).
+        eccentricity (np.ndarray): Eccentricity (N,).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Perigee and apogee radius (N,).
+    """
+    a = semi_major_axis(mean_motion)
+    return a * (1.0 - eccentricity), a * (1.0 + eccentricity)
+
+
+def nearest_approaches(
+    times: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    other_positions: np.ndarray,
+    other_velocities: np.ndarray,
+    candidates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds the closest approach of each object to any of its candidate objects,
+    all propagated on a shared time grid, see closest_approach.
+
+    Args:
+        times (np.ndarray): datetime64 time grid (T,).
+        positions (np.ndarray): Positions of the objects in km (M, T, 3).
+        velocities (np.ndarray): Velocities of the objects in km/s (M, T, 3).
+        other_positions (np.ndarray): Positions of the other objects in km (N, T, 3).
+        other_velocities (np.ndarray): Velocities of the other objects in km/s (N, T, 3).
+        candidates (np.ndarray): Boolean mask of the pairs to check (M, N).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Row of the closest other object,
+        -1 without candidates (M,), miss distance in km, inf without candidates
+        (M,), and datetime64 time of closest approach (M,).
+    """
+    nearest = np.full(len(positions), -1)
+    distances = np.full(len(positions), np.inf)
+    tca = np.full(len(positions), np.datetime64("NaT"), dtype=times.dtype)
+    for i, rows in enumerate(candidates):
+        (rows,) = np.nonzero(rows)
+        if not len(rows):
+            continue
+        relative_positions = other_positions[rows] - positions[i]
+        relative_velocities = other_velocities[rows] - velocities[i]
+        index, offset = closest_approach(times, relative_positions, relative_velocities)
+        pairs = np.arange(len(rows))
+        miss = np.linalg.norm(
+            relative_positions[pairs, index]
+            + relative_velocities[pairs, index] * offset[:, None],
+            axis=-1,
+        )
+        k = np.argmin(miss)
+        nearest[i], distances[i] = rows[k], miss[k]
+        tca[i] = times[index[k]] + np.timedelta64(int(offset[k] * 1e6), "us")
+    return nearest, distances, tca
@@ -0,0 +1,50 @@
+import gzip
+import json
+
+import pytest
+
+from src.adapters.archive_reader import find_archive_files, read_archive_elements
+
+ISS_TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990",
+    "2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452",
+]
+
+ISS_OMM = {
+    "OBJECT_NAME": "ISS (ZARYA)",
+    "OBJECT_ID": "1998-067A",
+    "EPOCH": "2024-01-01T00:00:00.000000",
+    "MEAN_MOTION": 15.48912345,
+    "ECCENTRICITY": 0.0006703,
+    "INCLINATION": 51.6432,
+    "RA_OF_ASC_NODE": 325.0288,
+    "ARG_OF_PERICENTER": 130.536,
+    "MEAN_ANOMALY": 325.0288,
+    "EPHEMERIS_TYPE": 0,
+    "CLASSIFICATION_TYPE": "U",
+    "NORAD_CAT_ID": 25544,
+    "ELEMENT_SET_NO": 999,
+    "REV_AT_EPOCH": 12345,
+    "BSTAR": 0.0001234,
+    "MEAN_MOTION_DOT": 0.00012345,
+    "MEAN_MOTION_DDOT": 0,
+}
+
+
+def test_read_archive_files(tmp_path):
+    (tmp_path / "2024").mkdir()
+    (tmp_path / "2024" / "iss.tle").write_text("\n".join(ISS_TLE))
+    with gzip.open(tmp_path / "2024" / "iss.json.gz", "wt") as file:
+        json.dump([ISS_OMM], file)
+    (tmp_path / "notes.md").write_text("not an archive")
+
+    files = find_archive_files(tmp_path)
+
+    assert [path.name for path in files] == ["iss.json.gz", "iss.tle"]
+    from_json, from_tle = (read_archive_elements(path) for path in files)
+    for name in from_json.dtype.names:
+        if from_json.dtype[name].kind == "f":
+            assert from_json[name] == pytest.approx(from_tle[name])
+        else:
+            assert from_json[name].tolist() == from_tle[name].tolist()
@@ -0,0 +1,98 @@
+import threading
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    bulk_save_or_skip_element_sets,
+    bulk_save_or_skip_states,
+)
+from src.adapters.element_formats import read_elements
+from src.tracker.schema.satellite import Satellite
+from src.tracker.schema.space_object import SpaceObject
+from src.tracker.schema.vector3_d_model import Vector3D
+
+TLE = """ISS (ZARYA)
+1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+1 25544U 98067A   24001.50000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+STARLINK-1007, "TEST"
+1 44713U 19074A   24001.25000000  .00001234  00000-0  10000-3 0  9992
+2 44713  53.0541 100.0000 0001234  90.0000 270.0000 15.06400000  1234
+"""
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def engine(request, test_engine):
+    if request.param == "sqlite":
+        return test_engine
+    return request.getfixturevalue("postgres_engine")
+
+
+def _load(engine, elements: np.ndarray) -> tuple[int, int]:
+    positions = np.arange(len(elements) * 3, dtype=float).reshape(-1, 3)
+    with Session(engine) as session, session.begin():
+        satellites = bulk_save_or_skip_element_sets(elements, session, batch_size=2)
+        space_objects = bulk_save_or_skip_states(
+            elements, positions, -positions, "CELESTRAK", session, batch_size=2
+        )
+    return satellites, space_objects
+
+
+def test_bulk_load_skips_stored_element_sets(engine):
+    elements = read_elements(TLE, "tle")
+
+    assert _load(engine, elements[:2]) == (2, 2)
+    # The first element set is stored, the last one is in the batch twice.
+    assert _load(engine, elements[[0, 2, 2]]) == (1, 1)
+
+    with Session(engine) as session:
+        satellites = session.scalars(
+            select(Satellite).order_by(Satellite.norad_cat_id, Satellite.epoch)
+        ).all()
+        assert [(s.norad_cat_id, s.object_name) for s in satellites] == [
+            (25544, "ISS (ZARYA)"),
+            (25544, "25544"),
+            (44713, 'STARLINK-1007, "TEST"'),
+        ]
+        assert satellites[0].object_id == "1998-067A"
+        assert satellites[0].bstar == pytest.approx(0.0001234)
+
+        space_object = session.scalars(
+            select(SpaceObject).where(SpaceObject.id == 44713)
+        ).one()
+        assert space_object.source == "CELESTRAK"
+        assert (space_object.position.x, space_object.position.z) == (3.0, 5.0)
+        assert (space_object.velocity.x, space_object.velocity.z) == (-3.0, -5.0)
+        assert session.scalar(select(func.count()).select_from(Vector3D)) == 6
+
+
+def test_concurrent_bulk_load_leaves_no_orphan_vectors(postgres_engine):
+    elements = read_elements(TLE, "tle")
+    positions = np.zeros((len(elements), 3))
+    inserted = []
+    with Session(postgres_engine) as first, Session(postgres_engine) as second:
+        assert (
+            bulk_save_or_skip_states(elements, positions, positions, "CELESTRAK", first)
+            == 3
+        )
+
+        # The second load passes the stored check, then waits on the conflict.
+        worker = threading.Thread(
+            target=lambda: inserted.append(
+                bulk_save_or_skip_states(
+                    elements, positions, positions, "CELESTRAK", second
+                )
+            )
+        )
+        worker.start()
+        worker.join(0.5)
+        first.commit()
+        worker.join()
+        second.commit()
+
+        assert inserted == [0]
+        assert first.scalar(select(func.count()).select_from(Vector3D)) == 6
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.adapters.database_maintenance import (
+    add_months,
+    downsample_history,
+    drop_partitions,
+    ensure_partitions,
+    month_start,
+    partition_name,
+)
+from src.adapters.database_storage import load_ingest_generation
+from src.tracker.schema.satellite import Satellite
+from src.tracker.schema.space_object import SpaceObject
+from src.tracker.schema.vector3_d_model import Vector3D
+
+
+def _satellite(norad_cat_id: int, epoch: datetime) -> Satellite:
+    return Satellite(
+        object_name="TEST",
+        object_id="2024-087A",
+        bstar=0.0001,
+        inclination=98.7,
+        epoch=epoch,
+        mean_motion=14.5,
+        eccentricity=0.001,
+        mean_anomaly=45.0,
+        ra_of_asc_node=150.0,
+        arg_of_pericenter=250.0,
+        classification_type="U",
+        ephemeris_type=0,
+        norad_cat_id=norad_cat_id,
+        rev_at_epoch=100,
+        element_set_no=999,
+        mean_motion_ddot=0,
+        mean_motion_dot=0.03,
+    )
+
+
+def _space_object(object_id: int, epoch: datetime) -> SpaceObject:
+    return SpaceObject(
+        id=object_id,
+        name="TEST",
+        epoch=epoch,
+        position=Vector3D(x=1000.0, y=2000.0, z=3000.0),
+        velocity=Vector3D(x=1.0, y=2.0, z=3.0),
+        source="CELESTRAK",
+    )
+
+
+def test_month_helpers():
+    month = month_start(datetime(2024, 11, 17, 12, 30))
+
+    assert month == datetime(2024, 11, 1, tzinfo=timezone.utc)
+    assert add_months(month, 2) == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert partition_name("satellite", month) == "satellite_p2024_11"
+
+
+def test_downsample_history_keeps_latest_per_day(test_engine):
+    old_day = datetime(2024, 1, 1)
+    recent_day = datetime.now() - timedelta(days=1)
+    epochs = [old_day + timedelta(hours=h) for h in (0, 6, 12)] + [
+        recent_day,
+        recent_day + timedelta(minutes=1),
+    ]
+    with Session(test_engine) as session:
+        session.add_all([_satellite(1, epoch) for epoch in epochs])
+        session.add_all([_space_object(1, epoch) for epoch in epochs])
+        session.add(_satellite(2, old_day))
+        session.commit()
+
+        before = datetime.now() - timedelta(days=90)
+        deleted = downsample_history(session, before)
+
+        assert deleted == 4
+        satellites = session.scalars(
+            select(Satellite.epoch).where(Satellite.norad_cat_id == 1)
+        ).all()
+        assert sorted(satellites) == [old_day + timedelta(hours=12)] + epochs[3:]
+        assert session.scalar(select(func.count()).select_from(SpaceObject)) == 3
+        assert session.scalar(select(func.count()).select_from(Vector3D)) == 6
+        assert session.scalar(select(func.count()).select_from(Satellite)) == 4
+        assert load_ingest_generation(session) == 1
+
+        assert downsample_history(session, before) == 0
+        assert load_ingest_generation(session) == 1
+
+
+def test_partitions_are_postgresql_only(test_engine):
+    with Session(test_engine) as session:
+        now = datetime.now(timezone.utc)
+        assert ensure_partitions(session, now, add_months(now, 2)) == []
+        assert drop_partitions(session, now) == []
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+import math
+
+import numpy as np
+import pytest
+from sgp4.api import Satrec
+from sgp4.conveniences import sat_epoch_datetime
+
+from src.adapters.element_formats import ELEMENT_DTYPES, read_elements
+
+TLE = """ISS (ZARYA)
+1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+1 A0001U 24001B   24032.25000000 -.00000123  00000-0 -56780-4 0  9991
+2 A0001  97.4012  10.5000 0012345 270.0000  90.0000 15.20000000  1005
+"""
+
+
+def _sgp4_omm(text: str) -> list[dict]:
+    # Reference OMM fields of each TLE record as parsed by sgp4.
+    lines1 = [line for line in text.splitlines() if line.startswith("1 ")]
+    lines2 = [line for line in text.splitlines() if line.startswith("2 ")]
+    xpdotp = 1440.0 / (2.0 * math.pi)
+    data = []
+    for line1, line2 in zip(lines1, lines2):
+        sat = Satrec.twoline2rv(line1, line2)
+        data.append(
+            {
+                "EPOCH": sat_epoch_datetime(sat)
+                .replace(tzinfo=None)
+                .isoformat(timespec="microseconds"),
+                "MEAN_MOTION": sat.no_kozai * xpdotp,
+                "ECCENTRICITY": sat.ecco,
+                "INCLINATION": math.degrees(sat.inclo),
+                "RA_OF_ASC_NODE": math.degrees(sat.nodeo),
+                "ARG_OF_PERICENTER": math.degrees(sat.argpo),
+                "MEAN_ANOMALY": math.degrees(sat.mo),
+                "EPHEMERIS_TYPE": int(sat.ephtype),
+                "CLASSIFICATION_TYPE": sat.classification,
+                "NORAD_CAT_ID": sat.satnum,
+                "ELEMENT_SET_NO": sat.elnum,
+                "REV_AT_EPOCH": sat.revnum,
+                "BSTAR": sat.bstar,
+                "MEAN_MOTION_DOT": sat.ndot * xpdotp * 1440.0,
+                "MEAN_MOTION_DDOT": sat.nddot * xpdotp * 1440.0 * 1440.0,
+            }
+        )
+    return data
+
+
+def _omm(elements: np.ndarray) -> list[dict]:
+    return [
+        {
+            name.upper(): str(row[name]) if name == "epoch" else row[name].item()
+            for name in ELEMENT_DTYPES
+        }
+        for row in elements
+    ]
+
+
+def _assert_matches_omm(elements: np.ndarray, data: list[dict]):
+    assert len(elements) == len(data)
+    for row, fields in zip(elements, data):
+        for name, dtype in ELEMENT_DTYPES.items():
+            if name.upper() not in fields:
+                continue
+            value = row[name]
+            expected = fields[name.upper()]
+            if name == "epoch":
+                assert str(value) == expected
+            elif dtype == "f8":
+                assert value == pytest.approx(float(expected), rel=1e-9, abs=1e-12)
+            elif dtype == "i4":
+                assert value == int(expected)
+            else:
+                assert value == expected
+
+
+def test_read_tle_matches_sgp4():
+    elements = read_elements(TLE, "tle")
+
+    _assert_matches_omm(elements, _sgp4_omm(TLE))
+    assert elements["norad_cat_id"].tolist() == [25544, 100001]
+    assert elements["object_name"].tolist() == ["ISS (ZARYA)", "100001"]
+    assert elements["object_id"].tolist() == ["1998-067A", "2024-001B"]
+
+
+def test_read_omm_json_and_csv():
+    data = _omm(read_elements(TLE, "tle"))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(data[0]))
+    writer.writeheader()
+    writer.writerows(data)
+
+    from_json = read_elements(json.dumps(data), "json")
+    from_csv = read_elements(buffer.getvalue(), "CSV")
+
+    _assert_matches_omm(from_json, data)
+    _assert_matches_omm(from_csv, data)
+
+
+def test_read_elements_unsupported_format():
+    with pytest.raises(ValueError):
+        read_elements("", "xml")
@@ -1,10 +1,276 @@
-# def test_get_satellites(client: TestClient):
-#     response = client.get("/satellites?page=0&limit=10")
-#     assert response.status_code == 200
-#     assert isinstance(response.json(), list)
+from datetime import datetime
 
+import numpy as np
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
-# def test_get_space_objects(client: TestClient):
-#     response = client.get("/space-objects?page=0&limit=10")
-#     assert response.status_code == 200
-#     assert isinstance(response.json(), list)
+from src.adapters.database_storage import (
+    bulk_save_or_skip_element_sets,
+    bulk_save_or_skip_states,
+    record_ingest_run,
+)
+from src.adapters.element_formats import read_elements
+from src.application import api
+from src.application.api import response_cache
+from src.application.clustering import cluster_catalog
+from src.application.config import settings
+from src.application.population_stats import update_population_rollups
+from src.application.position_stream import unpack_frame
+from src.tracker.schema.satellite import Satellite
+
+
+def _add_satellite(test_engine, norad_cat_id: int):
+    with Session(test_engine) as session:
+        session.add(
+            Satellite(
+                object_name="ZHIHUI TIANWANG-1 01A",
+                object_id="2024-087A",
+                bstar=0.0001,
+                inclination=98.7,
+                epoch=datetime(2024, 1, 1),
+                mean_motion=14.5,
+                eccentricity=0.001,
+                mean_anomaly=45.0,
+                ra_of_asc_node=150.0,
+                arg_of_pericenter=250.0,
+                classification_type="U",
+                ephemeris_type=0,
+                norad_cat_id=norad_cat_id,
+                rev_at_epoch=100,
+                element_set_no=999,
+                mean_motion_ddot=0,
+                mean_motion_dot=0.03,
+            )
+        )
+        record_ingest_run(session, "CELESTRAK", 1)
+        session.commit()
+
+
+def test_get_satellites(client: TestClient):
+    response = client.get("/satellites?page=0&limit=10")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+def test_get_space_objects(client: TestClient):
+    response = client.get("/space-objects?page=0&limit=10")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+def test_batch(client: TestClient, test_engine, monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_ids", 3)
+    elements = read_elements(
+        "1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990\n"
+        "2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452\n"
+        "1 25544U 98067A   24001.50000000  .00012345  00000-0  12340-3 0  9990\n"
+        "2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452\n"
+        "1 24876U 97035A   24001.25000000  .00000012  00000-0  00000-0 0  9995\n"
+        "2 24876  55.6000 100.0000 0050000  90.0000 270.0000  2.00560000  1234\n",
+        "tle",
+    )
+    positions = np.arange(9, dtype=float).reshape(3, 3)
+    with Session(test_engine) as session, session.begin():
+        bulk_save_or_skip_element_sets(elements, session)
+        bulk_save_or_skip_states(elements, positions, positions, "CELESTRAK", session)
+
+    response = client.post(
+        "/satellites/batch", json={"norad_cat_ids": [24876, 1, 25544, 24876]}
+    )
+    assert response.status_code == 200
+    assert [(s["norad_cat_id"], s["epoch"][:19]) for s in response.json()] == [
+        (24876, "2024-01-01T06:00:00"),
+        (25544, "2024-01-01T12:00:00"),
+    ]
+
+    response = client.post(
+        "/space-objects/batch",
+        json={"norad_cat_ids": [25544, 24876], "as_of": "2024-01-01T11:00:00Z"},
+    )
+    assert [
+        (o["id"], o["epoch"][:19], o["position"]["x"]) for o in response.json()
+    ] == [
+        (25544, "2024-01-01T00:00:00", 0.0),
+        (24876, "2024-01-01T06:00:00", 6.0),
+    ]
+
+    assert (
+        client.post("/satellites/batch", json={"norad_cat_ids": []}).status_code == 422
+    )
+    response = client.post("/satellites/batch", json={"norad_cat_ids": [1, 2, 3, 4]})
+    assert response.status_code == 400
+
+
+def test_cached_response_not_modified(client: TestClient, test_engine):
+    _add_satellite(test_engine, 1)
+
+    response = client.get("/satellites")
+    assert response.status_code == 200
+    assert response.json()[0]["norad_cat_id"] == 1
+    etag = response.headers["ETag"]
+
+    # Same normalized parameters share the cache entry.
+    response = client.get("/satellites?limit=100&page=0")
+    assert response.headers["ETag"] == etag
+
+    response = client.get("/satellites", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_cache_invalidated_by_ingest(client: TestClient, test_engine, monkeypatch):
+    monkeypatch.setattr(response_cache, "check_interval", 0)
+    _add_satellite(test_engine, 1)
+    etag = client.get("/satellites").headers["ETag"]
+
+    _add_satellite(test_engine, 2)
+    response = client.get("/satellites", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+def test_catalog_satellites(client: TestClient, test_engine, monkeypatch):
+    monkeypatch.setattr(response_cache, "check_interval", 0)
+    _add_satellite(test_engine, 1)
+    _add_satellite(test_engine, 2)
+
+    response = client.get("/catalog/satellites?norad_cat_id=2")
+    assert response.status_code == 200
+    assert [sat["norad_cat_id"] for sat in response.json()] == [2]
+
+    response = client.get("/catalog/satellites?min_altitude=10000")
+    assert response.json() == []
+
+    _add_satellite(test_engine, 3)
+    response = client.get("/catalog/satellites")
+    assert [sat["norad_cat_id"] for sat in response.json()] == [1, 2, 3]
+
+
+def test_clusters(client: TestClient, test_engine):
+    for norad_cat_id in range(1, 6):
+        _add_satellite(test_engine, norad_cat_id)
+    with Session(test_engine) as session:
+        cluster_catalog(session)
+        session.commit()
+
+    response = client.get("/clusters")
+    assert response.status_code == 200
+    clusters = response.json()
+    assert [(c["cluster"], c["size"]) for c in clusters] == [(0, 5)]
+    assert clusters[0]["inclination"] == 98.7
+
+    response = client.get("/clusters/0?limit=2")
+    assert [m["norad_cat_id"] for m in response.json()] == [1, 2]
+
+
+def test_stats(client: TestClient, test_engine):
+    with Session(test_engine) as session:
+        update_population_rollups(
+            session,
+            read_elements(
+                "1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990\n"
+                "2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452\n",
+                "tle",
+            ),
+            "CELESTRAK",
+        )
+        record_ingest_run(session, "CELESTRAK", 1)
+        session.commit()
+
+    response = client.get("/stats")
+    assert response.status_code == 200
+    assert response.json() == [{"day": "2024-01-01", "bucket": "LEO", "count": 1}]
+
+    response = client.get("/stats?dimension=inclination&start=2024-01-02")
+    assert response.json() == []
+    assert client.get("/stats?dimension=eccentricity").status_code == 422
+
+
+def test_watchlists(client: TestClient, test_engine):
+    watchlist = {
+        "name": "ISS",
+        "norad_cat_ids": [25544, 25544, 20580],
+        "altitude_drop_km": 10.0,
+    }
+    response = client.post("/watchlists", json=watchlist)
+    assert response.status_code == 201
+    created = response.json()
+    assert created["norad_cat_ids"] == [20580, 25544]
+    assert created["proximity_km"] is None
+
+    assert [w["id"] for w in client.get("/watchlists").json()] == [created["id"]]
+    assert client.get(f"/watchlists/{created['id']}/alerts").json() == []
+    assert client.get("/watchlists/999/alerts").status_code == 404
+
+    # At least one rule with a positive threshold.
+    del watchlist["altitude_drop_km"]
+    assert client.post("/watchlists", json=watchlist).status_code == 422
+    watchlist["staleness_hours"] = 0
+    assert client.post("/watchlists", json=watchlist).status_code == 422
+    watchlist["staleness_hours"] = 1
+    watchlist["webhook_url"] = "file:///etc/passwd"
+    assert client.post("/watchlists", json=watchlist).status_code == 422
+
+    assert client.delete(f"/watchlists/{created['id']}").status_code == 204
+    assert client.delete(f"/watchlists/{created['id']}").status_code == 404
+    assert client.get("/watchlists").json() == []
+
+
+def test_position_stream(client: TestClient, test_engine, monkeypatch):
+    monkeypatch.setattr(response_cache, "check_interval", 0)
+    _add_satellite(test_engine, 1)
+    _add_satellite(test_engine, 2)
+
+    monkeypatch.setattr(settings, "stream_max_objects", 1)
+
+    with client.websocket_connect("/ws/positions") as websocket:
+        websocket.send_json({"interval": 0})
+        assert "error" in websocket.receive_json()
+        websocket.send_text("not json")
+        assert "error" in websocket.receive_json()
+        websocket.send_bytes(b"\x00")
+        assert "error" in websocket.receive_json()
+        websocket.send_json({"min_inclination": 0})
+        assert websocket.receive_json() == {"error": "More than 1 objects."}
+
+        websocket.send_json({"norad_cat_ids": [2, 3], "interval": 0.2})
+        assert websocket.receive_json() == {"norad_cat_ids": [2], "interval": 0.5}
+
+        timestamp, records = unpack_frame(websocket.receive_bytes())
+        assert timestamp > 0
+        assert records["norad_cat_id"].tolist() == [2]
+
+
+def test_position_stream_ends_when_sending_fails(client: TestClient, monkeypatch):
+    async def fail(websocket, client):
+        raise RuntimeError("Client vanished.")
+
+    monkeypatch.setattr(api, "_send_frames", fail)
+
+    with client.websocket_connect("/ws/positions") as websocket:
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+
+def test_ground_tracks(client: TestClient, test_engine, monkeypatch):
+    monkeypatch.setattr(response_cache, "check_interval", 0)
+    _add_satellite(test_engine, 1)
+
+    response = client.get(
+        "/ground-tracks?norad_cat_id=1&start=2024-01-01T00:00:00&hours=2&step=30"
+    )
+
+    assert response.status_code == 200
+    features = response.json()["features"]
+    assert [f["properties"]["norad_cat_id"] for f in features] == [1]
+    segments = features[0]["geometry"]["coordinates"]
+    assert segments
+    # Simplified: fewer vertices than the 241 propagated points.
+    assert sum(len(segment) for segment in segments) < 241
+
+    response = client.get("/ground-tracks?norad_cat_id=1&hours=1000&step=1")
+    assert response.status_code == 400
@@ -0,0 +1,70 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.application.backfill import run_backfill
+from src.application.session import init_schema
+from src.tracker.schema.backfill_checkpoint import BackfillCheckpoint
+from src.tracker.schema.satellite import Satellite
+from src.tracker.schema.space_object import SpaceObject
+
+TLE = """ISS (ZARYA)
+1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+"""
+
+TLE_NEXT_EPOCH = """ISS (ZARYA)
+1 25544U 98067A   24001.50000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+"""
+
+# Mean motion above 16.5 rev/day is below the Earth surface, SGP4 error code 6.
+TLE_DECAYED = """DECAYED
+1 25545U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25545  51.6432 325.0288 0006703 130.5360 325.0288 25.48912345123452
+"""
+
+
+def _count(db_connection_string, model):
+    engine = create_engine(db_connection_string)
+    with Session(engine) as session:
+        count = session.scalar(select(func.count()).select_from(model))
+    engine.dispose()
+    return count
+
+
+def test_backfill_resumes_from_checkpoints(tmp_path):
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    (archive / "a.tle").write_text(TLE)
+    (archive / "b.tle").write_text(TLE + TLE_NEXT_EPOCH)
+    db_connection_string = f"sqlite:///{tmp_path / 'backfill.db'}"
+    engine = create_engine(db_connection_string)
+    init_schema(engine)
+    engine.dispose()
+
+    inserted = run_backfill(str(archive), db_connection_string, workers=2)
+
+    assert inserted == 2
+    assert _count(db_connection_string, Satellite) == 2
+    assert _count(db_connection_string, SpaceObject) == 2
+    assert _count(db_connection_string, BackfillCheckpoint) == 2
+
+    (archive / "c.tle").write_text(TLE_NEXT_EPOCH)
+    assert run_backfill(str(archive), db_connection_string, workers=1) == 0
+    assert _count(db_connection_string, BackfillCheckpoint) == 3
+    assert _count(db_connection_string, Satellite) == 2
+
+
+def test_backfill_skips_element_sets_sgp4_fails_on(tmp_path):
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    (archive / "a.tle").write_text(TLE + TLE_DECAYED)
+    db_connection_string = f"sqlite:///{tmp_path / 'backfill.db'}"
+    engine = create_engine(db_connection_string)
+    init_schema(engine)
+    engine.dispose()
+
+    assert run_backfill(str(archive), db_connection_string, workers=1) == 1
+    assert _count(db_connection_string, Satellite) == 1
+    assert _count(db_connection_string, SpaceObject) == 1
+    assert _count(db_connection_string, BackfillCheckpoint) == 1
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    load_orbit_cluster_members,
+    load_orbit_clusters,
+)
+from src.adapters.element_formats import element_array
+from src.application.clustering import (
+    assign_to_clusters,
+    cluster_catalog,
+    load_cluster_model,
+)
+from src.tracker.schema.satellite import Satellite
+
+_ELEMENTS = {
+    "object_name": "STARLINK",
+    "object_id": "2024-001A",
+    "epoch": datetime(2024, 1, 1),
+    "mean_motion": 15.06,
+    "eccentricity": 0.0001,
+    "inclination": 53.2,
+    "ra_of_asc_node": 100.0,
+    "arg_of_pericenter": 90.0,
+    "mean_anomaly": 0.0,
+    "ephemeris_type": 0,
+    "classification_type": "U",
+    "element_set_no": 999,
+    "rev_at_epoch": 100,
+    "bstar": 0.0001,
+    "mean_motion_dot": 0.0,
+    "mean_motion_ddot": 0,
+}
+
+
+def test_cluster_and_assign_incrementally(test_engine):
+    with Session(test_engine) as session:
+        session.add_all(Satellite(norad_cat_id=i, **_ELEMENTS) for i in range(1, 7))
+        session.add(Satellite(norad_cat_id=7, **{**_ELEMENTS, "inclination": 98.7}))
+        session.commit()
+
+        cluster_catalog(session)
+        session.commit()
+
+        assert [tuple(row)[:2] for row in load_orbit_clusters(session)] == [(0, 6)]
+        assert [m.norad_cat_id for m in load_orbit_cluster_members(session, -1)] == [7]
+
+        # A new object joins the cluster, object 1 moved away.
+        assign_to_clusters(
+            session,
+            _element_sets(
+                {"norad_cat_id": 8},
+                {
+                    "norad_cat_id": 1,
+                    "epoch": datetime(2024, 1, 2),
+                    "inclination": 98.7,
+                },
+            ),
+        )
+        session.commit()
+
+        members = load_orbit_cluster_members(session, 0)
+        assert [m.norad_cat_id for m in members] == [2, 3, 4, 5, 6, 8]
+        assert [m.norad_cat_id for m in load_orbit_cluster_members(session, -1)] == [
+            1,
+            7,
+        ]
+
+
+def test_assign_relabels_stored_members(test_engine):
+    with Session(test_engine) as session:
+        session.add_all(Satellite(norad_cat_id=i, **_ELEMENTS) for i in range(1, 6))
+        session.add(Satellite(norad_cat_id=6, **{**_ELEMENTS, "inclination": 98.7}))
+        session.commit()
+        cluster_catalog(session)
+        session.commit()
+
+        # A dense cell appears next to object 6, a decayed object is unclustered.
+        assign_to_clusters(
+            session,
+            _element_sets(
+                *({"norad_cat_id": i, "inclination": 99.2} for i in range(7, 12)),
+                {"norad_cat_id": 12, "mean_motion": 0.0},
+            ),
+        )
+        assign_to_clusters(
+            session, _element_sets({"norad_cat_id": 12, "mean_motion": 0.0})
+        )
+        session.commit()
+
+        members = load_orbit_cluster_members(session, 1)
+        assert [m.norad_cat_id for m in members] == [6, 7, 8, 9, 10, 11]
+        assert [m.norad_cat_id for m in load_orbit_cluster_members(session, -1)] == [12]
+        assert load_cluster_model(session).counts.sum() == 11
+
+
+def test_assign_without_clustering_is_noop(test_engine):
+    with Session(test_engine) as session:
+        assert assign_to_clusters(session, _element_sets({"norad_cat_id": 1})) == 0
+
+
+def _element_sets(*changes: dict):
+    rows = [{**_ELEMENTS, **change} for change in changes]
+    return element_array({name: [row[name] for row in rows] for name in rows[0]})
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import load_conjunctions
+from src.application.conjunctions import assess_conjunctions
+from src.main import main
+from src.tracker.schema.satellite import Satellite
+
+
+def _satellite(norad_cat_id: int, mean_anomaly: float) -> Satellite:
+    return Satellite(
+        object_name="ISS (ZARYA)",
+        object_id="1998-067A",
+        epoch=datetime(2024, 1, 1),
+        mean_motion=15.48912345,
+        eccentricity=0.0006703,
+        inclination=51.6432,
+        ra_of_asc_node=325.0288,
+        arg_of_pericenter=130.536,
+        mean_anomaly=mean_anomaly,
+        ephemeris_type=0,
+        classification_type="U",
+        norad_cat_id=norad_cat_id,
+        element_set_no=999,
+        rev_at_epoch=12345,
+        bstar=0.0001234,
+        mean_motion_dot=0.00012345,
+        mean_motion_ddot=0.0,
+    )
+
+
+def test_assess_conjunctions(test_engine):
+    with Session(test_engine) as session:
+        # Same orbit, trailing by ~0.01 degrees (~1.2 km).
+        session.add_all([_satellite(1, 325.0288), _satellite(2, 325.0188)])
+        session.commit()
+
+        conjunctions = assess_conjunctions(
+            session,
+            [(1, 2), (1, 3)],
+            datetime(2024, 1, 1),
+            hours=1,
+            monte_carlo_samples=20000,
+            rng=np.random.default_rng(1),
+        )
+
+        assert len(conjunctions) == 1
+        conjunction = conjunctions[0]
+        assert (conjunction.primary_id, conjunction.secondary_id) == (1, 2)
+        assert conjunction.miss_distance == pytest.approx(1.2, abs=0.2)
+        assert 0 < conjunction.probability < 1
+        assert conjunction.probability_monte_carlo == pytest.approx(
+            conjunction.probability, abs=0.01
+        )
+        assert [c.id for c in load_conjunctions(session, norad_cat_id=2)] == [
+            conjunction.id
+        ]
+
+
+def test_assess_conjunctions_skips_invalid_pairs(test_engine):
+    with Session(test_engine) as session:
+        invalid = _satellite(3, 325.0288)
+        invalid.eccentricity = 1.5
+        session.add_all([_satellite(1, 325.0288), _satellite(2, 325.0188), invalid])
+        session.commit()
+
+        conjunctions = assess_conjunctions(
+            session, [(1, 1), (1, 3), (3, 2), (1, 2)], datetime(2024, 1, 1), hours=1
+        )
+
+        assert [(c.primary_id, c.secondary_id) for c in conjunctions] == [(1, 2)]
+        assert np.isfinite(conjunctions[0].probability)
+
+
+@pytest.mark.parametrize("pair", ["1", "1:a", "1:1"])
+def test_cli_rejects_invalid_pairs(pair, capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(["conjunctions", "25544:48274", pair])
+
+    assert exit.value.code == 2
+    assert "argument pairs" in capsys.readouterr().err
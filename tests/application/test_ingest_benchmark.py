@@ -0,0 +1,29 @@
+import numpy as np
+
+from src.adapters.element_formats import read_elements
+from src.application.ingest_benchmark import benchmark_formats, synthetic_catalog
+
+
+def test_synthetic_catalog_formats_hold_one_catalog():
+    texts = synthetic_catalog(50)
+    parsed = {format: read_elements(text, format) for format, text in texts.items()}
+
+    for elements in parsed.values():
+        assert elements["norad_cat_id"].tolist() == list(range(1, 51))
+        np.testing.assert_array_equal(elements["epoch"], parsed["tle"]["epoch"])
+        np.testing.assert_allclose(
+            elements["mean_motion"], parsed["tle"]["mean_motion"]
+        )
+
+
+def test_benchmark_formats(capsys):
+    results = benchmark_formats(20)
+
+    assert list(results) == [
+        "json (dicts)",
+        "json (arrays)",
+        "csv (arrays)",
+        "tle (arrays)",
+    ]
+    assert all(result["peak"] > 0 for result in results.values())
+    assert "tle (arrays)" in capsys.readouterr().out
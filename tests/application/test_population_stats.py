@@ -0,0 +1,88 @@
+import threading
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import bulk_save_or_skip_element_sets
+from src.adapters.element_formats import read_elements
+from src.application.population_stats import (
+    load_population_stats,
+    update_population_rollups,
+)
+
+TLE = """ISS (ZARYA)
+1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+ISS (ZARYA)
+1 25544U 98067A   24001.50000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+GPS BIIR-2
+1 24876U 97035A   24001.25000000  .00000012  00000-0  00000-0 0  9995
+2 24876  55.6000 100.0000 0050000  90.0000 270.0000  2.00560000  1234
+"""
+
+TLE_NEXT_DAY = """ISS (ZARYA)
+1 25544U 98067A   24002.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+"""
+
+
+def _ingest(session: Session, text: str, source: str = "CELESTRAK") -> int:
+    elements = read_elements(text, "tle")
+    counted = update_population_rollups(session, elements, source)
+    bulk_save_or_skip_element_sets(elements, session)
+    session.commit()
+    return counted
+
+
+def test_rollups_count_objects_once_per_day(test_engine):
+    with Session(test_engine) as session:
+        assert _ingest(session, TLE) == 2
+        # Repeated ingest of the same day and the next day.
+        assert _ingest(session, TLE, "BACKFILL") == 0
+        assert _ingest(session, TLE + TLE_NEXT_DAY) == 1
+
+        assert [tuple(row) for row in load_population_stats(session, "regime")] == [
+            (date(2024, 1, 1), "LEO", 1),
+            (date(2024, 1, 1), "MEO", 1),
+            (date(2024, 1, 2), "LEO", 1),
+        ]
+        assert [
+            tuple(row)
+            for row in load_population_stats(
+                session, "altitude", start=date(2024, 1, 2)
+            )
+        ] == [(date(2024, 1, 2), "400-500", 1)]
+        assert load_population_stats(session, "regime", source="BACKFILL") == []
+
+
+def test_concurrent_rollups_count_objects_once(postgres_engine):
+    counted = []
+    with Session(postgres_engine) as first, Session(postgres_engine) as second:
+        elements = read_elements(TLE, "tle")
+        assert update_population_rollups(first, elements, "CELESTRAK") == 2
+        bulk_save_or_skip_element_sets(elements, first)
+
+        # The second ingest waits on the object days stored by the first one.
+        worker = threading.Thread(
+            target=lambda: counted.append(_ingest(second, TLE, "BACKFILL"))
+        )
+        worker.start()
+        worker.join(0.5)
+        assert worker.is_alive()
+        first.commit()
+        worker.join()
+
+    assert counted == [0]
+
+
+def test_concurrent_rollups_of_other_days_do_not_wait(postgres_engine):
+    with Session(postgres_engine) as first, Session(postgres_engine) as second:
+        elements = read_elements(TLE, "tle")
+        assert update_population_rollups(first, elements, "CELESTRAK") == 2
+
+        elements = read_elements(TLE_NEXT_DAY, "tle")
+        second.connection().exec_driver_sql("SET lock_timeout = '1s'")
+        assert update_population_rollups(second, elements, "BACKFILL") == 1
+        second.commit()
+        first.commit()
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+
+from src.application.position_stream import (
+    PositionStream,
+    StreamClient,
+    pack_frame,
+    stream_interval,
+    unpack_frame,
+)
+from src.tracker import propagation
+from src.tracker.catalog_snapshot import SPACE_OBJECT_DTYPES, CatalogSnapshot
+
+_COLUMNS = [
+    "object_name",
+    "object_id",
+    "epoch",
+    "mean_motion",
+    "eccentricity",
+    "inclination",
+    "ra_of_asc_node",
+    "arg_of_pericenter",
+    "mean_anomaly",
+    "ephemeris_type",
+    "classification_type",
+    "norad_cat_id",
+    "element_set_no",
+    "rev_at_epoch",
+    "bstar",
+    "mean_motion_dot",
+    "mean_motion_ddot",
+]
+
+
+def _snapshot(norad_cat_ids: list[int]) -> CatalogSnapshot:
+    rows = [
+        ("SAT", "2024-001A", datetime(2024, 1, 1), 15.5, 0.0007, 51.6, 325.0)
+        + (130.5, 10.0 * i, 0, "U", i, 999, 100, 0.0001, 0.0, 0.0)
+        for i in norad_cat_ids
+    ]
+    return CatalogSnapshot.from_rows(1, _COLUMNS, rows, list(SPACE_OBJECT_DTYPES), [])
+
+
+def test_stream_interval():
+    assert stream_interval(0.1) == 0.5
+    assert stream_interval(1.0) == 1.0
+    assert stream_interval(2.0) == 5.0
+    assert stream_interval(3600.0) == 60.0
+
+
+def test_pack_frame_roundtrip():
+    positions = np.array([[7000.0, 1.0, 2.0], [0.0, -7000.0, 3.0]])
+    velocities = np.array([[0.0, 7.5, 0.0], [7.5, 0.0, 0.1]])
+
+    timestamp, records = unpack_frame(
+        pack_frame(1700000000.5, np.array([5, 6]), positions, velocities)
+    )
+
+    assert timestamp == 1700000000.5
+    assert records["norad_cat_id"].tolist() == [5, 6]
+    np.testing.assert_allclose(records["x"], positions[:, 0])
+    np.testing.assert_allclose(records["vz"], velocities[:, 2], rtol=1e-6)
+
+
+def test_slow_client_drops_oldest_frames():
+    client = StreamClient(max_pending=2)
+    for frame in (b"1", b"2", b"3"):
+        client.offer(frame)
+
+    assert client.dropped == 1
+    assert [client.frames.get_nowait() for _ in range(2)] == [b"2", b"3"]
+
+
+def test_clients_share_one_propagation_per_tick(monkeypatch):
+    calls = []
+    propagate = propagation.propagate
+
+    def counting_propagate(satrecs, times):
+        calls.append(len(satrecs))
+        return propagate(satrecs, times)
+
+    monkeypatch.setattr(propagation, "propagate", counting_propagate)
+
+    async def run():
+        stream = PositionStream()
+        snapshot = _snapshot([1, 2, 3])
+        first, second = StreamClient(), StreamClient()
+        await stream.subscribe(first, snapshot, np.array([1, 2]), 60.0)
+        await stream.subscribe(second, snapshot, np.array([2, 3, 99]), 60.0)
+        await stream.tick(60.0, datetime(2024, 1, 1, 1).timestamp())
+        await stream.close()
+        return first.frames.get_nowait(), second.frames.get_nowait()
+
+    first_frame, second_frame = asyncio.run(run())
+
+    assert calls == [3]
+    _, first_records = unpack_frame(first_frame)
+    _, second_records = unpack_frame(second_frame)
+    assert first_records["norad_cat_id"].tolist() == [1, 2]
+    assert second_records["norad_cat_id"].tolist() == [2, 3]
+    assert first_records[1] == second_records[0]
+    radius = np.hypot(
+        np.hypot(first_records["x"], first_records["y"]), first_records["z"]
+    )
+    assert np.all((radius > 6500) & (radius < 7000))
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import load_ingest_generation
+from src.application.response_cache import (
+    CachedResponse,
+    LRUCacheBackend,
+    ResponseCache,
+)
+from src.tracker.schema.ingest_run import IngestRun
+
+
+def _response(size: int) -> CachedResponse:
+    return CachedResponse(body=b"x" * size, etag='"1"')
+
+
+def _request(if_none_match: Optional[str] = None) -> Request:
+    headers = (
+        [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    )
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/ground-tracks",
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCacheBackend(max_entries=2)
+    cache.set("a", _response(1))
+    cache.set("b", _response(1))
+    cache.get("a")
+    cache.set("c", _response(1))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_lru_bounded_by_size():
+    cache = LRUCacheBackend(max_entries=10, max_bytes=10)
+    cache.set("a", _response(6))
+    cache.set("b", _response(6))
+    cache.set("too-large", _response(11))
+
+    assert len(cache) == 1
+    assert cache.get("b") is not None
+    assert cache.get("too-large") is None
+
+
+def test_generation_changes_on_out_of_order_commit(test_engine):
+    with Session(test_engine) as session:
+        assert load_ingest_generation(session) == 0
+        session.add(IngestRun(id=6, source="BACKFILL", inserted=1))
+        session.commit()
+        generation = load_ingest_generation(session)
+
+        # A run holding a lower id commits later.
+        session.add(IngestRun(id=5, source="BACKFILL", inserted=1))
+        session.commit()
+
+        assert load_ingest_generation(session) != generation
+
+
+def test_respond_async_renders_in_worker_thread(test_engine):
+    cache = ResponseCache(LRUCacheBackend())
+    threads = []
+
+    def render() -> bytes:
+        threads.append(threading.current_thread())
+        return b"[]"
+
+    with Session(test_engine) as session:
+        first = asyncio.run(cache.respond_async(_request(), session, {}, render))
+        second = asyncio.run(cache.respond_async(_request(), session, {}, render))
+
+    assert first.body == second.body == b"[]"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+
+
+def test_respond_answers_not_modified_to_any_matching_etag(test_engine):
+    cache = ResponseCache(LRUCacheBackend())
+    with Session(test_engine) as session:
+        etag = cache.respond(_request(), session, {}, lambda: b"[]").headers["etag"]
+
+        for header in (
+            f'"0-other", {etag}',
+            f'W/"0-other",W/{etag}',
+            "*",
+        ):
+            response = cache.respond(_request(header), session, {}, lambda: b"[]")
+            assert response.status_code == 304, header
+        response = cache.respond(_request('"0-other"'), session, {}, lambda: b"[]")
+        assert response.status_code == 200
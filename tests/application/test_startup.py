@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+from src.application.startup_profile import ROOT
+
+
+def test_api_import_skips_ingest_dependencies():
+    code = (
+        "import sys\n"
+        "import src.application.api\n"
+        "print(sorted({'pandas', 'requests', 'sgp4'} & set(sys.modules)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "[]"
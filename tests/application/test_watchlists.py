@@ -0,0 +1,143 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.adapters.database_storage import (
+    bulk_save_or_skip_element_sets,
+    load_alert_events,
+    save_watchlist,
+)
+from src.adapters.element_formats import read_elements
+from src.application.watchlists import (
+    dispatch_alerts,
+    evaluate_watchlists,
+    find_watchlist_changes,
+)
+from src.tracker.models.watchlist import WatchlistCreate
+
+STORED = """ISS (ZARYA)
+1 25544U 98067A   24001.00000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.48912345123452
+GPS BIIR-2
+1 24876U 97035A   24001.25000000  .00000012  00000-0  00000-0 0  9995
+2 24876  55.6000 100.0000 0050000  90.0000 270.0000  2.00560000  1234
+"""
+
+# The ISS decays by about 30 km, an unwatched object trails it by 0.01 deg.
+RUN = """ISS (ZARYA)
+1 25544U 98067A   24001.50000000  .00012345  00000-0  12340-3 0  9990
+2 25544  51.6432 325.0288 0006703 130.5360 325.0288 15.60000000123452
+CHASER
+1 90001U 24001A   24001.50000000  .00012345  00000-0  12340-3 0  9990
+2 90001  51.6432 325.0288 0006703 130.5360 325.0188 15.60000000    12
+"""
+
+NOW = datetime(2024, 1, 1, 12)
+
+
+@pytest.fixture
+def receiver():
+    # Local stub webhook receiver recording posted JSON bodies.
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            server.bodies.append(json.loads(body))
+            self.send_response(server.status)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    server.bodies, server.status = [], 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _ingest(session: Session, text: str):
+    elements = read_elements(text, "tle")
+    changes = find_watchlist_changes(session, elements)
+    bulk_save_or_skip_element_sets(elements, session)
+    session.commit()
+    alerts = evaluate_watchlists(session, changes, NOW, 1.0, 60.0)
+    session.commit()
+    return alerts
+
+
+def _watchlist(session: Session, webhook_url=None):
+    return save_watchlist(
+        WatchlistCreate(
+            name="ISS and GPS",
+            norad_cat_ids=[25544, 24876, 25544],
+            webhook_url=webhook_url,
+            proximity_km=5.0,
+            altitude_drop_km=10.0,
+            staleness_hours=3.0,
+        ),
+        session,
+    )
+
+
+def test_evaluate_watchlists(test_engine):
+    with Session(test_engine) as session:
+        _ingest(session, STORED)
+        watchlist = _watchlist(session)
+        assert watchlist.norad_cat_ids == [24876, 25544]
+
+        changes = find_watchlist_changes(session, read_elements(RUN, "tle"))
+        assert changes.elements["norad_cat_id"].tolist() == [25544]
+        session.rollback()
+
+        alerts = {alert.rule: alert for alert in _ingest(session, RUN)}
+
+        assert set(alerts) == {"altitude_drop", "proximity", "staleness"}
+        assert alerts["altitude_drop"].norad_cat_id == 25544
+        assert 25.0 < alerts["altitude_drop"].value < 35.0
+        assert alerts["proximity"].other_norad_cat_id == 90001
+        assert alerts["proximity"].value < 5.0
+        assert alerts["proximity"].event_time is not None
+        # Only the GPS element set from 06:00 is older than 3 hours.
+        assert alerts["staleness"].norad_cat_id == 24876
+        assert alerts["staleness"].value == pytest.approx(6.0)
+
+        # Rules fire once per element set.
+        assert _ingest(session, RUN) == []
+        assert len(load_alert_events(session, watchlist.id)) == 3
+
+
+def test_dispatch_alerts(test_engine, receiver):
+    url = f"http://127.0.0.1:{receiver.server_port}/alerts"
+    with Session(test_engine) as session:
+        _ingest(session, STORED)
+        # Pending alerts of an unreachable webhook do not hold back the others.
+        _watchlist(session, "http://127.0.0.1:1/alerts")
+        watchlist = _watchlist(session, url)
+        _ingest(session, RUN)
+
+        # Rejected alerts stay pending and are posted again.
+        receiver.status = 500
+        assert dispatch_alerts(session, timeout=5.0) == 0
+        receiver.status = 200
+        assert dispatch_alerts(session, timeout=5.0, limit=2) == 2
+        assert dispatch_alerts(session, timeout=5.0, limit=2) == 1
+        assert dispatch_alerts(session, timeout=5.0) == 0
+
+        assert [len(body["alerts"]) for body in receiver.bodies] == [3, 2, 1]
+        posted = receiver.bodies[-2]["alerts"] + receiver.bodies[-1]["alerts"]
+        assert {alert["rule"] for alert in posted} == {
+            "altitude_drop",
+            "proximity",
+            "staleness",
+        }
+        assert {alert["watchlist_id"] for alert in posted} == {watchlist.id}
+        assert all(
+            alert.dispatched_at is not None
+            for alert in load_alert_events(session, watchlist.id)
+        )
@@ -1,11 +1,13 @@
+import os
 from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import StaticPool, create_engine
+from sqlalchemy.orm import Session
 
-from application.api import app
-from tracker.models import Base
+from src.application.api import app, catalog, response_cache
+from src.tracker.schema.base_model import Base
 
 
 @pytest.fixture(scope="function")
@@ -22,24 +24,39 @@ def test_engine():
 
 
 @pytest.fixture(scope="function")
-def client(test_engine) -> Generator[TestClient, None, None]:
-    from adapters.database_storage import load_satellites, load_space_objects
-
-    app.dependency_overrides = {}
+def postgres_engine():
+    # Runs against the PostgreSQL database in POSTGRES_TEST_URL, e.g. a local
+    # throwaway server, the tables are created and dropped by the test.
+    url = os.environ.get("POSTGRES_TEST_URL")
+    if not url:
+        pytest.skip("POSTGRES_TEST_URL is not set.")
+    pytest.importorskip("psycopg2")
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
 
-    original_load_satellites = load_satellites
-    original_load_space_objects = load_space_objects
 
-    def load_satellites_override(_, page, limit):
-        return original_load_satellites(test_engine, page, limit)
+@pytest.fixture(scope="function")
+def client(test_engine) -> Generator[TestClient, None, None]:
+    from src.application.session import get_db
 
-    def load_space_objects_override(_, page, limit):
-        return original_load_space_objects(test_engine, page, limit)
+    def get_db_override():
+        db = Session(test_engine)
+        try:
+            yield db
+        finally:
+            db.close()
 
-    app.dependency_overrides[load_satellites] = load_satellites_override
-    app.dependency_overrides[load_space_objects] = load_space_objects_override
+    app.dependency_overrides = {get_db: get_db_override}
+    response_cache.clear()
+    catalog.clear()
 
     with TestClient(app) as c:
         yield c
 
     app.dependency_overrides.clear()
+    response_cache.clear()
+    catalog.clear()
@@ -0,0 +1,126 @@
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.tracker.catalog_snapshot import CatalogSnapshot, records_json
+
+SATELLITE_COLUMNS = [
+    "object_name",
+    "object_id",
+    "epoch",
+    "mean_motion",
+    "eccentricity",
+    "inclination",
+    "ra_of_asc_node",
+    "arg_of_pericenter",
+    "mean_anomaly",
+    "ephemeris_type",
+    "classification_type",
+    "norad_cat_id",
+    "element_set_no",
+    "rev_at_epoch",
+    "bstar",
+    "mean_motion_dot",
+    "mean_motion_ddot",
+]
+
+SPACE_OBJECT_COLUMNS = [
+    "id",
+    "name",
+    "epoch",
+    "source",
+    "pos_x",
+    "pos_y",
+    "pos_z",
+    "vel_x",
+    "vel_y",
+    "vel_z",
+]
+
+
+def _satellite_row(norad_cat_id, name, mean_motion, inclination):
+    return (
+        name,
+        "1998-067A",
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        mean_motion,
+        0.0006703,
+        inclination,
+        325.0288,
+        130.536,
+        325.0288,
+        0,
+        "U",
+        norad_cat_id,
+        999,
+        12345,
+        0.0001234,
+        0.00012345,
+        0.0,
+    )
+
+
+@pytest.fixture
+def snapshot():
+    return CatalogSnapshot.from_rows(
+        1,
+        SATELLITE_COLUMNS,
+        [
+            _satellite_row(25544, "ISS (ZARYA)", 15.48912345, 51.6432),
+            _satellite_row(40294, "GEO SAT", 1.00271, 0.05),
+        ],
+        SPACE_OBJECT_COLUMNS,
+        [(25544, "ISS (ZARYA)", datetime(2024, 1, 1), None, 1, 2, 3, 4, 5, 6)],
+    )
+
+
+def test_snapshot_from_rows(snapshot):
+    assert snapshot.satellite_index == {25544: 0, 40294: 1}
+    assert snapshot.satellites["object_name"].tolist() == ["ISS (ZARYA)", "GEO SAT"]
+    assert snapshot.satellites["altitude"][0] == pytest.approx(420, abs=10)
+    assert snapshot.satellites["altitude"][1] == pytest.approx(35786, abs=10)
+    assert snapshot.space_objects["source"].tolist() == [""]
+    assert snapshot.space_objects["epoch"][0] == np.datetime64("2024-01-01")
+
+
+def test_satellite_mask(snapshot):
+    assert snapshot.satellite_mask().tolist() == [True, True]
+    assert snapshot.satellite_mask(max_altitude=2000).tolist() == [True, False]
+    assert snapshot.satellite_mask(min_inclination=10).tolist() == [True, False]
+    assert snapshot.satellite_mask(norad_cat_ids=[40294, 1]).tolist() == [False, True]
+
+
+def test_records_json(snapshot):
+    records = json.loads(records_json(snapshot.space_objects))
+
+    assert records == [
+        {
+            "id": 25544,
+            "name": "ISS (ZARYA)",
+            "epoch": "2024-01-01T00:00:00.000000",
+            "source": "",
+            "pos_x": 1.0,
+            "pos_y": 2.0,
+            "pos_z": 3.0,
+            "vel_x": 4.0,
+            "vel_y": 5.0,
+            "vel_z": 6.0,
+        }
+    ]
+
+
+def test_records_json_serializes_non_finite_values_as_null():
+    snapshot = CatalogSnapshot.from_rows(
+        1,
+        SATELLITE_COLUMNS,
+        [_satellite_row(25544, "DECAYED", 0.0, 51.6432)],
+        SPACE_OBJECT_COLUMNS,
+        [],
+    )
+
+    records = json.loads(records_json(snapshot.satellites))
+
+    assert records[0]["semi_major_axis"] is None
+    assert records[0]["altitude"] is None
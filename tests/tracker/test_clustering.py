@@ -0,0 +1,107 @@
+import numpy as np
+
+from src.tracker.clustering import NO_CELL, NOISE, ClusterModel, feature_matrix
+
+
+def _regime(rng, size, mean_motion, inclination, eccentricity=0.001):
+    return feature_matrix(
+        rng.normal(mean_motion, 0.001, size),
+        rng.normal(inclination, 0.05, size),
+        rng.uniform(0.0, 360.0, size),
+        np.full(size, eccentricity),
+    )
+
+
+def test_fit_separates_regimes():
+    rng = np.random.default_rng(0)
+    features = np.vstack(
+        [
+            _regime(rng, 1000, 15.06, 53.2),
+            _regime(rng, 500, 14.2, 98.7),
+            # Isolated object.
+            feature_matrix([2.0], [10.0], [100.0], [0.5]),
+        ]
+    )
+
+    _, labels = ClusterModel.fit(features, min_points=3)
+
+    assert set(labels[:1000]) == {0}
+    assert set(labels[1000:1500]) == {1}
+    assert labels[1500] == NOISE
+
+
+def test_fit_wraps_raan():
+    features = feature_matrix(
+        np.full(8, 15.0), np.full(8, 53.0), [359.0] * 4 + [1.0] * 4, np.zeros(8)
+    )
+
+    _, labels = ClusterModel.fit(features, min_points=4)
+
+    assert set(labels) == {0}
+
+
+def test_fit_empty():
+    model, labels = ClusterModel.fit(np.empty((0, 4)))
+
+    assert len(labels) == 0
+    assert len(model.keys) == 0
+
+
+def test_assign_incrementally():
+    rng = np.random.default_rng(1)
+    features = _regime(rng, 1000, 15.06, 53.2)
+    model, labels = ClusterModel.fit(features, min_points=3)
+    keys = model.cell_keys(features)
+
+    # New object in the existing regime joins its cluster.
+    new = _regime(rng, 1, 15.06, 53.2)
+    assert model.assign(new, np.array([NO_CELL]))[0].tolist() == [0]
+
+    # An object moving away leaves it, its old cell count is decremented.
+    moved = feature_matrix([2.0], [10.0], [100.0], [0.5])
+    count = model.counts[np.searchsorted(model.keys, keys[0])]
+    assert model.assign(moved, keys[:1])[0].tolist() == [NOISE]
+    assert model.counts[np.searchsorted(model.keys, keys[0])] == count - 1
+
+    # Enough new objects in an empty region start a new cluster.
+    group = np.repeat(feature_matrix([2.0], [20.0], [100.0], [0.5]), 3, axis=0)
+    labels, relabeled = model.assign(group, np.full(3, NO_CELL))
+    assert labels.tolist() == [1, 1, 1]
+    assert relabeled.tolist() == model.cell_keys(group[:1]).tolist()
+
+
+def test_objects_outside_the_grid_are_noise():
+    rng = np.random.default_rng(2)
+    features = _regime(rng, 100, 15.06, 53.2)
+    outside = feature_matrix(
+        [0.0, np.nan, 15.06, 15.06],
+        [53.2, 53.2, 53.2, np.nan],
+        [0.0] * 4,
+        [0.001, 0.001, 1.2, 0.001],
+    )
+
+    model, labels = ClusterModel.fit(np.vstack([features, outside]), min_points=3)
+
+    assert model.cell_keys(outside).tolist() == [NO_CELL] * 4
+    assert labels[-4:].tolist() == [NOISE] * 4
+    assert model.counts.sum() == 100
+
+    # Assigned again, they are neither counted nor removed.
+    labels, _ = model.assign(outside, np.full(4, NO_CELL))
+    assert labels.tolist() == [NOISE] * 4
+    assert model.counts.sum() == 100
+
+
+def test_assign_relabels_neighbors_of_new_dense_cells():
+    model, _ = ClusterModel.fit(np.empty((0, 4)), min_points=3)
+    border = feature_matrix([15.0], [53.0], [100.0], [0.001])
+    model.assign(border, np.array([NO_CELL]))
+    core = feature_matrix([15.0] * 3, [53.6] * 3, [100.0] * 3, [0.001] * 3)
+
+    labels, relabeled = model.assign(core, np.full(3, NO_CELL))
+
+    assert labels.tolist() == [0, 0, 0]
+    assert sorted(relabeled.tolist()) == sorted(
+        np.unique(model.cell_keys(np.vstack([border, core]))).tolist()
+    )
+    assert model.cell_labels(model.cell_keys(border)).tolist() == [0]
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from src.tracker.collision import (
+    closest_approach,
+    collision_probability_2d,
+    collision_probability_monte_carlo,
+    encounter_plane,
+    position_covariance,
+)
+
+
+def test_probability_2d_zero_miss_matches_closed_form():
+    sigma, radius = 0.1, 0.02
+    covariances = np.array([np.eye(2) * sigma**2])
+
+    probability = collision_probability_2d(np.zeros((1, 2)), covariances, radius)
+
+    expected = 1.0 - np.exp(-(radius**2) / (2.0 * sigma**2))
+    assert probability[0] == pytest.approx(expected, rel=1e-6)
+
+
+def test_probability_2d_matches_small_radius_approximation():
+    miss = np.array([[0.3, 0.1], [1.0, 0.0]])
+    covariances = np.array([[[0.04, 0.01], [0.01, 0.09]], [[0.25, 0.0], [0.0, 1.0]]])
+    radius = 0.005
+
+    probability = collision_probability_2d(miss, covariances, radius)
+
+    inverse = np.linalg.inv(covariances)
+    expected = (
+        radius**2
+        / (2.0 * np.sqrt(np.linalg.det(covariances)))
+        * np.exp(-0.5 * np.einsum("ni,nij,nj->n", miss, inverse, miss))
+    )
+    assert probability == pytest.approx(expected, rel=1e-3)
+
+
+def test_monte_carlo_agrees_with_2d():
+    relative_positions = np.array([[0.05, 0.0, 0.0], [0.0, 0.2, 0.0]])
+    relative_velocities = np.array([[0.0, 0.0, 10.0], [0.0, 0.0, -7.0]])
+    covariances = np.array([np.diag([0.01, 0.02, 0.5]), np.diag([0.04, 0.01, 0.5])])
+
+    miss, plane_covariances = encounter_plane(
+        relative_positions, relative_velocities, covariances
+    )
+    analytic = collision_probability_2d(miss, plane_covariances, 0.05)
+    sampled = collision_probability_monte_carlo(
+        relative_positions,
+        relative_velocities,
+        covariances,
+        0.05,
+        samples=200000,
+        rng=np.random.default_rng(1),
+    )
+
+    assert miss[:, 0] == pytest.approx([0.05, 0.2])
+    assert sampled == pytest.approx(analytic, rel=0.05)
+
+
+def test_position_covariance_grows_with_age_along_track():
+    positions = np.array([[7000.0, 0.0, 0.0], [7000.0, 0.0, 0.0]])
+    velocities = np.array([[0.0, 7.5, 0.0], [0.0, 7.5, 0.0]])
+
+    covariances = position_covariance(
+        positions, velocities, np.array([0.0, 3.0]), np.array([1e-4, 1e-4])
+    )
+
+    assert covariances[0] == pytest.approx(covariances[0].T)
+    assert covariances[0, 0, 0] == pytest.approx(0.1**2)
+    assert covariances[0, 1, 1] == pytest.approx(0.3**2)
+    assert covariances[1, 1, 1] > covariances[1, 0, 0] > covariances[0, 0, 0]
+
+
+def test_closest_approach_refines_between_steps():
+    times = np.datetime64("2024-01-01T00:00") + np.arange(5) * np.timedelta64(60, "s")
+    seconds = np.arange(5) * 60.0
+    # Linear relative motion passing closest at t = 100 s, 0.5 km apart.
+    relative_velocity = np.array([1.0, 0.0, 0.0])
+    relative_positions = (
+        (seconds - 100.0)[:, None] * relative_velocity + np.array([0.0, 0.5, 0.0])
+    )[None]
+
+    index, offset = closest_approach(
+        times,
+        relative_positions,
+        np.broadcast_to(relative_velocity, relative_positions.shape),
+    )
+
+    assert index[0] == 2
+    assert offset[0] == pytest.approx(-20.0)
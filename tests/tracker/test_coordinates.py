@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from sgp4.propagation import gstime
+
+from src.tracker.constants import EARTH_RADIUS_KM, WGS84_FLATTENING
+from src.tracker.coordinates import ecef_to_geodetic, gmst, teme_to_ecef
+
+
+def _geodetic_to_ecef(latitude, longitude, altitude):
+    e2 = WGS84_FLATTENING * (2.0 - WGS84_FLATTENING)
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    n = EARTH_RADIUS_KM / np.sqrt(1.0 - e2 * np.sin(lat) ** 2)
+    return np.stack(
+        [
+            (n + altitude) * np.cos(lat) * np.cos(lon),
+            (n + altitude) * np.cos(lat) * np.sin(lon),
+            (n * (1.0 - e2) + altitude) * np.sin(lat),
+        ],
+        axis=-1,
+    )
+
+
+def test_gmst_matches_sgp4():
+    jd = np.array([2451545.0, 2460310.0, 2460310.0])
+    fr = np.array([0.0, 0.5, 0.8125])
+
+    expected = [gstime(whole + fraction) for whole, fraction in zip(jd, fr)]
+
+    np.testing.assert_allclose(gmst(jd, fr), expected, atol=1e-9)
+
+
+def test_teme_to_ecef_rotates_per_time_step():
+    positions = np.array([[[7000.0, 0.0, 10.0], [7000.0, 0.0, 10.0]]])
+
+    ecef = teme_to_ecef(positions, np.array([0.0, np.pi / 2.0]))
+
+    np.testing.assert_allclose(ecef[0, 0], [7000.0, 0.0, 10.0])
+    np.testing.assert_allclose(ecef[0, 1], [0.0, -7000.0, 10.0], atol=1e-9)
+
+
+def test_ecef_to_geodetic_roundtrip():
+    latitude = np.array([0.0, 45.0, -60.0, 89.9, -90.0])
+    longitude = np.array([0.0, 120.0, -45.0, 10.0, 0.0])
+    altitude = np.array([400.0, 550.0, 1200.0, 20000.0, 35786.0])
+
+    lat, lon, alt = ecef_to_geodetic(_geodetic_to_ecef(latitude, longitude, altitude))
+
+    np.testing.assert_allclose(lat, latitude, atol=1e-8)
+    np.testing.assert_allclose(lon, longitude, atol=1e-8)
+    assert alt == pytest.approx(altitude, abs=1e-6)
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import numpy as np
+
+from src.tracker.ground_track import (
+    geodetic_tracks,
+    simplify_polyline,
+    track_segments,
+)
+from src.tracker.propagation import satrec_from_omm, to_datetime64
+
+_ISS = {
+    "OBJECT_NAME": "ISS (ZARYA)",
+    "OBJECT_ID": "1998-067A",
+    "EPOCH": "2024-01-01T00:00:00.000000",
+    "MEAN_MOTION": 15.5,
+    "ECCENTRICITY": 0.0007,
+    "INCLINATION": 51.6,
+    "RA_OF_ASC_NODE": 325.0,
+    "ARG_OF_PERICENTER": 130.5,
+    "MEAN_ANOMALY": 0.0,
+    "EPHEMERIS_TYPE": 0,
+    "CLASSIFICATION_TYPE": "U",
+    "NORAD_CAT_ID": 25544,
+    "ELEMENT_SET_NO": 999,
+    "REV_AT_EPOCH": 100,
+    "BSTAR": 0.0001,
+    "MEAN_MOTION_DOT": 0.0,
+    "MEAN_MOTION_DDOT": 0.0,
+}
+
+
+def test_simplify_polyline_drops_collinear_points():
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.05], [3.0, 0.0], [3.0, 3.0]])
+
+    assert simplify_polyline(points, 0.1).tolist() == [
+        True,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_track_segments_split_at_antimeridian_and_gaps():
+    longitude = np.array([170.0, 175.0, 179.0, -178.0, -170.0, np.nan, -160.0, -150.0])
+    latitude = np.zeros(8)
+
+    segments = track_segments(latitude, longitude, 0.01)
+
+    assert [segment[:, 0].tolist() for segment in segments] == [
+        [170.0, 179.0],
+        [-178.0, -170.0],
+        [-160.0, -150.0],
+    ]
+
+
+def test_geodetic_tracks():
+    times = to_datetime64([datetime(2024, 1, 1)])[0] + np.arange(0, 5400, 60).astype(
+        "timedelta64[s]"
+    )
+
+    latitude, longitude, altitude = geodetic_tracks([satrec_from_omm(_ISS)], times)
+
+    assert latitude.shape == (1, 90)
+    # Geodetic latitude peaks slightly above the inclination.
+    assert np.abs(latitude).max() <= 52.0
+    assert np.abs(latitude).max() > 50.0
+    assert np.all((altitude > 350.0) & (altitude < 450.0))
+    assert np.all(np.abs(longitude) <= 180.0)
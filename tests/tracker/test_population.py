@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.tracker.population import BUCKETS, population_buckets, rollup_counts
+
+
+def test_population_buckets():
+    # ISS, GPS, GEO, Molniya
+    buckets = population_buckets(
+        np.array([15.5, 2.005, 1.0027, 2.006]),
+        np.array([51.6, 55.0, 0.05, 63.4]),
+        np.array([0.0007, 0.01, 0.0002, 0.72]),
+    )
+
+    assert [BUCKETS["altitude"][i] for i in buckets["altitude"]] == [
+        "400-500",
+        "20000-30000",
+        "35286-36286",
+        "20000-30000",
+    ]
+    assert [BUCKETS["inclination"][i] for i in buckets["inclination"]] == [
+        "50-55",
+        "55-60",
+        "0-5",
+        "60-65",
+    ]
+    assert [BUCKETS["regime"][i] for i in buckets["regime"]] == [
+        "LEO",
+        "MEO",
+        "GEO",
+        "HEO",
+    ]
+
+
+def test_rollup_counts():
+    days = np.array(["2024-01-01", "2024-01-01", "2024-01-02"], dtype="M8[D]")
+    rows = rollup_counts(days, {"regime": np.array([0, 0, 2])})
+
+    assert [
+        (str(day), dimension, bucket, count) for day, dimension, bucket, count in rows
+    ] == [
+        ("2024-01-01", "regime", "LEO", 2),
+        ("2024-01-02", "regime", "GEO", 1),
+    ]
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.tracker.clustering import semi_major_axis
+from src.tracker.watchlist import altitude_drops, element_set_ages, nearest_approaches
+
+
+def test_altitude_drops():
+    drops = altitude_drops(np.array([15.5, 15.5]), np.array([15.6, 15.4]))
+
+    assert (
+        drops[0] == pytest.approx(semi_major_axis(15.5) - semi_major_axis(15.6))
+        and drops[0] > 0
+    )
+    assert drops[1] < 0
+
+
+def test_element_set_ages():
+    epochs = np.array(["2024-01-01T00:00", "2024-01-01T18:30"], dtype="M8[us]")
+
+    ages = element_set_ages(epochs, np.datetime64("2024-01-02T00:00", "us"))
+
+    assert ages.tolist() == [24.0, 5.5]
+
+
+def test_nearest_approaches():
+    times = np.datetime64("2024-01-01", "us") + np.arange(0, 600, 60).astype(
+        "timedelta64[s]"
+    )
+    seconds = np.arange(10) * 60.0
+    # One object at rest, others passing along x with 1 km/s at 5 and 2 km,
+    # crossing the y axis at 290 s and 300 s, the last one is not a candidate.
+    positions = np.zeros((1, 10, 3))
+    velocities = np.zeros((1, 10, 3))
+    other_positions = np.zeros((3, 10, 3))
+    other_positions[:, :, 0] = seconds - np.array([[290.0], [300.0], [300.0]])
+    other_positions[:, :, 1] = np.array([[5.0], [2.0], [0.0]])
+    other_velocities = np.zeros((3, 10, 3))
+    other_velocities[:, :, 0] = 1.0
+
+    nearest, distances, tca = nearest_approaches(
+        times,
+        positions,
+        velocities,
+        other_positions,
+        other_velocities,
+        np.array([[True, True, False]]),
+    )
+
+    assert nearest.tolist() == [1]
+    assert distances[0] == pytest.approx(2.0)
+    assert tca[0] == np.datetime64("2024-01-01T00:05:00", "us")
+
+    nearest, distances, _ = nearest_approaches(
+        times,
+        positions,
+        velocities,
+        other_positions,
+        other_velocities,
+        np.zeros((1, 3), dtype=bool),
+    )
+    assert nearest.tolist() == [-1] and np.isinf(distances[0])